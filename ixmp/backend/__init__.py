@@ -7,6 +7,7 @@ from .common import ItemType
 if TYPE_CHECKING:
     from ixmp.backend.ixmp4 import IXMP4Backend
     from ixmp.backend.jdbc import JDBCBackend
+    from ixmp.backend.memory import MemoryBackend
 
 __all__ = [
     "ItemType",
@@ -16,10 +17,14 @@ __all__ = [
 
 #: Mapping from names to available backends. To register additional backends, add
 #: entries to this dictionary.
-BACKENDS: dict[str, type["IXMP4Backend"] | type["JDBCBackend"]] = {}
+BACKENDS: dict[
+    str, type["IXMP4Backend"] | type["JDBCBackend"] | type["MemoryBackend"]
+] = {}
 
 
-def get_class(name: str) -> type["IXMP4Backend"] | type["JDBCBackend"]:
+def get_class(
+    name: str,
+) -> type["IXMP4Backend"] | type["JDBCBackend"] | type["MemoryBackend"]:
     """Return a reference to a :class:`~.base.Backend` subclass.
 
     Note that unlike :func:`.model.get_class`, this function does not create a new
@@ -37,17 +42,25 @@ def get_class(name: str) -> type["IXMP4Backend"] | type["JDBCBackend"]:
         from . import jdbc
 
         BACKENDS[name] = jdbc.JDBCBackend
+    elif name == "memory":
+        from . import memory
+
+        BACKENDS[name] = memory.MemoryBackend
+    elif name == "parquet":
+        from . import parquet
+
+        BACKENDS[name] = parquet.ParquetBackend
 
     try:
         return BACKENDS[name]
     except KeyError:
-        names = set(BACKENDS.keys()) | {"ixmp4", "jdbc"}
+        names = set(BACKENDS.keys()) | {"ixmp4", "jdbc", "memory", "parquet"}
         raise ValueError(f"backend class {name!r} not among {sorted(names)}")
 
 
 def available() -> list[str]:
     """Return a list of available backend names."""
-    for name in "ixmp4", "jdbc":
+    for name in "ixmp4", "jdbc", "memory", "parquet":
         try:
             get_class(name)
         except Exception:
@@ -1,8 +1,10 @@
 """Abstract base class for backends."""
 
+import hashlib
 import json
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
 from collections.abc import (
     Generator,
@@ -13,11 +15,13 @@ from collections.abc import (
     Sequence,
 )
 from copy import copy
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 # Compatibility with Python 3.11
 # TODO Use "from typing import Unpack" when dropping support for Python 3.11
+import numpy as np
 import pandas as pd
 from typing_extensions import Unpack
 
@@ -27,7 +31,7 @@ from ixmp.core.scenario import Scenario
 from ixmp.core.timeseries import TimeSeries
 from ixmp.util import filtered
 
-from .common import ItemType
+from .common import FIELDS, ITEM_CHUNKSIZE, ItemType
 from .io import s_read_excel, s_write_excel, ts_read_file
 
 if TYPE_CHECKING:
@@ -378,6 +382,125 @@ class Backend(ABC):
             ========== ==== ===
         """
 
+    def filter_scenarios(
+        self,
+        default: bool,
+        model: str | None,
+        scenario: str | None,
+        *,
+        match: re.Pattern[str] | None = None,
+        locked: bool | None = None,
+    ) -> Iterable[list[bool | int | str]]:
+        """OPTIONAL: Iterate over TimeSeries stored on the Platform, with filters.
+
+        Like :meth:`get_scenarios`, but the backend **may** also use `match` and
+        `locked` to select fewer TimeSeries, for instance in a database query.
+        :meth:`.Platform.scenario_list` applies both filters to the results in any
+        case, so a backend may return a superset of the matching TimeSeries.
+
+        The default implementation calls :meth:`get_scenarios` and ignores `match`
+        and `locked`.
+
+        Parameters
+        ----------
+        default : bool
+           :obj:`True` to include only TimeSeries versions marked as default.
+        model : str or None
+           Model name to filter results.
+        scenario : str or None
+           Scenario name to filter results.
+        match : re.Pattern, optional
+           Only TimeSeries where the model or scenario name contains a match.
+        locked : bool, optional
+           Only TimeSeries that are (:obj:`True`) or are not (:obj:`False`) locked.
+
+        Yields
+        ------
+        list
+            As for :meth:`get_scenarios`.
+        """
+        return self.get_scenarios(default, model, scenario)
+
+    def get_data_bulk(
+        self,
+        models: Sequence[str],
+        scenarios: Sequence[str],
+        region: Sequence[str],
+        variable: Sequence[str],
+        unit: Sequence[str],
+        year: Sequence[int],
+        default: bool,
+    ) -> Iterable[tuple[str, str, int, str, str, str, str, int, float]]:
+        """OPTIONAL: Iterate over time series data of many TimeSeries.
+
+        For all of the sequence arguments, an empty sequence selects all values.
+
+        The default implementation calls :meth:`write_file` with a temporary file
+        :file:`*.csv` and :attr:`.ItemType.TS`, reads the file, and filters on `year`.
+        Backends **should** override this with a more efficient method.
+
+        Parameters
+        ----------
+        models : sequence of str
+            Model names.
+        scenarios : sequence of str
+            Scenario names.
+        region : sequence of str
+            Region names.
+        variable : sequence of str
+            Variable names.
+        unit : sequence of str
+            Unit names.
+        year : sequence of int
+            Years.
+        default : bool
+           :obj:`True` to include only TimeSeries versions marked as default.
+
+        Yields
+        ------
+        tuple
+            The members of each tuple are:
+
+            ========= ===== ===
+            ID        Type  Description
+            ========= ===== ===
+            model     str   Model name
+            scenario  str   Scenario name
+            version   int   Version
+            region    str   Region name
+            variable  str   Variable name
+            unit      str   Unit name
+            subannual str   Name of time slice
+            year      int   Year
+            value     float Data value
+            ========= ===== ===
+        """
+        from tempfile import TemporaryDirectory
+
+        filters: "WriteFilters" = dict(
+            model=list(models),
+            scenario=list(scenarios),
+            variable=list(variable),
+            unit=list(unit),
+            region=list(region),
+            default=default,
+            export_all_runs=False,
+        )
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp, "timeseries.csv")
+            self.write_file(path, ItemType.TS, filters=filters)
+            # Keep labels like "NA" (North America) that pandas would read as missing
+            data = pd.read_csv(path, keep_default_na=False, na_values=[""]).rename(
+                columns=str.lower
+            )
+
+        if len(year):
+            data = data[data["year"].isin(list(map(int, year)))]
+
+        yield from data[list(FIELDS["get_data_bulk"])].itertuples(
+            index=False, name=None
+        )
+
     @abstractmethod
     def set_unit(self, name: str, comment: str) -> None:
         """Add a unit of measurement to the Platform.
@@ -463,7 +586,9 @@ class Backend(ABC):
         ):
             firstyear = kwargs.get("firstyear", None)
             lastyear = kwargs.get("lastyear", None)
-            ts_read_file(s, path, firstyear, lastyear)
+            chunksize = kwargs.get("chunksize", None)
+            progress = kwargs.get("progress", None)
+            ts_read_file(s, path, firstyear, lastyear, chunksize, progress)
         elif (
             path.suffix == ".xlsx"
             and item_type is ItemType.MODEL
@@ -730,6 +855,25 @@ class Backend(ABC):
             ========= ==== ===
         """
 
+    def get_geo_frame(self, ts: TimeSeries) -> pd.DataFrame:
+        """OPTIONAL: Retrieve all time-series 'geodata' as a data frame.
+
+        The default implementation calls :meth:`get_geo`. Backends **should** override
+        this with an implementation that constructs each column of the data frame at
+        once.
+
+        Returns
+        -------
+        pandas.DataFrame
+            with the columns given by :data:`.FIELDS` ``["ts_get_geo"]``, and one row
+            for each tuple yielded by :meth:`get_geo`.
+
+        See also
+        --------
+        get_geo
+        """
+        return pd.DataFrame(self.get_geo(ts), columns=list(FIELDS["ts_get_geo"]))
+
     @abstractmethod
     def set_data(
         self,
@@ -759,6 +903,36 @@ class Backend(ABC):
             :obj:`True` to mark `data` as metadata.
         """
 
+    def set_data_frame(self, ts: TimeSeries, data: pd.DataFrame, meta: bool) -> None:
+        """OPTIONAL: Store time series data for many keys at once.
+
+        The default implementation groups `data` by (region, variable, unit, subannual)
+        and calls :meth:`set_data` once for each group. Backends **should** override
+        this with an implementation that stores all the data in fewer operations.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data to store, in long format, with the columns 'region', 'variable',
+            'unit', 'subannual', 'year', and 'value'. Other columns are ignored.
+        meta : bool
+            :obj:`True` to mark `data` as metadata.
+
+        Raises
+        ------
+        ValueError
+            If any region in `data` is not defined on the Platform.
+
+        See also
+        --------
+        set_data
+        """
+        id_cols = ["region", "variable", "unit", "subannual"]
+        for (r, v, u, t), group in data.groupby(id_cols, sort=False):
+            r, v, u, t = map(str, (r, v, u, t))
+            values = dict(zip(map(int, group["year"]), map(float, group["value"])))
+            self.set_data(ts, r, v, values, u, t, meta)
+
     @abstractmethod
     def set_geo(
         self,
@@ -791,6 +965,30 @@ class Backend(ABC):
             :obj:`True` to mark `data` as metadata.
         """
 
+    def set_geo_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        """OPTIONAL: Store time-series 'geodata' for many keys at once.
+
+        The default implementation calls :meth:`set_geo` once for each row of `data`.
+        Backends **should** override this with an implementation that stores all the
+        data in fewer operations.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data to store, with the columns 'region', 'variable', 'subannual', 'year',
+            'value', 'unit', and 'meta'. Other columns are ignored.
+
+        See also
+        --------
+        set_geo
+        """
+        for r, v, t, y, value, u, m in data[list(FIELDS["ts_get_geo"])].itertuples(
+            index=False, name=None
+        ):
+            self.set_geo(
+                ts, str(r), str(v), str(t), int(y), str(value), str(u), bool(m)
+            )
+
     @abstractmethod
     def delete(
         self,
@@ -817,6 +1015,28 @@ class Backend(ABC):
             Name of time slice.
         """
 
+    def delete_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        """OPTIONAL: Remove time series data for many keys at once.
+
+        The default implementation groups `data` by (region, variable, unit, subannual)
+        and calls :meth:`delete` once for each group. Backends **should** override this
+        with an implementation that removes all the data in fewer operations.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data to remove, in long format, with at least the columns 'region',
+            'variable', 'unit', 'subannual', and 'year'. Other columns are ignored.
+
+        See also
+        --------
+        delete
+        """
+        id_cols = ["region", "variable", "unit", "subannual"]
+        for (r, v, u, t), group in data.groupby(id_cols):
+            r, v, u, t = map(str, (r, v, u, t))
+            self.delete(ts, r, v, t, group["year"].tolist(), u)
+
     @abstractmethod
     def delete_geo(
         self,
@@ -843,6 +1063,28 @@ class Backend(ABC):
             Unit symbol.
         """
 
+    def delete_geo_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        """OPTIONAL: Remove 'geodata' values for many keys at once.
+
+        The default implementation groups `data` by (region, variable, unit, subannual)
+        and calls :meth:`delete_geo` once for each group. Backends **should** override
+        this with an implementation that removes all the data in fewer operations.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            Data to remove, with at least the columns 'region', 'variable', 'unit',
+            'subannual', and 'year'. Other columns are ignored.
+
+        See also
+        --------
+        delete_geo
+        """
+        id_cols = ["region", "variable", "unit", "subannual"]
+        for (r, v, u, t), group in data.groupby(id_cols):
+            r, v, u, t = map(str, (r, v, u, t))
+            self.delete_geo(ts, r, v, t, group["year"].tolist(), u)
+
     # Methods for ixmp.Scenario
 
     @abstractmethod
@@ -1023,6 +1265,150 @@ class Backend(ABC):
             If `name` does not exist in `s`.
         """
 
+    def item_get_elements_batch(
+        self, s: Scenario, items: Mapping[str, str], filters: "Filters" = None
+    ) -> dict[str, "SetData | ParData | SolutionData"]:
+        """OPTIONAL: Return elements of several items.
+
+        The default implementation calls :meth:`item_get_elements` once for each of
+        `items`. Backends **should** override this with an implementation that
+        retrieves the data for all `items` in fewer operations.
+
+        Parameters
+        ----------
+        items : dict
+            Mapping from item names to their `ix_type`; see :meth:`item_get_elements`.
+        filters : dict, optional
+            If provided, a mapping from dimension names to allowed values along that
+            dimension. For each item, only the filters for its own dimensions (per
+            :meth:`item_index`) are applied; items with none of these dimensions are
+            returned unfiltered.
+
+        Returns
+        -------
+        dict
+            Mapping from each name in `items` to data, as returned by
+            :meth:`item_get_elements`.
+
+        Raises
+        ------
+        KeyError
+            If any of `items` does not exist in `s`.
+        """
+        result: dict[str, "SetData | ParData | SolutionData"] = dict()
+        for name, ix_type in items.items():
+            _filters = None
+            if filters:
+                idx_names = self.item_index(s, name, "names")
+                _filters = {k: v for k, v in filters.items() if k in idx_names}
+            result[name] = self.item_get_elements(s, ix_type, name, _filters or None)  # type: ignore[call-overload]
+        return result
+
+    def item_get_elements_chunks(
+        self,
+        s: Scenario,
+        ix_type: str,
+        name: str,
+        filters: "Filters" = None,
+        chunksize: int = ITEM_CHUNKSIZE,
+    ) -> Generator["SetData | ParData | SolutionData", Any, None]:
+        """OPTIONAL: Iterate over elements of item `name` in chunks.
+
+        The default implementation calls :meth:`item_get_elements` and slices the
+        result. Backends **should** override this with an implementation that does
+        not hold all the elements of `name` in memory at once.
+
+        Parameters
+        ----------
+        ix_type : str
+            Type of the item.
+        name : str
+            Name of the item.
+        filters : dict, optional
+            See :meth:`item_get_elements`.
+        chunksize : int, optional
+            Maximum number of elements in each chunk. Default :data:`.ITEM_CHUNKSIZE`.
+
+        Yields
+        ------
+        pandas.Series or pandas.DataFrame
+            Consecutive ranges of at most `chunksize` elements, with the same columns
+            and dtypes as returned by :meth:`item_get_elements`. Nothing is yielded if
+            `name` has no elements.
+        dict
+            For a scalar `name`, a single :class:`dict` as returned by
+            :meth:`item_get_elements`.
+
+        Raises
+        ------
+        KeyError
+            If `name` does not exist in `s`.
+        """
+        data = self.item_get_elements(s, ix_type, name, filters)  # type: ignore[call-overload]
+        if not isinstance(data, (pd.DataFrame, pd.Series)):
+            yield data
+            return
+
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start : start + chunksize].reset_index(drop=True)
+
+    def item_hashes(self, s: Scenario, items: Mapping[str, str]) -> dict[str, str]:
+        """OPTIONAL: Return hashes of the contents of several items.
+
+        The default implementation retrieves the data with
+        :meth:`item_get_elements_batch` and computes the hashes. Backends **may**
+        override this with an implementation that computes the hashes without
+        transferring the data.
+
+        Parameters
+        ----------
+        items : dict
+            Mapping from item names to their `ix_type`; see :meth:`item_get_elements`.
+
+        Returns
+        -------
+        dict
+            Mapping from each name in `items` to a :class:`str` hash. The hash is the
+            same for items with the same column names and elements, regardless of the
+            order of elements, and differs otherwise. Hashes returned by different
+            backends are not necessarily comparable.
+
+        Raises
+        ------
+        KeyError
+            If any of `items` does not exist in `s`.
+        """
+        return {
+            name: _item_hash(data)
+            for name, data in self.item_get_elements_batch(s, items).items()
+        }
+
+    def item_key_hashes(
+        self, s: Scenario, name: str, columns: Sequence[str]
+    ) -> pd.Series:
+        """OPTIONAL: Return values of parameter `name`, indexed by hashes of their keys.
+
+        The default implementation retrieves the data with :meth:`item_get_elements`
+        and computes the hashes. This is used by :func:`.update_par`.
+
+        Parameters
+        ----------
+        name : str
+            Name of a parameter.
+        columns : sequence of str
+            Columns of the parameter data to hash, for instance its index names and
+            ``unit``.
+
+        Returns
+        -------
+        pandas.Series
+            The ``value`` of each element, indexed by a hash of `columns` from
+            :func:`_key_hashes`.
+        """
+        data = self.item_get_elements(s, "par", name)
+        assert isinstance(data, pd.DataFrame)
+        return pd.Series(data["value"].to_numpy(), index=_key_hashes(data, columns))
+
     @abstractmethod
     def item_set_elements(
         self,
@@ -1086,6 +1472,63 @@ class Backend(ABC):
         item_delete_elements
         """
 
+    def item_set_elements_frame(
+        self,
+        s: Scenario,
+        type: type[Parameter | Set],
+        name: str,
+        data: pd.DataFrame,
+    ) -> None:
+        """OPTIONAL: Add keys or values to item `name` from a data frame.
+
+        The default implementation converts the columns of `data` to tuples and calls
+        :meth:`item_set_elements`. Backends **should** override this with an
+        implementation that handles the columns without creating Python objects for
+        each element.
+
+        Parameters
+        ----------
+        type :
+            Type of the item: :class:`.Parameter` or :class:`.Set`.
+        name : str
+            Name of the item.
+        data : pandas.DataFrame
+            One row for each element, with columns:
+
+            - One column for each index dimension of `name`, in the order of
+              :meth:`item_index`, containing :class:`str`. For a basic set, this is a
+              single column; for a scalar parameter, there are none.
+            - For :class:`.Parameter`, 'value' (:class:`float`) and 'unit'
+              (:class:`str`).
+            - Optionally, 'comment' (:class:`str`).
+
+        Raises
+        ------
+        ValueError
+            If `data` contain invalid values, e.g. key values not in the respective
+            index set(s).
+
+        See also
+        --------
+        item_set_elements
+        """
+        dims = [c for c in data.columns if c not in ("value", "unit", "comment")]
+
+        # Keys as in item_set_elements(): str, list of str, or None
+        keys: Iterable[Any]
+        if len(dims) == 0:
+            keys = repeat(None, len(data))
+        elif len(dims) == 1:
+            keys = data[dims[0]].tolist()
+        else:
+            keys = data[dims].to_numpy().tolist()
+
+        columns = [keys] + [
+            data[c].tolist() if c in data.columns else repeat(None, len(data))
+            for c in ("value", "unit", "comment")
+        ]
+        self.item_set_elements(s, type, name, zip(*columns))
+
     @abstractmethod
     def item_delete_elements(
         self,
@@ -1219,6 +1662,57 @@ class Backend(ABC):
         get_meta
         """
 
+    def get_meta_bulk(
+        self,
+        models: Sequence[str],
+        scenarios: Sequence[str],
+        names: Sequence[str],
+        default: bool,
+    ) -> Iterable[tuple[str, str, int, str, Any]]:
+        """OPTIONAL: Iterate over metadata attached to many TimeSeries.
+
+        Only metadata attached to each (model, scenario, version) is returned, as by
+        :meth:`get_meta` with `strict` = :obj:`True`.
+
+        The default implementation calls :meth:`get_scenarios`, then :meth:`get_meta`
+        for every matching TimeSeries. Backends **should** override this with a more
+        efficient method.
+
+        Parameters
+        ----------
+        models : sequence of str
+            Model names. If empty, return metadata for all models.
+        scenarios : sequence of str
+            Scenario names. If empty, return metadata for all scenarios.
+        names : sequence of str
+            Metadata names/identifiers. If empty, return all metadata.
+        default : bool
+           :obj:`True` to include only TimeSeries versions marked as default.
+
+        Yields
+        ------
+        tuple
+            The members of each tuple are:
+
+            ======== ==== ===
+            ID       Type Description
+            ======== ==== ===
+            model    str  Model name
+            scenario str  Scenario name
+            version  int  Version
+            name     str  Metadata name/identifier
+            value    Any  Metadata value
+            ======== ==== ===
+        """
+        i = FIELDS["get_scenarios"].index
+        for info in self.get_scenarios(default, None, None):
+            m, s, v = info[i("model")], info[i("scenario")], info[i("version")]
+            if (models and m not in models) or (scenarios and s not in scenarios):
+                continue
+            for name, value in self.get_meta(str(m), str(s), int(v), True).items():
+                if not names or name in names:
+                    yield (str(m), str(s), int(v), name, value)
+
     @abstractmethod
     def clear_solution(self, s: Scenario, from_year: int | None = None) -> None:
         """Remove data associated with a model solution.
@@ -1287,6 +1781,35 @@ class Backend(ABC):
               only one element.
         """
 
+    def cat_set_elements_frame(
+        self, ms: Scenario, name: str, data: pd.DataFrame, is_unique: bool = False
+    ) -> None:
+        """OPTIONAL: Add elements to many categories of a category mapping at once.
+
+        The default implementation calls :meth:`cat_set_elements` once for each
+        distinct category in `data`, in order of first appearance. Backends **should**
+        override this with an implementation that writes all the mappings in fewer
+        operations.
+
+        Parameters
+        ----------
+        name : str
+            Name of the category mapping set.
+        data : pandas.DataFrame
+            Data frame with columns 'key' and 'category'. Each row maps one key to one
+            category within `name`.
+        is_unique : bool, optional
+            Passed to :meth:`cat_set_elements`.
+
+        See also
+        --------
+        cat_set_elements
+        """
+        for cat, group in data.groupby("category", sort=False):
+            self.cat_set_elements(
+                ms, name, str(cat), group["key"].astype(str).tolist(), is_unique
+            )
+
 
 class CachingBackend(Backend):
     """Backend with additional features for caching data."""
@@ -1304,6 +1827,14 @@ class CachingBackend(Backend):
     #: using :meth:`cache_get`.
     _cache_hit: dict[tuple[Hashable, ...], int] = {}
 
+    #: Cache of hashes from :meth:`item_hashes`. Keys are given by :meth:`_cache_key`,
+    #: without filters.
+    _cache_hash: dict[tuple[Hashable, ...], str] = {}
+
+    #: Cache of results from :meth:`item_key_hashes`. Keys are given by
+    #: :meth:`_cache_key`, without filters, plus the hashed columns.
+    _cache_key_hashes: dict[tuple[Hashable, ...], pd.Series] = {}
+
     # Backend API methods
 
     def __init__(self, cache_enabled: bool = True) -> None:
@@ -1314,11 +1845,54 @@ class CachingBackend(Backend):
         # Empty the cache
         self._cache = {}
         self._cache_hit = {}
+        self._cache_hash = {}
+        self._cache_key_hashes = {}
 
     def del_ts(self, ts: TimeSeries) -> None:
         """Invalidate cache entries associated with `ts`."""
         self.cache_invalidate(ts)
 
+    def item_hashes(self, s: Scenario, items: Mapping[str, str]) -> dict[str, str]:
+        """Return hashes of the contents of several items.
+
+        Hashes are cached; they are invalidated together with other cached values for
+        each item.
+        """
+        result = dict()
+        missing = dict()
+        for name, ix_type in items.items():
+            try:
+                result[name] = self._cache_hash[self._cache_key(s, ix_type, name)]
+            except KeyError:
+                missing[name] = ix_type
+
+        if missing:
+            for name, value in super().item_hashes(s, missing).items():
+                if self.cache_enabled:
+                    self._cache_hash[self._cache_key(s, missing[name], name)] = value
+                result[name] = value
+
+        return {name: result[name] for name in items}
+
+    def item_key_hashes(
+        self, s: Scenario, name: str, columns: Sequence[str]
+    ) -> pd.Series:
+        """Return values of parameter `name`, indexed by hashes of their keys.
+
+        Results are cached; they are invalidated together with other cached values for
+        the parameter.
+        """
+        key = self._cache_key(s, "par", name) + (tuple(columns),)
+        try:
+            return self._cache_key_hashes[key]
+        except KeyError:
+            pass
+
+        result = super().item_key_hashes(s, name, columns)
+        if self.cache_enabled:
+            self._cache_key_hashes[key] = result
+        return result
+
     # New methods for CachingBackend
 
     @classmethod
@@ -1441,14 +2015,42 @@ class CachingBackend(Backend):
           whether filtered or unfiltered.
         """
         key = self._cache_key(ts, ix_type, name, filters)
+        i = slice(1) if (ix_type is name is None) else slice(3)
 
         if filters is None:
-            i = slice(1) if (ix_type is name is None) else slice(3)
             to_remove: Iterable[tuple[Hashable, ...]] = filter(
                 lambda k: k[i] == key[i], self._cache.keys()
             )
         else:
             to_remove = [key]
 
-        for key in list(to_remove):
-            self._cache.pop(key, None)
+        for k in list(to_remove):
+            self._cache.pop(k, None)
+
+        # Hashes are stored for entire items only
+        for k in [k for k in self._cache_hash if k[i] == key[i]]:
+            self._cache_hash.pop(k)
+        for k in [k for k in self._cache_key_hashes if k[i] == key[i]]:
+            self._cache_key_hashes.pop(k)
+
+
+def _key_hashes(data: pd.DataFrame, columns: Sequence[str]) -> pd.Index:
+    """Return hashes of the values in `columns` of each row of `data`."""
+    return pd.Index(
+        pd.util.hash_pandas_object(data[list(columns)].astype(str), index=False)
+    )
+
+
+def _item_hash(data: "SetData | ParData | SolutionData") -> str:
+    """Return a hash of item `data` that does not depend on the order of elements."""
+    h = hashlib.sha256()
+    if isinstance(data, dict):
+        # Scalar
+        h.update(json.dumps(data, sort_keys=True).encode())
+    else:
+        if isinstance(data, pd.DataFrame):
+            h.update(json.dumps(list(map(str, data.columns))).encode())
+        # Hash each element, then sort the hashes
+        element_hash = pd.util.hash_pandas_object(data, index=False).to_numpy()
+        h.update(np.sort(element_hash).tobytes())
+    return h.hexdigest()
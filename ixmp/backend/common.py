@@ -13,6 +13,18 @@ if TYPE_CHECKING:
 #:
 #: .. todo:: Make this consistent with other dimension orders and with :data:`IAMC_IDX`.
 FIELDS = {
+    "get_data_bulk": (
+        "model",
+        "scenario",
+        "version",
+        "region",
+        "variable",
+        "unit",
+        "subannual",
+        "year",
+        "value",
+    ),
+    "get_meta_bulk": ("model", "scenario", "version", "name", "value"),
     "get_nodes": ("region", "mapped_to", "parent", "hierarchy"),
     "get_timeslices": ("name", "category", "duration"),
     "get_scenarios": (
@@ -51,6 +63,10 @@ FIELDS = {
 #: others.
 IAMC_IDX: list[str | int] = ["model", "scenario", "region", "variable", "unit"]
 
+#: Default maximum number of elements in each chunk yielded by
+#: :meth:`.Scenario.iter_chunks` and :meth:`.Backend.item_get_elements_chunks`.
+ITEM_CHUNKSIZE = 100_000
+
 
 class CrossPlatformClone(NotImplementedError):
     """Raised for not implemented clone operations between multiple platforms."""
@@ -1,11 +1,13 @@
 import logging
 from collections import deque
+from collections.abc import Callable, Iterator
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import pandas as pd
 
-from ixmp.util import as_str_list, maybe_check_out, maybe_commit
+from ixmp.util import as_str_list, maybe_check_out, maybe_commit, to_iamc_layout
 
 from .common import ItemType
 
@@ -21,28 +23,69 @@ log = logging.getLogger(__name__)
 #: :meth:`.to_excel` and :ref:`excel-data-format`.
 EXCEL_MAX_ROWS = 1048576
 
+#: Default number of rows read at once by :func:`ts_read_file`.
+TS_CHUNKSIZE = 100_000
+
 
 def ts_read_file(
     ts: "TimeSeries",
     path: Path,
     firstyear: int | None = None,
     lastyear: int | None = None,
+    chunksize: int | None = None,
+    progress: Callable[[int], None] | None = None,
 ) -> None:
     """Read data from a CSV or Microsoft Excel file at *path* into *ts*.
 
+    The file is read in chunks of up to `chunksize` rows, so that memory use does not
+    depend on the size of the file. The regions and units in each chunk are checked
+    against those defined on the Platform, which are retrieved once. Each chunk is then
+    stored using :meth:`.Backend.set_data_frame`, and progress is logged on level
+    :ref:`DEBUG <python:levels>`. If any chunk cannot be read or stored, changes to *ts*
+    are discarded.
+
+    Parameters
+    ----------
+    chunksize : int, optional
+        Number of rows to read at once. Default :data:`TS_CHUNKSIZE`.
+    progress : callable, optional
+        Called after each chunk is stored, with the total number of rows read so far.
+
+    Raises
+    ------
+    ValueError
+        If the file contains regions or units that are not defined on the Platform.
+
     See also
     --------
     .TimeSeries.add_timeseries
     .TimeSeries.read_file
     """
-
-    if path.suffix == ".csv":
-        df = pd.read_csv(path)
-    elif path.suffix == ".xlsx":
-        df = pd.read_excel(path)
+    mp = ts.platform
+    known = dict(region=set(mp.regions()["region"]), unit=set(mp.units()))
 
     ts.check_out(timeseries_only=True)
-    ts.add_timeseries(df, year_lim=(firstyear, lastyear))
+
+    rows = 0
+    try:
+        for df in _read_chunks(path, chunksize or TS_CHUNKSIZE):
+            df = to_iamc_layout(df)
+            for dim, values in known.items():
+                missing = sorted(set(df[dim].astype(str)) - values)
+                if len(missing):
+                    raise ValueError(
+                        f"{dim}(s) {missing} in {path} are not defined on the Platform"
+                    )
+
+            ts.add_timeseries(df, year_lim=(firstyear, lastyear))
+
+            rows += len(df)
+            log.debug(f"Read {rows} rows from {path}")
+            if progress:
+                progress(rows)
+    except Exception:
+        ts.discard_changes()
+        raise
 
     msg = f"adding timeseries data from {path}"
     if firstyear:
@@ -52,6 +95,30 @@ def ts_read_file(
     ts.commit(msg)
 
 
+def _read_chunks(path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Iterate over data frames of up to `chunksize` rows from *path*.
+
+    For '.xlsx' files, rows are read from the first sheet with :mod:`openpyxl` in
+    read-only mode; empty rows are skipped, as by :func:`pandas.read_excel`.
+    """
+    if path.suffix == ".csv":
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            yield from reader
+    elif path.suffix == ".xlsx":
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = wb.worksheets[0].iter_rows(values_only=True)
+            columns = next(rows, ())
+            while batch := list(islice(rows, chunksize)):
+                data = [row for row in batch if any(v is not None for v in row)]
+                if len(data):
+                    yield pd.DataFrame(data, columns=columns)
+        finally:
+            wb.close()
+
+
 def s_write_excel(
     be: "Backend",
     s: "Scenario",
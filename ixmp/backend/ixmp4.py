@@ -1,7 +1,8 @@
 import builtins
 import logging
-from collections.abc import Generator, Iterable, MutableMapping, Sequence
-from copy import copy
+import re
+import reprlib
+from collections.abc import Generator, Iterable, Mapping, MutableMapping, Sequence
 from dataclasses import asdict, dataclass
 from itertools import chain
 from os import PathLike
@@ -35,6 +36,7 @@ from ixmp4.core.optimization.parameter import Parameter
 from ixmp4.core.optimization.scalar import Scalar, ScalarRepository
 from ixmp4.core.optimization.table import Table
 from ixmp4.core.optimization.variable import Variable
+from ixmp4.data.abstract.annotations import HasModelFilter, HasScenarioFilter
 from ixmp4.data.abstract.iamc.datapoint import EnumerateKwargs as IamcEnumerateKwargs
 from ixmp4.data.abstract.meta import RunMetaEntry
 from ixmp4.data.abstract.optimization.indexset import (
@@ -60,7 +62,7 @@ from ixmp.core.timeseries import TimeSeries
 from ixmp.util import as_str_list
 
 from .base import CachingBackend
-from .common import ItemType
+from .common import FIELDS, ItemType
 from .ixmp4_io import read_gdx_to_run, write_run_to_gdx
 
 if TYPE_CHECKING:
@@ -70,6 +72,7 @@ if TYPE_CHECKING:
     from ixmp4.core.optimization.variable import (
         VariableRepository as OptimizationVariableRepository,
     )
+    from ixmp4.data.abstract.annotations import HasModelFilter, HasScenarioFilter
     from ixmp4.data.abstract.optimization.equation import (
         EquationRepository as BEEquationRepository,
     )
@@ -138,6 +141,24 @@ def _align_dtypes_for_filters(
                 ]
 
 
+#: Regular expressions that match literal strings, optionally anchored.
+_LITERAL = re.compile(r"(\^?)([^.^$*+?{}\[\]\\|()]+)(\$?)")
+
+
+def _like(expr: re.Pattern[str] | None) -> str | None:
+    """Return an ixmp4 ``name__like`` pattern equivalent to `expr`, if any.
+
+    Only case-sensitive expressions for a literal string, optionally with ``^`` or
+    ``$`` anchors, are converted; otherwise :obj:`None` is returned.
+    """
+    if expr is None or expr.flags & re.IGNORECASE:
+        return None
+    elif match := _LITERAL.fullmatch(expr.pattern):
+        head, text, tail = match.groups()
+        return ("" if head else "*") + text + ("" if tail else "*")
+    return None
+
+
 def _remove_empty_lists(
     filters: MutableMapping[str, list[Any]],
 ) -> dict[str, list[Any]]:
@@ -153,6 +174,33 @@ def _remove_empty_lists(
     return result
 
 
+def _to_ixmp_source_ts_layout(data: pd.DataFrame) -> pd.DataFrame:
+    """Convert time series `data` from ixmp4 to the layout of :data:`.FIELDS`.
+
+    `data` is the result of :meth:`ixmp4.data.abstract.iamc.datapoint.tabulate` with
+    :py:`join_parameters=True, join_runs=True`. The result has the columns of
+    :py:`FIELDS["write_file"]` as expected by ixmp_source/:class:`.JDBCBackend`.
+    """
+    # NOTE We don't handle step_datetime here
+    # Handle 'subannual' values
+    subannual = (
+        data["type"]
+        if "step_category" not in data.columns
+        else data["step_category"].combine_first(data["type"])
+    ).replace({"ANNUAL": "Year"})
+
+    # Select, rename, and sort columns in a single step
+    columns = {"step_year": "YEAR", "is_input": "META"}
+    return (
+        data.drop(
+            columns=["id", "time_series__id", "type", "step_category"], errors="ignore"
+        )
+        .assign(subannual=subannual)
+        .rename(columns=lambda c: columns.get(c, c.upper()))
+        .reindex(columns=list(FIELDS["write_file"]))
+    )
+
+
 @dataclass
 class Options:
     """Valid configuration options for :class:`IXMP4Backend`.
@@ -376,13 +424,39 @@ class IXMP4Backend(CachingBackend):
     def get_scenarios(
         self, default: bool, model: str | None, scenario: str | None
     ) -> Generator[list[bool | int | str], Any, None]:
-        runs = self._platform.runs.list(
-            default_only=default,
-            model={"name": model} if model else None,
-            scenario={"name": scenario} if scenario else None,
-        )
+        yield from self.filter_scenarios(default, model, scenario)
+
+    def filter_scenarios(
+        self,
+        default: bool,
+        model: str | None,
+        scenario: str | None,
+        *,
+        match: re.Pattern[str] | None = None,
+        locked: bool | None = None,
+    ) -> Generator[list[bool | int | str], Any, None]:
+        # No Run is reported as locked; see below
+        if locked:
+            return
+
+        # Filters on model and scenario names
+        m: HasModelFilter = {"name": model} if model else {}
+        s: HasScenarioFilter = {"name": scenario} if scenario else {}
+        queries = [(m, s)]
+        if like := _like(match):
+            # Either the model or the scenario name matches: one query for each
+            queries = [({**m, "name__like": like}, s), (m, {**s, "name__like": like})]
+
+        # Runs from all queries, without duplicates
+        runs = {
+            run.id: run
+            for m, s in queries
+            for run in self._platform.runs.list(
+                default_only=default, model=m or None, scenario=s or None
+            )
+        }
 
-        for run in runs:
+        for run in runs.values():
             yield [
                 str(run.model.name),
                 str(run.scenario.name),
@@ -404,6 +478,42 @@ class IXMP4Backend(CachingBackend):
                 run.version,
             ]
 
+    def get_data_bulk(
+        self,
+        models: Sequence[str],
+        scenarios: Sequence[str],
+        region: Sequence[str],
+        variable: Sequence[str],
+        unit: Sequence[str],
+        year: Sequence[int],
+        default: bool,
+    ) -> Generator[tuple[str, str, int, str, str, str, str, int, float], Any, None]:
+        _kwargs = IamcEnumerateKwargs(run={"default_only": default})
+        for name, values in (
+            ("model", models),
+            ("scenario", scenarios),
+            ("region", region),
+            ("variable", variable),
+            ("unit", unit),
+        ):
+            # ixmp4's "name__in" with an empty list will exclude all data
+            if len(values):
+                _kwargs[name] = {"name__in": list(values)}  # type: ignore[literal-required]
+        if len(year):
+            _kwargs["step_year__in"] = list(map(int, year))
+
+        # Retrieve data for all matching runs with a single query
+        data = self._backend.iamc.datapoints.tabulate(
+            join_parameters=True, join_runs=True, **_kwargs
+        )
+        if data.empty:
+            return
+
+        data = _to_ixmp_source_ts_layout(data).rename(columns=str.lower)
+        yield from data[list(FIELDS["get_data_bulk"])].itertuples(
+            index=False, name=None
+        )
+
     def set_unit(self, name: str, comment: str) -> None:
         self._platform.units.create(name=name).docs = comment
 
@@ -661,6 +771,30 @@ class IXMP4Backend(CachingBackend):
 
         return {str(row.key): row.value for row in meta_df.itertuples()}
 
+    def get_meta_bulk(
+        self,
+        models: Sequence[str],
+        scenarios: Sequence[str],
+        names: Sequence[str],
+        default: bool,
+    ) -> Generator[tuple[str, str, int, str, Any], Any, None]:
+        filters: dict[str, Any] = {"key__in": list(names)} if names else {}
+
+        # Retrieve all matching entries with a single query
+        meta_df = self._backend.meta.tabulate(
+            join_run_index=True,
+            run={
+                "default_only": default,
+                "model": {"name__in": list(models)} if models else None,
+                "scenario": {"name__in": list(scenarios)} if scenarios else None,
+            },
+            **filters,
+        )
+
+        columns = ["model", "scenario", "version", "key", "value"]
+        for m, s, v, key, value in meta_df[columns].itertuples(index=False, name=None):
+            yield str(m), str(s), int(v), str(key), value
+
     def remove_meta(
         self,
         names: list[str],
@@ -1007,6 +1141,33 @@ class IXMP4Backend(CachingBackend):
                     f"elements '{key}' based on its IndexSets!"
                 ) from e
 
+    def _add_frame_to_table(self, s: Scenario, name: str, data: pd.DataFrame) -> None:
+        """Add the rows of `data` to the Table `name` in Scenario `s`.
+
+        Like :meth:`_add_data_to_set`, but for many elements with a single call. Rows of
+        `data` that duplicate each other or existing elements are silently ignored.
+        """
+        table = self.index[s].optimization.tables.get(name=name)
+        columns = table.column_names or table.indexset_names or []
+        data_to_add = data.set_axis(columns, axis=1).drop_duplicates()
+
+        existing = pd.DataFrame(table.data, columns=columns).astype(str)
+        if len(existing):
+            # Keep only rows not already present
+            merged = data_to_add.merge(
+                existing.drop_duplicates(), how="left", indicator=True
+            )
+            data_to_add = data_to_add[merged["_merge"].eq("left_only").to_numpy()]
+
+        try:
+            self._backend.optimization.tables.add_data(id=table.id, data=data_to_add)
+        except OptimizationDataValidationError as e:
+            elements = reprlib.repr(data_to_add.to_numpy().tolist())
+            raise ValueError(
+                f"The Table '{name}' is not allowed to have (at least one of) the "
+                f"elements '{elements}' based on its IndexSets!"
+            ) from e
+
     def _create_scalar(
         self,
         s: Scenario,
@@ -1160,6 +1321,46 @@ class IXMP4Backend(CachingBackend):
 
         self.cache_invalidate(ts=s, ix_type=type.ix_type, name=name)
 
+    def item_set_elements_frame(
+        self,
+        s: Scenario,
+        type: type[IXMPParameter | Set],
+        name: str,
+        data: pd.DataFrame,
+    ) -> None:
+        dims = [c for c in data.columns if c not in ("value", "unit", "comment")]
+        if not dims:
+            # Basic sets (IndexSets) and Scalars are handled per element
+            return super().item_set_elements_frame(s, type, name, data)
+
+        kind = "Tables" if type is Set else "Parameters"
+        if "comment" in data.columns and data["comment"].any():
+            log.warning(
+                f"`comment` currently unused with ixmp4 when adding data to {kind}."
+            )
+
+        if type is Set:
+            self._add_frame_to_table(s, name, data[dims])
+        else:
+            parameter = self.index[s].optimization.parameters.get(name=name)
+            columns = parameter.column_names or parameter.indexset_names or []
+
+            # Add all data with a single call. As when adding elements one by one, the
+            # last of any duplicate keys takes precedence.
+            data_to_add = (
+                data.drop_duplicates(subset=dims, keep="last")
+                .rename(
+                    columns=dict(zip(dims, columns))
+                    | {"value": "values", "unit": "units"}
+                )
+                .drop(columns="comment", errors="ignore")
+            )
+            self._backend.optimization.parameters.add_data(
+                id=parameter.id, data=data_to_add
+            )
+
+        self.cache_invalidate(ts=s, ix_type=type.ix_type, name=name)
+
     def _get_set_data(
         self,
         s: Scenario,
@@ -1179,7 +1380,13 @@ class IXMP4Backend(CachingBackend):
             Default: None.
         """
         item = self._get_indexset_or_table(s=s, name=name)
+        return self._set_data(item, filters)
 
+    @staticmethod
+    def _set_data(
+        item: "IndexSet | Table", filters: dict[str, list[Any]] | None = None
+    ) -> "pd.Series[int] | pd.Series[str] | pd.DataFrame":
+        """Return the data stored in `item`, optionally `filters`-ed."""
         if isinstance(item, Table):
             columns = item.column_names or item.indexset_names
             df = pd.DataFrame(item.data, columns=columns)
@@ -1190,7 +1397,7 @@ class IXMP4Backend(CachingBackend):
             )
         else:
             series = pd.Series(item.data)
-            return series[series.isin(values=filters[name])] if filters else series
+            return series[series.isin(values=filters[item.name])] if filters else series
 
     @overload
     def item_get_elements(
@@ -1233,65 +1440,123 @@ class IXMP4Backend(CachingBackend):
                 else cached_value
             )
 
-        data: "SetData | ParData | SolutionData"
+        item: "IXMP4ModelData" = (
+            self._get_indexset_or_table(s=s, name=name)
+            if ix_type == "set"
+            else self._find_item(s=s, name=name, types=CLASS_FOR_IX_TYPE[ix_type])
+        )
+        data = self._item_data(item, clean_filters)
 
-        if ix_type == "set":
-            data = self._get_set_data(s=s, name=name, filters=clean_filters)
-        else:
-            # Retrieve the ixmp4 data object
-            types = CLASS_FOR_IX_TYPE[ix_type]
-            item = self._find_item(s=s, name=name, types=types)
-            assert not isinstance(item, IndexSet)
-
-            if isinstance(item, Scalar):
-                # TODO DRY this; only call .cache() once below
-                data = {"value": item.value, "unit": item.unit.name}
-                self.cache(
-                    ts=s, ix_type=ix_type, name=name, filters=clean_filters, value=data
-                )
-                return data
-
-            # Columns/dict keys expected in result
-            columns = item.column_names or item.indexset_names or []
-            # Number of dimensions; 0 if scalar
-            N_dim = len(columns)
-
-            data = pd.DataFrame(item.data).rename(columns=RENAME_COLS)
-            if data.empty:
-                # Ensure expected columns even if no data is present
-                data = pd.DataFrame(
-                    columns=columns
-                    + (["value", "unit"] if Parameter in types else ["lvl", "mrg"])
-                )
+        # Store cache
+        self.cache(ts=s, ix_type=ix_type, name=name, filters=clean_filters, value=data)
 
-            # For scalar items, return dict for compatibility with JDBC
-            if N_dim == 0 and set(types) & {Equation, Variable}:
-                # TODO DRY this; only call .cache() once below
-                data = (
-                    {"lvl": np.nan, "mrg": np.nan}
-                    if data.empty
-                    else {"lvl": data["lvl"].values[0], "mrg": data["mrg"].values[0]}
-                )
-                self.cache(
-                    ts=s, ix_type=ix_type, name=name, filters=clean_filters, value=data
-                )
-                return data
+        return data
 
-            # Apply filters if requested
-            if clean_filters:
-                # isin() won't consider int(700) to be in ['700'], etc
-                _align_dtypes_for_filters(filters=clean_filters, data=data)
-                clean_filters = _remove_empty_lists(filters=clean_filters)
+    def _item_data(
+        self, item: "IXMP4ModelData", filters: dict[str, list[str]] | None = None
+    ) -> "SetData | ParData | SolutionData":
+        """Return the data of `item`, in the form returned by :meth:`item_get_elements`.
 
-                data = data[
-                    data.isin(values=clean_filters)[clean_filters.keys()].all(axis=1)
-                ].reset_index(drop=True)
+        `filters` must already be converted to lists of :class:`str`.
+        """
+        if isinstance(item, (IndexSet, Table)):
+            return self._set_data(item, filters)
+        elif isinstance(item, Scalar):
+            return {"value": item.value, "unit": item.unit.name}
 
-        # Store cache
-        self.cache(ts=s, ix_type=ix_type, name=name, filters=clean_filters, value=data)
+        # Columns/dict keys expected in result
+        columns = item.column_names or item.indexset_names or []
+
+        data = pd.DataFrame(item.data).rename(columns=RENAME_COLS)
+        if data.empty:
+            # Ensure expected columns even if no data is present
+            data = pd.DataFrame(
+                columns=columns
+                + (["value", "unit"] if isinstance(item, Parameter) else ["lvl", "mrg"])
+            )
+
+        # For scalar items, return dict for compatibility with JDBC
+        if len(columns) == 0 and isinstance(item, (Equation, Variable)):
+            return (
+                {"lvl": np.nan, "mrg": np.nan}
+                if data.empty
+                else {"lvl": data["lvl"].values[0], "mrg": data["mrg"].values[0]}
+            )
+
+        # Apply filters if requested
+        if filters:
+            # isin() won't consider int(700) to be in ['700'], etc
+            _filters = dict(filters)
+            _align_dtypes_for_filters(filters=_filters, data=data)
+            _filters = _remove_empty_lists(filters=_filters)
+
+            data = data[
+                data.isin(values=_filters)[_filters.keys()].all(axis=1)
+            ].reset_index(drop=True)
 
         return data
 
+    def item_get_elements_batch(
+        self, s: Scenario, items: Mapping[str, str], filters: "Filters" = None
+    ) -> dict[str, "SetData | ParData | SolutionData"]:
+        clean_filters = {dim: as_str_list(ele) for dim, ele in (filters or {}).items()}
+
+        result: dict[str, "SetData | ParData | SolutionData"] = dict()
+
+        # Without filters, cached values can be used before retrieving any items
+        for name, ix_type in items.items() if not clean_filters else ():
+            cached_value = self.maybe_get_cache(
+                ts=s, ix_type=ix_type, name=name, filters=None
+            )
+            if cached_value is not None:
+                result[name] = (
+                    cached_value.reset_index(drop=True)
+                    if isinstance(cached_value, pd.DataFrame)
+                    else cached_value
+                )
+
+        # Retrieve all other items with one query per ixmp4 item class
+        run = self.index[s]
+        for ix_type in sorted(set(items.values())):
+            names = [n for n, t in items.items() if t == ix_type and n not in result]
+            if not names:
+                continue
+
+            found: dict[str, "IXMP4ModelData"] = dict()
+            for cls in CLASS_FOR_IX_TYPE[ix_type]:
+                repo = self._get_backend_repo(s, cls)
+                for model in repo.list(run_id=run.id, name__in=names):
+                    found[model.name] = cls(
+                        _backend=self._backend, _model=model, _run=run
+                    )
+
+            for name in names:
+                try:
+                    item = found[name]
+                except KeyError:
+                    raise KeyError(f"No item named {name!r} in this Scenario")
+
+                # Apply only filters on dimensions of `item`, as for item_index()
+                dims = (
+                    []
+                    if isinstance(item, (IndexSet, Scalar))
+                    else (item.column_names or item.indexset_names or [])
+                )
+                _filters = {k: v for k, v in clean_filters.items() if k in dims} or None
+
+                data = self.maybe_get_cache(
+                    ts=s, ix_type=ix_type, name=name, filters=_filters
+                )
+                if data is None:
+                    data = self._item_data(item, _filters)
+                    self.cache(
+                        ts=s, ix_type=ix_type, name=name, filters=_filters, value=data
+                    )
+                result[name] = data
+
+        # Preserve the order of `items`
+        return {name: result[name] for name in items}
+
     def item_delete_elements(
         self,
         s: Scenario,
@@ -1341,40 +1606,26 @@ class IXMP4Backend(CachingBackend):
     # NOTE The name 'cat_`name`' is used for backward compatibility with the JDBC, where
     # such names are hardcoded. 'cat' means 'category' and should be expanded for
     # clarity in the future.
-    def cat_set_elements(
-        self,
-        ms: Scenario,
-        name: str,
-        cat: str,
-        keys: str | Sequence[str],
-        is_unique: bool,
-    ) -> None:
-        """Add data to a category mapping.
-
-        For the ixmp4.Table or IndexSet `name`, define a category as a new IndexSet
-        called 'type_`name`' (if it doesn't exist already) and add `cat` to it. Then,
-        define a new Table 'cat_`name`' storing one column for `keys` and one for
-        'categories'.
+    def _get_category_items(
+        self, run: Run, name: str
+    ) -> tuple[str, str, str | None, "IndexSet | BEIndexSet", "Table | BETable"]:
+        """Return the items needed to store category mapping `name` in `run`.
 
-        Parameters
-        ----------
-        name : str
-            Name of the category mapping Table.
-        cat : str
-            Name of the category within `name`.
-        keys : iterable of str or list of str
-            Keys to add to `cat`.
-        is_unique : bool
-            If :obj:`True`:
+        The 'type_`name`' IndexSet and 'cat_`name`' Table are created if they do not
+        exist.
 
-            - `keys` **must** contain only one key.
-            - The Backend **must** remove any existing member of `cat`, so that it has
-              only one element.
+        Returns
+        -------
+        tuple
+            - the (possibly abbreviated) `name`,
+            - the name of the IndexSet underlying `name`,
+            - the column name for keys in the 'cat_`name`' Table, or :obj:`None` if
+              this is the same as the IndexSet name,
+            - the 'type_`name`' IndexSet, and
+            - the 'cat_`name`' Table.
         """
         column_name: str | None = None
 
-        run = self.index[ms]
-
         # Categories can be based on IndexSets directly or on 1-d Tables
         try:
             # Most should be based on IndexSets, try that first
@@ -1424,6 +1675,43 @@ class IXMP4Backend(CachingBackend):
                 else None,
             )
 
+        return name, indexset_name, column_name, category_indexset, category_table
+
+    def cat_set_elements(
+        self,
+        ms: Scenario,
+        name: str,
+        cat: str,
+        keys: str | Sequence[str],
+        is_unique: bool,
+    ) -> None:
+        """Add data to a category mapping.
+
+        For the ixmp4.Table or IndexSet `name`, define a category as a new IndexSet
+        called 'type_`name`' (if it doesn't exist already) and add `cat` to it. Then,
+        define a new Table 'cat_`name`' storing one column for `keys` and one for
+        'categories'.
+
+        Parameters
+        ----------
+        name : str
+            Name of the category mapping Table.
+        cat : str
+            Name of the category within `name`.
+        keys : iterable of str or list of str
+            Keys to add to `cat`.
+        is_unique : bool
+            If :obj:`True`:
+
+            - `keys` **must** contain only one key.
+            - The Backend **must** remove any existing member of `cat`, so that it has
+              only one element.
+        """
+        run = self.index[ms]
+        name, indexset_name, column_name, category_indexset, category_table = (
+            self._get_category_items(run, name)
+        )
+
         # Convert for convenience
         if isinstance(keys, str):
             keys = [keys]
@@ -1457,6 +1745,48 @@ class IXMP4Backend(CachingBackend):
         self.cache_invalidate(ts=ms, ix_type="set", name=f"type_{name}")
         self.cache_invalidate(ts=ms, ix_type="set", name=f"cat_{name}")
 
+    def cat_set_elements_frame(
+        self, ms: Scenario, name: str, data: pd.DataFrame, is_unique: bool = False
+    ) -> None:
+        """Add elements to many categories of a category mapping at once.
+
+        The 'type_`name`' IndexSet and 'cat_`name`' Table are looked up (or created)
+        once; all new categories and all (key, category) pairs are then added with one
+        call each.
+
+        With :py:`is_unique=True`, existing members are removed category by category,
+        so the default implementation is used.
+        """
+        if is_unique:
+            return super().cat_set_elements_frame(ms, name, data, is_unique)
+        elif data.empty:
+            return
+
+        run = self.index[ms]
+        name, indexset_name, column_name, category_indexset, category_table = (
+            self._get_category_items(run, name)
+        )
+
+        keys = data["key"].astype(str).tolist()
+        cats = data["category"].astype(str).tolist()
+
+        # Add any new categories to the 'type_name' IndexSet
+        existing = set(category_indexset.data)
+        if new_cats := [c for c in dict.fromkeys(cats) if c not in existing]:
+            self._backend.optimization.indexsets.add_data(
+                id=category_indexset.id, data=new_cats
+            )
+
+        # Add all (key, category) pairs to the 'cat_name' Table
+        self._backend.optimization.tables.add_data(
+            id=category_table.id,
+            data={column_name or indexset_name: keys, category_indexset.name: cats},
+        )
+
+        self.cache_invalidate(ts=ms, ix_type="set", name=name)
+        self.cache_invalidate(ts=ms, ix_type="set", name=f"type_{name}")
+        self.cache_invalidate(ts=ms, ix_type="set", name=f"cat_{name}")
+
     # TODO In cat_set_elements, we change e.g. cat_technology to cat_tec. Do we need the
     # same here or do we expect user code to call this with name == "tec" if they're
     # interested in "technology"?
@@ -1542,6 +1872,50 @@ class IXMP4Backend(CachingBackend):
         if not _owns_lock:
             run._unlock()
 
+    def set_data_frame(self, ts: TimeSeries, data: pd.DataFrame, meta: bool) -> None:
+        """Store time series data for many keys at once.
+
+        Unlike the default implementation, which calls :meth:`set_data` once per
+        (region, variable, unit, subannual) group, this adds all annual data points,
+        and all subannual data points, with one call to ``run.iamc.add()`` each.
+        """
+        if data.empty:
+            return
+
+        run = self.index[ts]
+        _owns_lock = run.owns_lock
+        if not _owns_lock:
+            run._lock()
+
+        try:
+            annual = (data["subannual"] == "Year").to_numpy()
+            for mask, _data_type in (
+                (annual, DataPoint.Type.ANNUAL),
+                (~annual, DataPoint.Type.CATEGORICAL),
+            ):
+                if not mask.any():
+                    continue
+                df = pd.DataFrame(
+                    dict(
+                        step_year=data["year"][mask].to_numpy(dtype=int),
+                        value=data["value"][mask].to_numpy(dtype=float),
+                        region=data["region"][mask].astype(str).to_numpy(),
+                        variable=data["variable"][mask].astype(str).to_numpy(),
+                        unit=data["unit"][mask].astype(str).to_numpy(),
+                        is_input=bool(meta),
+                    )
+                )
+                if _data_type is DataPoint.Type.CATEGORICAL:
+                    df["step_category"] = data["subannual"][mask].astype(str).to_numpy()
+                run.iamc.add(df, type=_data_type)
+        except Region.NotFound:
+            regions = set(data["region"].astype(str))
+            missing = sorted(regions - {node[0] for node in self.get_nodes()})
+            raise ValueError(f"region = {', '.join(missing)}") from None
+        finally:
+            if not _owns_lock:
+                run._unlock()
+
     def get_data(
         self,
         ts: TimeSeries,
@@ -1592,7 +1966,8 @@ class IXMP4Backend(CachingBackend):
             variable={"name": variable},
             year__in=years,
             unit={"name": unit},
-            is_input=False,
+            # NB Supported by ixmp4, but missing from the signature of tabulate()
+            is_input=False,  # type: ignore[call-arg]
         )
 
         if data_to_delete.empty:
@@ -1609,6 +1984,57 @@ class IXMP4Backend(CachingBackend):
 
         self._backend.iamc.datapoints.bulk_delete(df=data_to_delete)
 
+    def delete_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        """Remove time series data for many keys at once.
+
+        Unlike the default implementation, which calls :meth:`delete` once per
+        (region, variable, unit, subannual) group, this retrieves all candidate
+        datapoints of the run with a single query, selects those matching the rows of
+        `data`, and removes them with a single call to ``bulk_delete()``.
+        """
+        if data.empty:
+            return
+
+        run = self.index[ts]
+
+        # Candidate data points: the union of all keys appearing in `data`
+        existing = self._backend.iamc.datapoints.tabulate(
+            join_parameters=True,
+            join_run_id=True,
+            run={"id": run.id, "default_only": False},
+            region={"name__in": sorted(set(data["region"].astype(str)))},
+            variable={"name__in": sorted(set(data["variable"].astype(str)))},
+            unit={"name__in": sorted(set(data["unit"].astype(str)))},
+            year__in=sorted(set(data["year"].astype(int))),
+            # Like delete(), do not remove data points stored with meta=True
+            is_input=False,  # type: ignore[call-arg]
+        )
+
+        if existing.empty:
+            log.debug("Found 0 datapoints matching filters to delete!")
+            # See note in delete()
+            return
+
+        # Match the exact (region, variable, unit, type, year) combinations
+        keys = pd.DataFrame(
+            {
+                "region": data["region"].astype(str),
+                "variable": data["variable"].astype(str),
+                "unit": data["unit"].astype(str),
+                "type": data["subannual"].astype(str).replace({"Year": "ANNUAL"}),
+                "step_year": data["year"].astype(int),
+            }
+        ).drop_duplicates()
+        to_delete = existing.merge(keys, on=list(keys.columns), how="inner")
+
+        if to_delete.empty:
+            log.debug("Found 0 datapoints matching filters to delete!")
+            return
+
+        self._backend.iamc.datapoints.bulk_delete(
+            df=to_delete.drop(columns=["region", "variable", "unit"])
+        )
+
     # Handle I/O
 
     def write_file(
@@ -1700,53 +2126,38 @@ class IXMP4Backend(CachingBackend):
                 if bool(filter):
                     _kwargs[filter_name] = {"name__in": filter}
 
-            data = self._backend.iamc.datapoints.tabulate(
-                join_parameters=True, join_runs=True, **_kwargs
-            ).rename(  # Adhere to ixmp_source expectations...
-                columns={"step_year": "YEAR"}
-            )
-
-            data = data.rename(columns={name: name.upper() for name in data.columns})
-            data = data.rename(columns={"IS_INPUT": "META"})
-            expected_columns = [
-                "MODEL",
-                "SCENARIO",
-                "VERSION",
-                "VARIABLE",
-                "UNIT",
-                "REGION",
-                "META",
-                "SUBANNUAL",
-                "YEAR",
-                "VALUE",
-            ]
-
-            # Guard against entirely empty data selection
-            if data.empty:
-                columns = copy(expected_columns)
-                columns.extend(["ID", "TIME_SERIES__ID", "TYPE"])
-                data = pd.DataFrame(columns=columns)
-
-            data = data.drop(columns=["ID", "TIME_SERIES__ID"])
-
-            # NOTE We don't handle step_datetime here
-
-            # Handle 'subannual' values
-            if "STEP_CATEGORY" not in data.columns:
-                data["STEP_CATEGORY"] = None
-
-            data["SUBANNUAL"] = (
-                data["STEP_CATEGORY"]
-                .combine_first(data["TYPE"])
-                .replace({"ANNUAL": "Year"})
+            # Select matching runs
+            runs = self._backend.runs.tabulate(
+                default_only=default,
+                model=cast("HasModelFilter | None", _kwargs.get("model")),
+                scenario=cast("HasScenarioFilter | None", _kwargs.get("scenario")),
             )
-            data = data.drop(columns={"STEP_CATEGORY", "TYPE"})
 
-            # Sort columns according to ixmp_source expectations
-            # NOTE Alternatively, check_like=True might work in test/assert_frame_equal
-            data = data[expected_columns]
+            # Retrieve and write data one run at a time, so that memory use is bounded
+            # by the size of the largest run rather than all data on the platform
+            # NOTE ixmp4's DataPointRepository.tabulate() does not support limit/offset
+            n_chunks = 0
+            for run_id in runs["id"] if len(runs) else []:
+                _kwargs["run"] = {"id": int(run_id), "default_only": default}
+                chunk = self._backend.iamc.datapoints.tabulate(
+                    join_parameters=True, join_runs=True, **_kwargs
+                )
+                if chunk.empty:
+                    continue
+
+                _to_ixmp_source_ts_layout(chunk).to_csv(
+                    path_or_buf=_path,
+                    index=False,
+                    header=n_chunks == 0,
+                    mode="w" if n_chunks == 0 else "a",
+                )
+                n_chunks += 1
 
-            data.to_csv(path_or_buf=_path, index=False)
+            if n_chunks == 0:
+                # Guard against entirely empty data selection: write only the header
+                pd.DataFrame(columns=list(FIELDS["write_file"])).to_csv(
+                    path_or_buf=_path, index=False
+                )
 
         else:
             raise NotImplementedError
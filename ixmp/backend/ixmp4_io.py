@@ -1,9 +1,12 @@
 import logging
-from collections.abc import Iterable, Sequence
+from collections.abc import Generator, Iterable, Sequence
+from contextlib import contextmanager
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Literal, TypeVar, cast
 
 import gams.transfer as gt
+import numpy as np
 import pandas as pd
 from ixmp4.core import Run
 from ixmp4.core.optimization.base import Lister
@@ -25,6 +28,14 @@ log = logging.getLogger(__name__)
 Item4 = TypeVar("Item4", Equation, IndexSet, Parameter, Scalar, Table, Variable)
 
 
+@contextmanager
+def _timed(message: str) -> Generator[None, None, None]:
+    """Log `message` and the time elapsed in the context, with level DEBUG."""
+    start = perf_counter()
+    yield
+    log.debug(f"{message}: {perf_counter() - start:.3f} s")
+
+
 def _domain(item: Item4) -> list[str] | None:
     """Return domain for `item`.
 
@@ -124,6 +135,29 @@ def _align_records_and_domain(
         return {key: records[key] for key in domain_order}
 
 
+def _records_to_frame(
+    records: dict[str, list[float] | list[int] | list[str]],
+) -> pd.DataFrame:
+    """Convert `records` to a data frame with categorical dimension columns.
+
+    gams.transfer stores dimensions as ordered categoricals, with categories in order of
+    first appearance. Constructing these here with :func:`pandas.factorize` gives the
+    same result, but avoids slower conversions of lists of Python objects within
+    gams.transfer. The column 'values', if any, is converted to :class:`float`.
+    """
+    data: dict[str, Any] = {}
+    for name, values in records.items():
+        if name == "values":
+            data[name] = np.asarray(values, dtype=float)
+        else:
+            codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+            data[name] = pd.Categorical.from_codes(
+                codes, categories=pd.Index(uniques), ordered=True
+            )
+
+    return pd.DataFrame(data)
+
+
 # NOTE gamsapi does not provide type hints, it seems, and even though we ignore missing
 # imports, we also need to explicitly accept 'Any' import like this
 def _update_item_in_container(container: gt.Container, item: ContainerData) -> None:  # type: ignore[no-any-unimported]
@@ -292,17 +326,27 @@ def write_run_to_gdx(
     ]
     idx = slice(None) if include_variables_and_equations else slice(-2)
     for r in repository[idx]:
+        kind = type(r).__name__.replace("Repository", "")
+
+        # Retrieve all items of this kind, including their data, with one query
+        with _timed(f"Retrieve {kind} items"):
+            items = r.list()
+
         # Reorder items if necessary for GAMS to successfully read the GDX
-        ixmp4_items = _ensure_correct_item_order(items=r.list(), repo=r)
+        ixmp4_items = _ensure_correct_item_order(items=items, repo=r)
 
         # Convert ixmp4 items to ContainerData to streamline adding to container
-        container_items = _convert_ixmp4_items_to_containerdata(items=ixmp4_items)
-
-        _add_items_to_container(container, container_items)
+        with _timed(f"Add {len(ixmp4_items)} {kind} items to container"):
+            container_items = _convert_ixmp4_items_to_containerdata(items=ixmp4_items)
+            for item in container_items:
+                if isinstance(item.records, dict):
+                    item.records = _records_to_frame(item.records)
+            _add_items_to_container(container, container_items)
 
     # Add additional data *after* the required items to avoid confusing GAMS' internal
     # Unique Element List
-    _add_items_to_container(container, container_data)
+    with _timed(f"Add {len(container_data)} other items to container"):
+        _add_items_to_container(container, container_data)
 
     _record_versions(container=container, packages=record_version_packages)
 
@@ -310,7 +354,8 @@ def write_run_to_gdx(
     # to GAMSModel's use_temp_dir handling)
     file_name.parent.mkdir(parents=True, exist_ok=True)
 
-    container.write(write_to=file_name)
+    with _timed(f"Write {file_name}"):
+        container.write(write_to=file_name)
 
 
 # NOTE since we currently only read Variables and Equations, this function only covers
@@ -333,20 +378,57 @@ def _set_columns_to_read_from_records(
     return item_columns if item_columns else columns
 
 
+def _load_records(  # type: ignore[no-any-unimported]
+    container: gt.Container, name: str, result_file: Path | None = None
+) -> pd.DataFrame:
+    """Return the records of symbol `name` in `container`.
+
+    If `result_file` is given, `container` is expected to hold only the metadata of the
+    symbols in `result_file`. The records of `name` are then read from `result_file`,
+    and the symbol is removed from `container` again before returning, so that at most
+    one symbol's records are held by `container` at any time.
+
+    Raises
+    ------
+    KeyError
+        if `container` does not contain a symbol `name`.
+    """
+    if result_file is None:
+        return pd.DataFrame(container.data[name].records)
+    elif not container.hasSymbols(name):
+        raise KeyError(name)
+
+    # Replace the metadata-only symbol with one including records
+    container.removeSymbols(name)
+    with _timed(f"Read {name} from {result_file}"):
+        container.read(result_file, symbols=[name])
+    records = pd.DataFrame(container.data[name].records)
+    container.removeSymbols(name)
+
+    return records
+
+
 # NOTE not sure we only need equations and variables; if we need others, abstracting one
 # function for reading would not be as easy, since we might need different details, so
 # I'm keeping them separate for now
 
 
 def _read_variables_to_run(  # type: ignore[no-any-unimported]
-    container: gt.Container, run: Run, variables: Iterable[AbstractVariable]
+    container: gt.Container,
+    run: Run,
+    variables: Iterable[AbstractVariable],
+    result_file: Path | None = None,
 ) -> None:
-    """Read `variables` from `container` and store them in `run`."""
+    """Read `variables` from `container` and store them in `run`.
+
+    If `result_file` is given, the records of each of `variables` are read from it
+    one at a time; see :func:`_load_records`.
+    """
     for variable in variables:
         columns_of_interest = _set_columns_to_read_from_records(item=variable)
 
         try:
-            records = pd.DataFrame(container.data[variable.name].records)
+            records = _load_records(container, variable.name, result_file)
         except KeyError:
             # container doesn't contain this variable
             continue
@@ -366,14 +448,21 @@ def _read_variables_to_run(  # type: ignore[no-any-unimported]
 
 
 def _read_equations_to_run(  # type: ignore[no-any-unimported]
-    container: gt.Container, run: Run, equations: Iterable[AbstractEquation]
+    container: gt.Container,
+    run: Run,
+    equations: Iterable[AbstractEquation],
+    result_file: Path | None = None,
 ) -> None:
-    """Read `equations` from `container` and store them in `run`."""
+    """Read `equations` from `container` and store them in `run`.
+
+    If `result_file` is given, the records of each of `equations` are read from it
+    one at a time; see :func:`_load_records`.
+    """
     for equation in equations:
         columns_of_interest = _set_columns_to_read_from_records(item=equation)
 
         try:
-            records = pd.DataFrame(container.data[equation.name].records)
+            records = _load_records(container, equation.name, result_file)
         except KeyError:
             # container doesn't contain this equation
             continue
@@ -435,10 +524,11 @@ def read_gdx_to_run(
             f"Ignoring check_solution={check_solution} for now; unused by ixmp4!"
         )
 
-    # Create a GAMS Container from the `result_file`
-    container = gt.Container(
-        load_from=result_file, system_directory=str(gams_info().system_dir)
-    )
+    # Create a GAMS Container with the metadata of all symbols in `result_file`. Records
+    # are read only for the requested Variables and Equations, one symbol at a time,
+    # to limit memory use for large files
+    container = gt.Container(system_directory=str(gams_info().system_dir))
+    container.read(result_file, records=False)
 
     # Load requested Variables and read them to `run`
     # NOTE This handles empty `var_list`, too,
@@ -448,7 +538,9 @@ def read_gdx_to_run(
         if len(var_list)
         else run.backend.optimization.variables.list(run_id=run.id)
     )
-    _read_variables_to_run(container=container, run=run, variables=variables)
+    _read_variables_to_run(
+        container=container, run=run, variables=variables, result_file=result_file
+    )
 
     # Load requested Equations and read them to `run`
     # NOTE This handles empty `equ_list`, too,
@@ -458,4 +550,6 @@ def read_gdx_to_run(
         if len(equ_list)
         else run.backend.optimization.equations.list(run_id=run.id)
     )
-    _read_equations_to_run(container=container, run=run, equations=equations)
+    _read_equations_to_run(
+        container=container, run=run, equations=equations, result_file=result_file
+    )
@@ -3,7 +3,6 @@ import logging
 import os
 import platform
 import re
-from collections import ChainMap
 from collections.abc import (
     Callable,
     Generator,
@@ -43,7 +42,7 @@ from ixmp.util import as_str_list
 from ixmp.util.pandas import STRING_DTYPE
 
 from .base import CachingBackend
-from .common import FIELDS, CrossPlatformClone, ItemType
+from .common import FIELDS, ITEM_CHUNKSIZE, CrossPlatformClone, ItemType
 
 if TYPE_CHECKING:
     from ixmp.types import (
@@ -913,48 +912,59 @@ class JDBCBackend(CachingBackend):
     def get_geo(
         self, ts: TimeSeries
     ) -> Generator[tuple[str, str, int, str, str, str, bool], Any, None]:
+        yield from self.get_geo_frame(ts).itertuples(index=False, name=None)
+
+    def get_geo_frame(self, ts: TimeSeries) -> pd.DataFrame:
+        """Retrieve all time-series 'geodata' as a data frame.
+
+        Unlike the default implementation, this collects the values of each column from
+        the Java data structure, then constructs the data frame at once.
+        """
         # NB the return type of getGeoData() requires more processing than
         #    getTimeseries. It also accepts no selectors.
 
-        # Field types
-        ftype: dict[str, Callable[..., Any]] = {
-            "meta": int,
-            "year": lambda obj: obj,  # Pass through; handled later
-        }
-
         # Returned names in Java data structure do not match API column names
         jname = {
-            "meta": "meta",
             "region": "nodeName",
+            "variable": "keyString",
             "subannual": "subannual",
             "unit": "unitName",
-            "variable": "keyString",
-            "year": "yearlyData",
+            "meta": "meta",
         }
 
-        # Iterate over rows from the Java backend
-        for row in self.jindex[ts].getGeoData():
-            data1 = {
-                f: ftype.get(f, str)(row.get(jname.get(f, f)))
-                for f in FIELDS["ts_get_geo"]
-                if f != "value"
-            }
-
-            # At this point, the 'year' key is a not a single value, but a year ->
-            # value mapping with multiple entries
-            yv_entries = data1.pop("year").entrySet()
+        # Values of each column, except year and value, for each row of geodata
+        columns: dict[str, list[Any]] = {f: [] for f in jname}
+        # Years and values for all rows; number of (year, value) entries in each row
+        years: list[int] = []
+        values: list[str] = []
+        counts: list[int] = []
 
-            # Construct a chain map: look up in data1, then data2
-            data2 = {"year": None, "value": None}
-            cm = ChainMap(data1, data2)
-
-            for yv in yv_entries:
-                # Update data2
-                data2["year"] = yv.getKey()
-                data2["value"] = yv.getValue()
-
-                # Construct a row with a single value
-                yield tuple(cm[f] for f in FIELDS["ts_get_geo"])
+        for row in self.jindex[ts].getGeoData():
+            for f, j in jname.items():
+                columns[f].append(row.get(j))
+
+            # Mapping of year → value with multiple entries
+            yv = row.get("yearlyData")
+            years.extend(map(int, yv.keySet()))
+            values.extend(map(str, yv.values()))
+            counts.append(yv.size())
+
+        # Repeat the other columns once for each (year, value) entry
+        data = {
+            f: np.repeat(np.array(v, dtype=object), counts) for f, v in columns.items()
+        }
+        return pd.DataFrame(
+            dict(
+                region=data["region"].astype(str),
+                variable=data["variable"].astype(str),
+                subannual=data["subannual"].astype(str),
+                year=np.array(years, dtype=int),
+                value=values,
+                unit=data["unit"].astype(str),
+                meta=data["meta"].astype(int),
+            ),
+            columns=list(FIELDS["ts_get_geo"]),
+        )
 
     def set_data(
         self,
@@ -1164,8 +1174,7 @@ class JDBCBackend(CachingBackend):
         filters: "Filters" = None,
     ) -> "SolutionData": ...
 
-    # FIXME reduce complexity 16 → ≤13
-    def item_get_elements(  # noqa: C901
+    def item_get_elements(
         self, s: Scenario, ix_type: str, name: str, filters: "Filters" = None
     ) -> "SetData | ParData | SolutionData":
         if filters:
@@ -1179,85 +1188,15 @@ class JDBCBackend(CachingBackend):
         if cached_value is not None:
             return cached_value
 
-        # Retrieve the item
+        # Retrieve the item and list of elements
         item = self._get_item(s, ITEM_CLASS[ix_type](name), load=True)
-        idx_names = list(item.getIdxNames())
-        idx_sets = list(item.getIdxSets())
-
-        # Get list of elements, using filters if provided
-        if filters is not None:
-            jFilter = java.HashMap()
-
-            for idx_name, values in filters.items():
-                # Retrieve the elements of the index set as a list
-                idx_set_name = idx_sets[idx_names.index(idx_name)]
-                idx_set = self.item_get_elements(s, "set", idx_set_name)
-                assert isinstance(idx_set, pd.Series)
-                elements = idx_set.tolist()
-
-                # Filter for only included values and store
-                filtered_elements: Iterable[float | int | str] = filter(
-                    lambda e: e in values, elements
-                )
-                jFilter.put(idx_name, to_jlist(filtered_elements))
-
-            jList = item.getElements(jFilter)
-        else:
-            jList = item.getElements()
+        jList = self._get_elements_jlist(s, item, filters)
 
         result: "SetData" | "ParData" | "SolutionData"
 
         if item.getDim() > 0:
             # Mapping set or multi-dimensional equation, parameter, or variable
-            columns = copy(idx_names)
-
-            # Prepare dtypes for index columns
-            dtypes: dict[str, type[float] | type[int] | type[str]] = {}
-            for idx_name, idx_set in zip(columns, idx_sets):
-                # NB using categoricals could be more memory-efficient, but requires
-                #    adjustment of tests/documentation. See
-                #    https://github.com/iiasa/ixmp/issues/228
-                # dtypes[idx_name] = CategoricalDtype(
-                #     self.item_get_elements(s, 'set', idx_set))
-                dtypes[idx_name] = str
-
-            # Prepare dtypes for additional columns
-            if ix_type == "par":
-                columns.extend(["value", "unit"])
-                dtypes.update(value=float, unit=str)
-                # Same as above
-                # dtypes['unit'] = CategoricalDtype(self.jobj.getUnitList())
-            elif ix_type in ("equ", "var"):
-                columns.extend(["lvl", "mrg"])
-                dtypes.update(lvl=float, mrg=float)
-
-            # Copy vectors from Java into pd.Series to form DataFrame columns
-            columns = []
-
-            def _get(method: str, name: str, *args: Any) -> None:
-                # NB [:] causes JPype to use a faster code path
-                java_array = getattr(item, f"get{method}")(*args, jList)[:]
-
-                # Use numpy buffer protocol for numeric types (much faster)
-                # String types must iterate element-by-element (JPype limitation)
-                if dtypes[name] in (float, int):
-                    java_array = np.array(java_array)
-
-                columns.append(pd.Series(java_array, dtype=dtypes[name], name=name))
-
-            # Index columns
-            for i, idx_name in enumerate(idx_names):
-                _get("Col", idx_name, i)
-
-            # Data columns
-            if ix_type == "par":
-                _get("Values", "value")
-                _get("Units", "unit")
-            elif ix_type in ("equ", "var"):
-                _get("Levels", "lvl")
-                _get("Marginals", "mrg")
-
-            result = pd.concat(columns, axis=1)
+            result = self._elements_frame(item, ix_type, jList)
         elif ix_type == "set":
             # Index sets
             # dtype=object is to silence a warning in pandas 1.0
@@ -1280,6 +1219,114 @@ class JDBCBackend(CachingBackend):
 
         return result
 
+    def item_get_elements_chunks(
+        self,
+        s: Scenario,
+        ix_type: str,
+        name: str,
+        filters: "Filters" = None,
+        chunksize: int = ITEM_CHUNKSIZE,
+    ) -> Generator["SetData | ParData | SolutionData", Any, None]:
+        if filters:
+            # Convert filter elements to strings
+            filters = {dim: as_str_list(ele) for dim, ele in filters.items()}
+
+        item = self._get_item(s, ITEM_CLASS[ix_type](name), load=True)
+        if (
+            item.getDim() == 0
+            or self.maybe_get_cache(ts=s, ix_type=ix_type, name=name, filters=filters)
+            is not None
+        ):
+            # Index set, scalar, or data already in the cache
+            yield from super().item_get_elements_chunks(
+                s, ix_type, name, filters, chunksize
+            )
+            return
+
+        # Convert ranges of the Java list of elements, without caching the entire item
+        jList = self._get_elements_jlist(s, item, filters)
+        N = jList.size()
+        for start in range(0, N, chunksize):
+            yield self._elements_frame(
+                item, ix_type, jList.subList(start, min(start + chunksize, N))
+            )
+
+    def _get_elements_jlist(self, s: Scenario, item: Any, filters: "Filters") -> Any:
+        """Return a Java list of the elements of `item`, using `filters` if provided."""
+        if filters is None:
+            return item.getElements()
+
+        idx_names = list(item.getIdxNames())
+        idx_sets = list(item.getIdxSets())
+        jFilter = java.HashMap()
+
+        for idx_name, values in filters.items():
+            # Retrieve the elements of the index set as a list
+            idx_set_name = idx_sets[idx_names.index(idx_name)]
+            idx_set = self.item_get_elements(s, "set", idx_set_name)
+            assert isinstance(idx_set, pd.Series)
+            elements = idx_set.tolist()
+
+            # Filter for only included values and store
+            filtered_elements: Iterable[float | int | str] = filter(
+                lambda e: e in values, elements
+            )
+            jFilter.put(idx_name, to_jlist(filtered_elements))
+
+        return item.getElements(jFilter)
+
+    @staticmethod
+    def _elements_frame(item: Any, ix_type: str, jList: Any) -> pd.DataFrame:
+        """Return a data frame with the elements in `jList` of N-dimensional `item`."""
+        idx_names = list(item.getIdxNames())
+        idx_sets = list(item.getIdxSets())
+
+        # Prepare dtypes for index columns
+        dtypes: dict[str, type[float] | type[int] | type[str]] = {}
+        for idx_name, idx_set in zip(idx_names, idx_sets):
+            # NB using categoricals could be more memory-efficient, but requires
+            #    adjustment of tests/documentation. See
+            #    https://github.com/iiasa/ixmp/issues/228
+            # dtypes[idx_name] = CategoricalDtype(
+            #     self.item_get_elements(s, 'set', idx_set))
+            dtypes[idx_name] = str
+
+        # Prepare dtypes for additional columns
+        if ix_type == "par":
+            dtypes.update(value=float, unit=str)
+            # Same as above
+            # dtypes['unit'] = CategoricalDtype(self.jobj.getUnitList())
+        elif ix_type in ("equ", "var"):
+            dtypes.update(lvl=float, mrg=float)
+
+        # Copy vectors from Java into pd.Series to form DataFrame columns
+        columns = []
+
+        def _get(method: str, name: str, *args: Any) -> None:
+            # NB [:] causes JPype to use a faster code path
+            java_array = getattr(item, f"get{method}")(*args, jList)[:]
+
+            # Use numpy buffer protocol for numeric types (much faster)
+            # String types must iterate element-by-element (JPype limitation)
+            if dtypes[name] in (float, int):
+                java_array = np.array(java_array)
+
+            columns.append(pd.Series(java_array, dtype=dtypes[name], name=name))
+
+        # Index columns
+        for i, idx_name in enumerate(idx_names):
+            _get("Col", idx_name, i)
+
+        # Data columns
+        if ix_type == "par":
+            _get("Values", "value")
+            _get("Units", "unit")
+        elif ix_type in ("equ", "var"):
+            _get("Levels", "lvl")
+            _get("Marginals", "mrg")
+
+        return pd.concat(columns, axis=1)
+
     def item_set_elements(
         self,
         s: Scenario,
@@ -0,0 +1,1378 @@
+"""Backend storing data in memory."""
+
+import getpass
+import logging
+import os
+import pickle
+import re
+import time
+from collections.abc import Generator, Iterable, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
+from copy import copy, deepcopy
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from itertools import zip_longest
+from numbers import Real
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, overload
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from ixmp.core.item import Equation, Parameter, Set, Variable
+from ixmp.core.platform import Platform
+from ixmp.core.scenario import Scenario
+from ixmp.core.timeseries import TimeSeries
+from ixmp.util import as_str_list, filtered
+from ixmp.util.pandas import STRING_DTYPE
+
+from .base import CachingBackend
+from .common import FIELDS, CrossPlatformClone
+
+if TYPE_CHECKING:
+    from ixmp.types import Filters, ParData, SetData, SolutionData
+
+log = logging.getLogger(__name__)
+
+#: Documentation domains for :meth:`.MemoryBackend.set_doc`; the same as
+#: :class:`.JDBCBackend`.
+DOC_DOMAINS = ("scenario", "model", "region", "metadata", "timeseries")
+
+#: Units present on a new :class:`.MemoryBackend`; the same as :class:`.JDBCBackend`.
+INIT_UNITS = [
+    "%",
+    "-",
+    "???",
+    "G$",
+    "GW",
+    "GWa",
+    "MW",
+    "MWa",
+    "T$",
+    "USD",
+    "USD/GWa",
+    "USD/kWa",
+    "USD/kg",
+    "USD/km",
+    "USD/tC",
+    "USD/tCO2",
+    "cases",
+    "kg",
+    "kg/kWa",
+    "km",
+    "t",
+    "tC",
+    "tCO2",
+    "y",
+]
+
+#: Names of the columns holding values, rather than keys, for each type of item.
+VALUE_COLUMNS = {
+    "set": [],
+    "par": ["value", "unit"],
+    "equ": ["lvl", "mrg"],
+    "var": ["lvl", "mrg"],
+}
+
+#: Key columns of time series data and geodata.
+TS_KEY = ["region", "variable", "unit", "subannual", "year"]
+
+#: Attributes of :class:`.MemoryBackend` stored in snapshots.
+SNAPSHOT_ATTRS = (
+    "_default",
+    "_docs",
+    "_meta",
+    "_model_names",
+    "_nodes",
+    "_runs",
+    "_scenario_names",
+    "_timeslices",
+    "_units",
+)
+
+
+def _encode(values: Iterable[Any]) -> "pd.Categorical[str]":
+    """Dictionary-encode `values` as :class:`str`."""
+    return pd.Categorical(pd.Series(values, dtype=object).astype(str))
+
+
+def _empty(ix_type: str, keys: Sequence[str]) -> pd.DataFrame:
+    """Return an empty data frame for an item of `ix_type` with `keys` columns."""
+    data: dict[str, Any] = {k: _encode([]) for k in keys}
+    if ix_type == "par":
+        data.update(value=np.array([], dtype=float), unit=_encode([]))
+    elif ix_type in ("equ", "var"):
+        data.update(lvl=np.array([], dtype=float), mrg=np.array([], dtype=float))
+    return pd.DataFrame(data)
+
+
+def _empty_ts(dtype: type[float] | type[object]) -> pd.DataFrame:
+    """Return an empty data frame for time series data or geodata."""
+    data: dict[str, Any] = {k: _encode([]) for k in TS_KEY[:-1]}
+    data.update(
+        year=np.array([], dtype=int),
+        value=np.array([], dtype=dtype),
+        meta=np.array([], dtype=bool),
+    )
+    return pd.DataFrame(data)
+
+
+def _concat(a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+    """Concatenate `a` and `b`, preserving categorical columns."""
+    data: dict[str, Any] = {}
+    for c in a.columns:
+        if isinstance(a[c].dtype, pd.CategoricalDtype):
+            data[c] = union_categoricals([pd.Categorical(a[c]), pd.Categorical(b[c])])
+        else:
+            data[c] = np.concatenate([a[c].to_numpy(), b[c].to_numpy()])
+    return pd.DataFrame(data)
+
+
+def _upsert(
+    a: pd.DataFrame, b: pd.DataFrame, keys: list[str], keep: Literal["first", "last"]
+) -> pd.DataFrame:
+    """Combine `a` and `b`, keeping one row for each distinct combination of `keys`."""
+    result = _concat(a, b)
+    if len(keys):
+        result = result.drop_duplicates(subset=keys, keep=keep)
+    else:
+        result = result.tail(1)
+    return result.reset_index(drop=True)
+
+
+def _anti_join(a: pd.DataFrame, b: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Return the rows of `a` whose `keys` do not appear in `b`."""
+    if not len(a) or not len(b):
+        return a
+    mask = pd.MultiIndex.from_frame(a[keys]).isin(pd.MultiIndex.from_frame(b[keys]))
+    return a[~mask].reset_index(drop=True)
+
+
+def _select(data: pd.DataFrame, filters: Mapping[str, list[Any]]) -> pd.DataFrame:
+    """Return the rows of `data` with values in `filters` for each column."""
+    mask = np.full(len(data), True)
+    for column, values in filters.items():
+        mask &= data[column].isin(values).to_numpy()
+    return data[mask]
+
+
+@contextmanager
+def _lock(path: Path, timeout: float = 10.0) -> Generator[None, Any, None]:
+    """Hold an exclusive lock on `path`, using a separate lock file."""
+    lock = path.with_name(f"{path.name}.lock")
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Could not lock {path} within {timeout} s; if no other process "
+                    f"is writing to it, delete {lock}"
+                ) from None
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        lock.unlink()
+
+
+def _ts_filters(
+    region: Sequence[str],
+    variable: Sequence[str],
+    unit: Sequence[str],
+    year: Sequence[int] | Sequence[str],
+) -> dict[str, list[Any]]:
+    """Return filters for time series data; empty sequences select all values."""
+    return {
+        dim: values
+        for dim, values in (
+            ("region", list(region)),
+            ("variable", list(variable)),
+            ("unit", list(unit)),
+            ("year", list(map(int, year))),
+        )
+        if len(values)
+    }
+
+
+@dataclass
+class _Item:
+    """Storage for one item of a Scenario."""
+
+    #: Type of the item: "set", "par", "equ", or "var".
+    ix_type: str
+    #: Index sets and names; both empty for an index set or a scalar.
+    idx_sets: list[str]
+    idx_names: list[str]
+    #: Elements. Key columns are :class:`pandas.Categorical`. An index set has one
+    #: key column with the same name as the set.
+    data: pd.DataFrame
+
+    @property
+    def keys(self) -> list[str]:
+        """Names of the key columns of :attr:`data`."""
+        return [c for c in self.data.columns if c not in VALUE_COLUMNS[self.ix_type]]
+
+
+@dataclass
+class _State:
+    """Contents of one TimeSeries or Scenario.
+
+    Data frames are never modified in place, but replaced, so that they can be shared
+    between the committed and checked-out states of a :class:`_Run`.
+    """
+
+    items: dict[str, _Item] = field(default_factory=dict)
+    #: Category mappings: set name → category → keys.
+    cat: dict[str, dict[str, list[str]]] = field(default_factory=dict)
+    timeseries: pd.DataFrame = field(default_factory=lambda: _empty_ts(float))
+    geo: pd.DataFrame = field(default_factory=lambda: _empty_ts(object))
+
+    def copy(self) -> "_State":
+        return _State(dict(self.items), deepcopy(self.cat), self.timeseries, self.geo)
+
+
+@dataclass
+class _Run:
+    """One version of a TimeSeries or Scenario."""
+
+    model: str
+    scenario: str
+    version: int
+    scheme: str | None
+    annotation: str
+    id: int
+    cre_user: str
+    cre_date: datetime
+    #: Committed contents.
+    committed: _State = field(default_factory=_State)
+    #: Contents modified since :meth:`.MemoryBackend.check_out`, or :obj:`None` if
+    #: checked in.
+    working: _State | None = None
+    timeseries_only: bool = False
+    upd_user: str | None = None
+    upd_date: datetime | None = None
+    lock_user: str | None = None
+    lock_date: datetime | None = None
+
+    @property
+    def state(self) -> _State:
+        """Current contents: checked out, if any, otherwise committed."""
+        return self.committed if self.working is None else self.working
+
+
+class MemoryBackend(CachingBackend):
+    """Backend storing data in memory using :mod:`pandas`.
+
+    MemoryBackend requires neither Java nor a database server. Item data are stored in
+    columns, with the key columns dictionary-encoded as :class:`pandas.Categorical`, so
+    that reading and writing whole items is fast. This makes MemoryBackend suited for
+    temporary scenarios, tests, and many variants of the same scenario, where database
+    storage is not needed.
+
+    Parameters
+    ----------
+    path : os.PathLike, optional
+        File for snapshots of the platform contents. If given and the file exists, the
+        contents are loaded from it. Committed contents are written to the file on each
+        :meth:`commit`, and on :meth:`close_db` if they changed. If not given, all data
+        are lost when the Platform is deleted.
+
+        Only one instance should write to a file at a time. Changes written by other
+        instances after the file is loaded are not visible, but are merged when the file
+        is next written, so they are not lost; see :meth:`_save`.
+    cache : bool, optional
+        If :obj:`True` (the default), cache item data returned by
+        :meth:`item_get_elements`.
+    """
+
+    # Limitations:
+    #
+    # - Files can be read and written only through the default implementations of
+    #   Backend.read_file() and .write_file(); GDX files are not supported, so
+    #   Scenarios cannot be solved using GAMSModel.
+    # - Snapshots are in pickle format, and should only be loaded from trusted files.
+
+    #: Mapping from ixmp.TimeSeries object to the stored :class:`_Run`.
+    index: MutableMapping[TimeSeries, _Run]
+
+    #: Number of times the snapshot file has been written, as of the last time it was
+    #: read or written by this instance.
+    _generation: int
+
+    #: Contents other than runs as of the last time the snapshot file was read or
+    #: written, to identify changes.
+    _saved: dict[str, Any]
+
+    #: For each run, the committed contents, ID, and update date as of the last time
+    #: the snapshot file was read or written.
+    _saved_runs: dict[tuple[str, str, int], tuple[_State, int, datetime | None]]
+
+    def __init__(
+        self, path: os.PathLike[str] | str | None = None, cache: bool = True
+    ) -> None:
+        super().__init__(cache_enabled=cache)
+
+        self.path = Path(path) if path else None
+        self.index = WeakKeyDictionary()
+
+        self._runs: dict[tuple[str, str, int], _Run] = {}
+        self._default: dict[tuple[str, str], int] = {}
+        self._meta: dict[tuple[str | None, str | None, int | None], dict[str, Any]] = {}
+        self._docs: dict[str, dict[str, str]] = {d: {} for d in DOC_DOMAINS}
+        self._model_names: dict[str, None] = {}
+        self._scenario_names: dict[str, None] = {}
+        self._nodes: dict[str, tuple[str, str | None, str | None, str]] = {
+            "World": ("World", None, "World", "common")
+        }
+        self._timeslices: dict[str, tuple[str, float]] = {"Year": ("Common", 1.0)}
+        self._units: dict[str, str] = dict.fromkeys(INIT_UNITS, "")
+        self._generation = 0
+        self._mark_saved()
+
+        if self.path and self.path.exists():
+            log.info(f"Load MemoryBackend snapshot from {self.path}")
+            self._load(self.path)
+
+    # Platform methods
+
+    @classmethod
+    def handle_config(
+        cls, args: Sequence[Any], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Handle platform/backend config arguments.
+
+        `args` may be empty, or contain a single path for snapshots; see
+        :class:`MemoryBackend`.
+        """
+        info = copy(kwargs)
+        if len(args) > 1:
+            raise ValueError(f"Unhandled positional args to MemoryBackend: {args!r}")
+        elif len(args):
+            info["path"] = Path(args[0]).resolve()
+        return info
+
+    def set_doc(
+        self, domain: str, docs: dict[str, str] | Iterable[tuple[str, str]]
+    ) -> None:
+        self._domain_docs(domain).update(docs)
+
+    def get_doc(self, domain: str, name: str | None = None) -> str | dict[str, str]:
+        docs = self._domain_docs(domain)
+        return dict(docs) if name is None else docs[name]
+
+    def close_db(self) -> None:
+        self._save()
+
+    def set_node(
+        self,
+        name: str,
+        parent: str | None = None,
+        hierarchy: str | None = None,
+        synonym: str | None = None,
+    ) -> None:
+        if synonym:
+            # `name` is an alias for the existing node `synonym`
+            _, _, parent, hierarchy = self._nodes[synonym]
+        self._nodes[name] = (name, synonym, parent, hierarchy or "")
+
+    def get_nodes(self) -> list[tuple[str, str | None, str | None, str]]:
+        return list(self._nodes.values())
+
+    def get_timeslices(self) -> Generator[tuple[str, str, float], Any, None]:
+        for name, (category, duration) in self._timeslices.items():
+            yield name, category, duration
+
+    def set_timeslice(self, name: str, category: str, duration: float) -> None:
+        self._timeslices[name] = (category, duration)
+
+    def add_model_name(self, name: str) -> None:
+        self._model_names[name] = None
+
+    def add_scenario_name(self, name: str) -> None:
+        self._scenario_names[name] = None
+
+    def get_model_names(self) -> list[str]:
+        return list(self._model_names)
+
+    def get_scenario_names(self) -> list[str]:
+        return list(self._scenario_names)
+
+    def get_scenarios(
+        self, default: bool, model: str | None, scenario: str | None
+    ) -> Generator[list[bool | int | str], Any, None]:
+        yield from self.filter_scenarios(default, model, scenario)
+
+    def filter_scenarios(
+        self,
+        default: bool,
+        model: str | None,
+        scenario: str | None,
+        *,
+        match: re.Pattern[str] | None = None,
+        locked: bool | None = None,
+    ) -> Generator[list[bool | int | str], Any, None]:
+        for (m, s, v), run in sorted(self._runs.items()):
+            is_default = self._default.get((m, s)) == v
+            if (model and m != model) or (scenario and s != scenario):
+                continue
+            elif default and not is_default:
+                continue
+            elif locked is not None and locked is (run.working is None):
+                continue
+            elif match and not (match.search(m) or match.search(s)):
+                continue
+            data: list[Any] = [
+                m,
+                s,
+                run.scheme,
+                is_default,
+                run.working is not None,
+                run.cre_user,
+                run.cre_date,
+                run.upd_user,
+                run.upd_date,
+                run.lock_user,
+                run.lock_date,
+                run.annotation,
+                v,
+            ]
+            yield data
+
+    def get_data_bulk(
+        self,
+        models: Sequence[str],
+        scenarios: Sequence[str],
+        region: Sequence[str],
+        variable: Sequence[str],
+        unit: Sequence[str],
+        year: Sequence[int],
+        default: bool,
+    ) -> Generator[tuple[str, str, int, str, str, str, str, int, float], Any, None]:
+        filters = _ts_filters(region, variable, unit, year)
+        for (m, s, v), run in sorted(self._runs.items()):
+            if (models and m not in models) or (scenarios and s not in scenarios):
+                continue
+            elif default and self._default.get((m, s)) != v:
+                continue
+            data = self._committed_timeseries(run, filters)
+            for row in data[list(FIELDS["ts_get"])].itertuples(index=False, name=None):
+                yield (m, s, v) + row
+
+    def set_unit(self, name: str, comment: str) -> None:
+        self._units[name] = comment
+
+    def get_units(self) -> list[str]:
+        return list(self._units)
+
+    # Methods for ixmp.TimeSeries
+
+    def init(self, ts: TimeSeries, annotation: str) -> None:
+        self.add_model_name(ts.model)
+        self.add_scenario_name(ts.scenario)
+
+        version = 1 + max(self._versions(ts.model, ts.scenario), default=0)
+        now, user = datetime.now(), getpass.getuser()
+        run = _Run(
+            model=ts.model,
+            scenario=ts.scenario,
+            version=version,
+            scheme=getattr(ts, "scheme", None),
+            annotation=annotation,
+            id=1 + max((r.id for r in self._runs.values()), default=0),
+            cre_user=user,
+            cre_date=now,
+            # A new TimeSeries is checked out
+            working=_State(),
+            lock_user=user,
+            lock_date=now,
+        )
+        self._runs[(ts.model, ts.scenario, version)] = run
+
+        self.index[ts] = run
+        ts.version = version
+
+    def get(self, ts: TimeSeries) -> None:
+        versions = self._versions(ts.model, ts.scenario)
+        if not versions:
+            raise ValueError(f"model={ts.model!r}, scenario={ts.scenario!r} not found")
+
+        version = ts.version
+        if version is None:
+            version = self._default.get((ts.model, ts.scenario), max(versions))
+
+        try:
+            run = self._runs[(ts.model, ts.scenario, int(version))]
+        except KeyError:
+            raise ValueError(
+                f"model={ts.model!r}, scenario={ts.scenario!r}, version={version} not "
+                "found"
+            ) from None
+
+        self.index[ts] = run
+        ts.version = run.version
+        if isinstance(ts, Scenario):
+            ts.scheme = run.scheme
+
+    def del_ts(self, ts: TimeSeries) -> None:
+        super().del_ts(ts)
+        self.index.pop(ts, None)
+
+    def check_out(self, ts: TimeSeries, timeseries_only: bool) -> None:
+        run = self._run(ts)
+        if run.working is not None:
+            raise RuntimeError(
+                f"This {type(ts).__name__} is currently locked by user {run.lock_user}"
+            )
+        run.working = run.committed.copy()
+        run.timeseries_only = timeseries_only
+        run.lock_user, run.lock_date = getpass.getuser(), datetime.now()
+
+    def commit(self, ts: TimeSeries, comment: str) -> None:
+        run = self.index[ts]
+        if run.working is None:
+            raise RuntimeError(
+                f"this {type(ts).__name__} is not checked out, no changes to be "
+                "committed!"
+            )
+        run.committed, run.working = run.working, None
+        run.upd_user, run.upd_date = getpass.getuser(), datetime.now()
+        run.lock_user = run.lock_date = None
+
+        self._save()
+
+    def discard_changes(self, ts: TimeSeries) -> None:
+        run = self.index[ts]
+        run.working = None
+        run.lock_user = run.lock_date = None
+        self.cache_invalidate(ts)
+
+    def set_as_default(self, ts: TimeSeries) -> None:
+        run = self.index[ts]
+        self._default[(run.model, run.scenario)] = run.version
+
+    def is_default(self, ts: TimeSeries) -> bool:
+        run = self.index[ts]
+        return self._default.get((run.model, run.scenario)) == run.version
+
+    def last_update(self, ts: TimeSeries) -> str | None:
+        upd_date = self.index[ts].upd_date
+        return None if upd_date is None else str(upd_date)
+
+    def run_id(self, ts: TimeSeries) -> int:
+        return self.index[ts].id
+
+    def get_data(
+        self,
+        ts: TimeSeries,
+        region: Sequence[str],
+        variable: Sequence[str],
+        unit: Sequence[str],
+        year: Sequence[int] | Sequence[str],
+    ) -> Generator[tuple[str, str, str, int, float], Any, None]:
+        data = _select(
+            self._run(ts).state.timeseries, _ts_filters(region, variable, unit, year)
+        )
+        yield from data[list(FIELDS["ts_get"])].itertuples(index=False, name=None)
+
+    def get_geo(
+        self, ts: TimeSeries
+    ) -> Generator[tuple[str, str, int, str, str, str, bool], Any, None]:
+        yield from self.get_geo_frame(ts).itertuples(index=False, name=None)
+
+    def get_geo_frame(self, ts: TimeSeries) -> pd.DataFrame:
+        return self._run(ts).state.geo[list(FIELDS["ts_get_geo"])].copy()
+
+    def set_data(
+        self,
+        ts: TimeSeries,
+        region: str,
+        variable: str,
+        data: dict[int, float],
+        unit: str,
+        subannual: str,
+        meta: bool,
+    ) -> None:
+        state = self._edit(ts, timeseries=True)
+        new = self._ts_frame(region, variable, unit, subannual, data, meta)
+        state.timeseries = _upsert(state.timeseries, new, TS_KEY, keep="last")
+
+    def set_data_frame(self, ts: TimeSeries, data: pd.DataFrame, meta: bool) -> None:
+        state = self._edit(ts, timeseries=True)
+        new = pd.DataFrame(
+            dict(
+                region=self._regions(data["region"]),
+                variable=data["variable"].astype(str).to_numpy(),
+                unit=data["unit"].astype(str).to_numpy(),
+                subannual=data["subannual"].astype(str).to_numpy(),
+                year=data["year"].to_numpy(dtype=int),
+                value=data["value"].to_numpy(dtype=float),
+                meta=bool(meta),
+            )
+        )
+        state.timeseries = _upsert(state.timeseries, new, TS_KEY, keep="last")
+
+    def set_geo(
+        self,
+        ts: TimeSeries,
+        region: str,
+        variable: str,
+        subannual: str,
+        year: int,
+        value: str,
+        unit: str,
+        meta: bool,
+    ) -> None:
+        state = self._edit(ts, timeseries=True)
+        new = self._ts_frame(region, variable, unit, subannual, {year: value}, meta)
+        state.geo = _upsert(state.geo, new, TS_KEY, keep="last")
+
+    def set_geo_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        state = self._edit(ts, timeseries=True)
+        new = pd.DataFrame(
+            dict(
+                region=self._regions(data["region"]),
+                variable=data["variable"].astype(str).to_numpy(),
+                unit=data["unit"].astype(str).to_numpy(),
+                subannual=data["subannual"].astype(str).to_numpy(),
+                year=data["year"].to_numpy(dtype=int),
+                value=data["value"].astype(str).to_numpy(),
+                meta=data["meta"].to_numpy(dtype=bool),
+            )
+        )
+        state.geo = _upsert(state.geo, new, TS_KEY, keep="last")
+
+    def delete(
+        self,
+        ts: TimeSeries,
+        region: str,
+        variable: str,
+        subannual: str,
+        years: Iterable[int],
+        unit: str,
+    ) -> None:
+        data = pd.DataFrame(
+            dict(region=region, variable=variable, unit=unit, subannual=subannual),
+            index=pd.Index(list(years), name="year"),
+        ).reset_index()
+        self.delete_frame(ts, data)
+
+    def delete_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        state = self._edit(ts, timeseries=True)
+        # Like JDBCBackend, data stored with meta=True is not removed
+        meta = state.timeseries["meta"].to_numpy(dtype=bool)
+        state.timeseries = pd.concat(
+            [
+                _anti_join(state.timeseries[~meta], self._ts_keys(data), TS_KEY),
+                state.timeseries[meta],
+            ],
+            ignore_index=True,
+        )
+
+    def delete_geo(
+        self,
+        ts: TimeSeries,
+        region: str,
+        variable: str,
+        subannual: str,
+        years: Iterable[int],
+        unit: str,
+    ) -> None:
+        state = self._edit(ts, timeseries=True)
+        data = pd.DataFrame(
+            dict(region=region, variable=variable, unit=unit, subannual=subannual),
+            index=pd.Index(list(years), name="year"),
+        ).reset_index()
+        state.geo = _anti_join(state.geo, self._ts_keys(data), TS_KEY)
+
+    def delete_geo_frame(self, ts: TimeSeries, data: pd.DataFrame) -> None:
+        state = self._edit(ts, timeseries=True)
+        state.geo = _anti_join(state.geo, self._ts_keys(data), TS_KEY)
+
+    # Methods for ixmp.Scenario
+
+    def clone(
+        self,
+        s: Scenario,
+        platform_dest: Platform,
+        model: str,
+        scenario: str,
+        annotation: str | None,
+        keep_solution: bool,
+        first_model_year: int | None = None,
+    ) -> Scenario:
+        if platform_dest._backend is not self:
+            # Use the generic implementation in ixmp.core.scenario
+            raise CrossPlatformClone(
+                f"Clone between {self.__class__} and {platform_dest._backend.__class__}"
+            )
+
+        source = self._run(s)
+        state = source.committed.copy()
+        if not keep_solution:
+            self._clear_solution(state, first_model_year)
+
+        self.add_model_name(model)
+        self.add_scenario_name(scenario)
+        version = 1 + max(self._versions(model, scenario), default=0)
+        self._runs[(model, scenario, version)] = _Run(
+            model=model,
+            scenario=scenario,
+            version=version,
+            scheme=source.scheme,
+            annotation=annotation or "",
+            id=1 + max((r.id for r in self._runs.values()), default=0),
+            cre_user=getpass.getuser(),
+            cre_date=datetime.now(),
+            committed=state,
+        )
+        # Like JDBCBackend, the first version cloned to new names becomes the default
+        self._default.setdefault((model, scenario), version)
+
+        # Copy metadata attached to this version
+        meta = self._meta.get((source.model, source.scenario, source.version))
+        if meta:
+            self._meta[(model, scenario, version)] = deepcopy(meta)
+
+        # Instantiate same class as the original object
+        return s.__class__(
+            platform_dest, model, scenario, version=version, scheme=source.scheme
+        )
+
+    def has_solution(self, s: Scenario) -> bool:
+        return any(
+            item.ix_type in ("equ", "var") and len(item.data)
+            for item in self._run(s).state.items.values()
+        )
+
+    def list_items(self, s: Scenario, type: str) -> list[str]:
+        items = self.index[s].state.items
+        return [name for name, item in items.items() if item.ix_type == type]
+
+    def init_item(
+        self,
+        s: Scenario,
+        type: str,
+        name: str,
+        idx_sets: Sequence[str],
+        idx_names: Sequence[str] | None,
+    ) -> None:
+        state = self._edit(s)
+        if name in state.items:
+            raise ValueError(f"{name!r} already exists")
+
+        _idx_names = list(idx_names or idx_sets)
+        if len(_idx_names) != len(idx_sets):
+            raise ValueError(
+                f"index names {_idx_names} and sets {list(idx_sets)} must have the same"
+                " length"
+            )
+        elif len(set(_idx_names)) < len(_idx_names):
+            raise ValueError(f"index names {_idx_names} must be unique")
+
+        for idx_set in idx_sets:
+            item = state.items.get(idx_set)
+            if item is None or item.ix_type != "set" or item.idx_sets:
+                raise ValueError(f"There exists no index set {idx_set!r}")
+
+        # An index set has a single key column with its own name
+        keys = [name] if (type == "set" and not idx_sets) else _idx_names
+        state.items[name] = _Item(type, list(idx_sets), _idx_names, _empty(type, keys))
+
+    def delete_item(
+        self, s: Scenario, type: Literal["set", "par", "equ"], name: str
+    ) -> None:
+        state = self._edit(s)
+        self._item(s, type, name)
+        del state.items[name]
+        self.cache_invalidate(s, type, name)
+
+    def item_index(
+        self, s: Scenario, name: str, sets_or_names: Literal["sets", "names"]
+    ) -> list[str]:
+        item = self._item(s, None, name, data=False)
+        return list(item.idx_sets if sets_or_names == "sets" else item.idx_names)
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["set"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "SetData": ...
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["par"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "ParData": ...
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["equ", "var"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "SolutionData": ...
+
+    def item_get_elements(
+        self, s: Scenario, ix_type: str, name: str, filters: "Filters" = None
+    ) -> "SetData | ParData | SolutionData":
+        item = self._item(s, ix_type, name)
+
+        # Decode the entire item, or retrieve it from the cache
+        try:
+            result = self.cache_get(s, ix_type, name, None)
+        except KeyError:
+            result = self._decode(item)
+            self.cache(s, ix_type, name, None, result)
+
+        if not filters:
+            return result
+
+        # Convert filter elements to strings
+        _filters = {dim: as_str_list(ele) for dim, ele in filters.items()}
+        if isinstance(result, pd.DataFrame):
+            return filtered(result, _filters).reset_index(drop=True)
+        elif isinstance(result, pd.Series) and name in _filters:
+            return result[result.isin(_filters[name])].reset_index(drop=True)
+        return result
+
+    def item_set_elements(
+        self,
+        s: Scenario,
+        type: type[Equation | Parameter | Set | Variable],
+        name: str,
+        elements: Iterable[tuple[Any, float | None, str | None, str | None]],
+    ) -> None:
+        item = self._item(s, type.ix_type, name)
+
+        # Keys as lists of str, and up to 2 value columns
+        keys: list[list[str]] = []
+        values: tuple[list[Any], list[Any]] = ([], [])
+        for key, *value, _ in elements:
+            keys.append([key] if isinstance(key, str) else as_str_list(key))
+            values[0].append(value[0])
+            values[1].append(value[1])
+
+        data = pd.DataFrame(keys, columns=item.keys, dtype=object)
+        for column, v in zip(VALUE_COLUMNS[item.ix_type], values):
+            data[column] = v
+
+        self._set_elements(s, name, item, data)
+
+    def item_set_elements_frame(
+        self,
+        s: Scenario,
+        type: type[Parameter | Set],
+        name: str,
+        data: pd.DataFrame,
+    ) -> None:
+        item = self._item(s, type.ix_type, name)
+
+        dims = [c for c in data.columns if c not in ("value", "unit", "comment")]
+        if len(dims) != len(item.keys):
+            raise ValueError(
+                f"{len(dims)} key columns {dims} for {name!r} with dimensions "
+                f"{item.keys}"
+            )
+
+        data = data.rename(columns=dict(zip(dims, item.keys)))
+        self._set_elements(s, name, item, data)
+
+    def item_delete_elements(
+        self,
+        s: Scenario,
+        type: Literal["par", "set"],
+        name: str,
+        keys: Iterable[Sequence[str]],
+    ) -> None:
+        state = self._edit(s)
+        item = self._item(s, type, name)
+
+        data = pd.DataFrame([as_str_list(k) for k in keys], columns=item.keys)
+        state.items[name] = replace(
+            item, data=_anti_join(item.data, data.astype(str), item.keys)
+        )
+
+        if type == "par" or item.idx_sets:
+            self.cache_invalidate(s, type, name)
+            return
+
+        # Also remove elements of other items indexed by the index set `name`
+        removed = data[name].astype(str).tolist()
+        for other_name, other in state.items.items():
+            mask = np.full(len(other.data), False)
+            for idx_set, idx_name in zip(other.idx_sets, other.idx_names):
+                if idx_set == name:
+                    mask |= other.data[idx_name].isin(removed).to_numpy()
+            if mask.any():
+                other_data = other.data[~mask].reset_index(drop=True)
+                state.items[other_name] = replace(other, data=other_data)
+
+        self.cache_invalidate(s)
+
+    def get_meta(
+        self,
+        model: str | None = None,
+        scenario: str | None = None,
+        version: int | None = None,
+        strict: bool = False,
+    ) -> dict[str, Any]:
+        target = self._meta_target(model, scenario, version)
+        if strict:
+            return deepcopy(self._meta.get(target, {}))
+
+        # Update with metadata from less to more specific targets
+        m, s, v = target
+        result: dict[str, Any] = {}
+        for t in dict.fromkeys(
+            [(None, s, None), (m, None, None), (m, s, None), target]
+        ):
+            result.update(deepcopy(self._meta.get(t, {})))
+        return result
+
+    def set_meta(
+        self,
+        meta: dict[str, bool | float | int | str],
+        model: str | None = None,
+        scenario: str | None = None,
+        version: int | None = None,
+    ) -> None:
+        target = self._meta_target(model, scenario, version)
+        if target[0] is not None and target[0] not in self._model_names:
+            raise ValueError(f"model {target[0]!r} does not exist")
+        elif target[1] is not None and target[1] not in self._scenario_names:
+            raise ValueError(f"scenario {target[1]!r} does not exist")
+        elif target[2] is not None and target not in self._runs:
+            raise ValueError(f"version {target[2]} does not exist")
+        for value in meta.values():
+            # Same types as JDBCBackend: scalars, or lists of scalars
+            values: Iterable[Any] = (
+                value if isinstance(value, (list, tuple)) else [value]  # type: ignore [unreachable]
+            )
+            if not all(isinstance(v, (Real, str)) for v in values):
+                raise ValueError(f"Cannot use value {value!r} as metadata")
+
+        # Each name can only be used on one kind of target
+        level = [x is None for x in target]
+        for t, existing in self._meta.items():
+            if [x is None for x in t] == level:
+                continue
+            for name in filter(existing.__contains__, meta):
+                m, s, v = ("null" if x is None else x for x in t)
+                raise ValueError(
+                    f"The meta category {name!r} is already used at another level: "
+                    f"model {m}, scenario {s}, version {v}"
+                )
+
+        self._meta.setdefault(target, {}).update(deepcopy(meta))
+
+    def remove_meta(
+        self,
+        names: list[str],
+        model: str | None = None,
+        scenario: str | None = None,
+        version: int | None = None,
+    ) -> None:
+        if names is None:
+            raise ValueError("No meta category names given")
+        existing = self._meta.get(self._meta_target(model, scenario, version), {})
+        for name in as_str_list(names):
+            existing.pop(name, None)
+
+    def clear_solution(self, s: Scenario, from_year: int | None = None) -> None:
+        if from_year and type(s) is not Scenario:
+            raise TypeError(
+                "s_clear_solution(from_year=...) only valid for ixmp.Scenario; not "
+                "subclasses"
+            )
+
+        self._clear_solution(self._run(s).state, from_year)
+        self.cache_invalidate(s)
+
+    # Methods for message_ix.Scenario
+
+    def cat_list(self, ms: Scenario, name: str) -> list[str]:
+        return list(self._run(ms).state.cat.get(name, {}))
+
+    def cat_get_elements(self, ms: Scenario, name: str, cat: str) -> list[str]:
+        return list(self._run(ms).state.cat.get(name, {}).get(cat, []))
+
+    def cat_set_elements(
+        self,
+        ms: Scenario,
+        name: str,
+        cat: str,
+        keys: str | Sequence[str],
+        is_unique: bool,
+    ) -> None:
+        state = self._edit(ms)
+        _keys = as_str_list(keys)
+        if is_unique and len(_keys) != 1:
+            raise ValueError(f"{len(_keys)} keys for unique category {cat!r}: {_keys}")
+
+        item = state.items.get(name)
+        if item is not None and not item.idx_sets:
+            missing = sorted(set(_keys) - set(item.data[name]))
+            if missing:
+                raise ValueError(f"The index set {name!r} does not have {missing}")
+
+        members = state.cat.setdefault(name, {}).setdefault(cat, [])
+        if is_unique:
+            members.clear()
+        members.extend(k for k in _keys if k not in members)
+
+    # Helpers; not part of the Backend interface
+
+    def _changed(self) -> bool:
+        """Return :obj:`True` if the contents changed since :meth:`_mark_saved`."""
+        return any(
+            getattr(self, name) != value for name, value in self._saved.items()
+        ) or any(
+            self._saved_runs.get(key, (None,))[0] is not run.committed
+            for key, run in self._runs.items()
+        )
+
+    @staticmethod
+    def _clear_solution(state: _State, from_year: int | None) -> None:
+        """Remove solution data and time series data not marked `meta` from `state`."""
+        for name, item in list(state.items.items()):
+            if item.ix_type in ("equ", "var"):
+                state.items[name] = replace(item, data=item.data.iloc[:0])
+
+        mask = ~state.timeseries["meta"]
+        if from_year:
+            mask &= state.timeseries["year"] >= from_year
+        state.timeseries = state.timeseries[~mask].reset_index(drop=True)
+
+    def _committed_timeseries(
+        self, run: _Run, filters: Mapping[str, list[Any]]
+    ) -> pd.DataFrame:
+        """Return committed time series data of `run` matching `filters`."""
+        return _select(run.committed.timeseries, filters)
+
+    def _decode(self, item: _Item) -> "SetData | ParData | SolutionData":
+        """Convert the data of `item` to the types returned by item_get_elements."""
+        data = item.data
+        if item.ix_type == "set" and not item.idx_sets:
+            # Index set
+            return data.iloc[:, 0].astype(STRING_DTYPE).rename(None)
+        elif not item.keys:
+            # Scalar equation, parameter, or variable
+            row = data.iloc[-1] if len(data) else None
+            if item.ix_type == "par":
+                return dict(
+                    value=np.nan if row is None else float(row["value"]),
+                    unit="" if row is None else str(row["unit"]),
+                )
+            return dict(
+                lvl=np.nan if row is None else float(row["lvl"]),
+                mrg=np.nan if row is None else float(row["mrg"]),
+            )
+
+        # Mapping set or multi-dimensional equation, parameter, or variable
+        columns = item.keys + (["unit"] if item.ix_type == "par" else [])
+        return data.astype(dict.fromkeys(columns, STRING_DTYPE))
+
+    def _domain_docs(self, domain: str) -> dict[str, str]:
+        """Return the documentation for `domain`."""
+        try:
+            return self._docs[domain]
+        except KeyError:
+            domains = ", ".join(self._docs)
+            raise ValueError(f"No such domain: {domain}, existing domains: {domains}")
+
+    def _edit(self, ts: TimeSeries, timeseries: bool = False) -> _State:
+        """Return the contents of `ts` for modification.
+
+        Raises
+        ------
+        RuntimeError
+            If `ts` is not checked out; or if `ts` is checked out with
+            ``timeseries_only=True`` and `timeseries` is :obj:`False`.
+        """
+        run = self._run(ts)
+        if run.working is None:
+            raise RuntimeError(
+                f"This {type(ts).__name__} cannot be edited, do a checkout first!"
+            )
+        elif run.timeseries_only and not timeseries:
+            raise RuntimeError(
+                f"This {type(ts).__name__} is checked out for time series data only"
+            )
+        return run.working
+
+    def _item(
+        self, s: Scenario, ix_type: str | None, name: str, data: bool = True
+    ) -> _Item:
+        """Return the item `name` of `s`.
+
+        If `data` is :obj:`False`, only the structure of the returned item is used, so
+        subclasses need not load its data.
+
+        Raises
+        ------
+        KeyError
+            If there is no item `name`, or its type is not `ix_type`.
+        """
+        run = self._run(s) if data else self.index[s]
+        item = run.state.items.get(name)
+        if item is None or ix_type not in (None, item.ix_type):
+            raise KeyError(name)
+        return item
+
+    def _load(self, path: Path) -> None:
+        """Set the contents from the snapshot file at `path`."""
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        for name in SNAPSHOT_ATTRS:
+            setattr(self, name, data[name])
+        self._generation = data.get("_generation", 0)
+        self._mark_saved()
+
+    def _mark_saved(self) -> None:
+        """Record the current contents as those of the snapshot file."""
+        self._saved = {
+            name: deepcopy(getattr(self, name))
+            for name in SNAPSHOT_ATTRS
+            if name != "_runs"
+        }
+        self._saved_runs = {
+            key: (run.committed, run.id, run.upd_date)
+            for key, run in self._runs.items()
+        }
+
+    def _merge(self, data: dict[str, Any], path: Path) -> None:
+        """Merge snapshot `data`, written to `path` by another instance.
+
+        Changes made by this instance since :meth:`_mark_saved` take precedence over
+        those in `data`. Runs added by this instance are given new IDs, if needed, so
+        that these are distinct from the IDs of runs in `data`.
+
+        Raises
+        ------
+        RuntimeError
+            if the same run was created or committed both by this instance and by the
+            other.
+        """
+        log.info(f"Merge changes to {path} by another {type(self).__name__}")
+
+        for name, base in self._saved.items():
+            local = getattr(self, name)
+            merged = dict(data[name])
+            for key in set(local) | set(base):
+                if key not in local:
+                    merged.pop(key, None)
+                elif key not in base or local[key] != base[key]:
+                    merged[key] = local[key]
+            setattr(self, name, merged)
+
+        for key, other in data["_runs"].items():
+            run, saved = self._runs.get(key), self._saved_runs.get(key)
+            if run is None:
+                self._runs[key] = other
+                self._merged_run(other, None)
+                continue
+            elif saved is not None and saved[1:] == (other.id, other.upd_date):
+                continue  # Not changed by the other instance
+            elif saved is None or saved[0] is not run.committed:
+                raise RuntimeError(
+                    f"model={key[0]!r}, scenario={key[1]!r}, version={key[2]} was "
+                    f"changed by this and another {type(self).__name__} using {path}"
+                )
+
+            # Update the existing object, which may be referenced by `index`
+            old_id = run.id
+            for f in fields(_Run):
+                if f.name not in ("working", "lock_user", "lock_date"):
+                    setattr(run, f.name, getattr(other, f.name))
+            self._merged_run(run, old_id)
+
+        # Allocate IDs for new runs from those in the file
+        ids = {run.id for run in data["_runs"].values()}
+        next_id = 1 + max((r.id for r in self._runs.values()), default=0)
+        for key, run in self._runs.items():
+            if key not in data["_runs"] and run.id in ids:
+                run.id, next_id = next_id, next_id + 1
+
+        self._generation = data.get("_generation", 0)
+
+    def _merged_run(self, run: _Run, old_id: int | None) -> None:
+        """Update after `run` is merged from a snapshot; see :meth:`_merge`.
+
+        `old_id` is the ID of an existing run, or :obj:`None` for a new run.
+        """
+        for ts in [ts for ts, r in self.index.items() if r is run]:
+            self.cache_invalidate(ts)
+
+    @staticmethod
+    def _meta_target(
+        model: str | None, scenario: str | None, version: int | None
+    ) -> tuple[str | None, str | None, int | None]:
+        """Validate and return a target for metadata."""
+        if (model or scenario) and (version is None or (model and scenario)):
+            return (
+                model or None,
+                scenario or None,
+                None if version is None else version,
+            )
+        raise ValueError(
+            "Invalid arguments. Valid combinations are: (model), (scenario), "
+            "(model, scenario), (model, scenario, version)"
+        )
+
+    def _run(self, ts: TimeSeries) -> _Run:
+        """Return the stored :class:`_Run` for `ts`, for access to its contents."""
+        return self.index[ts]
+
+    def _save(self) -> None:
+        """Write a snapshot of the committed contents, if any changed.
+
+        The snapshot file is locked while it is written. If another instance wrote to
+        it since it was last read or written by this instance, changes by both are
+        merged using :meth:`_merge`.
+        """
+        path = self._snapshot_path()
+        if path is None or not self._changed():
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _lock(path):
+            if path.exists():
+                with open(path, "rb") as f:
+                    data = pickle.load(f)
+                if data.get("_generation", 0) != self._generation:
+                    self._merge(data, path)
+
+            data = {name: getattr(self, name) for name in SNAPSHOT_ATTRS}
+            data.update(_runs=self._snapshot_runs(), _generation=self._generation + 1)
+
+            # Write to a temporary file, then replace, so that an existing snapshot is
+            # never left incomplete
+            tmp = path.with_name(f"{path.name}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(data, f)
+            tmp.replace(path)
+
+        self._generation += 1
+        self._mark_saved()
+
+    def _snapshot_path(self) -> Path | None:
+        """Return the path of the snapshot file, if any."""
+        return self.path
+
+    def _snapshot_runs(self) -> dict[tuple[str, str, int], _Run]:
+        """Return the runs to be stored in the snapshot file."""
+        return {
+            key: replace(run, working=None, lock_user=None, lock_date=None)
+            for key, run in self._runs.items()
+        }
+
+    def _set_elements(
+        self, s: Scenario, name: str, item: _Item, data: pd.DataFrame
+    ) -> None:
+        """Add `data` to `item`.
+
+        `data` has the key columns of `item`, and its value columns, if any.
+        """
+        state = self._edit(s)
+
+        columns: dict[str, Any] = {}
+        for key, idx_set in zip_longest(item.keys, item.idx_sets):
+            values = data[key].astype(str)
+            if idx_set is not None:
+                # Check that all keys are elements of the index set
+                missing = ~values.isin(state.items[idx_set].data[idx_set])
+                if missing.any():
+                    raise ValueError(
+                        f"The index set {idx_set!r} does not have an element "
+                        f"{values[missing].iloc[0]!r}!"
+                    )
+            columns[key] = _encode(values)
+
+        if item.ix_type == "par":
+            unit = data["unit"].astype(str)
+            missing = ~unit.isin(list(self._units))
+            if missing.any():
+                raise ValueError(
+                    f"The unit {unit[missing].iloc[0]!r} does not exist in the "
+                    "database!"
+                )
+            columns.update(
+                value=data["value"].to_numpy(dtype=float), unit=_encode(unit)
+            )
+        elif item.ix_type in ("equ", "var"):
+            columns.update(
+                lvl=data["lvl"].to_numpy(dtype=float),
+                mrg=data["mrg"].to_numpy(dtype=float),
+            )
+
+        # For sets, keep the position of existing elements; otherwise the last value
+        new = pd.DataFrame(columns, index=data.index).reset_index(drop=True)
+        keep: Literal["first", "last"] = "first" if item.ix_type == "set" else "last"
+        state.items[name] = replace(
+            item, data=_upsert(item.data, new, item.keys, keep=keep)
+        )
+        self.cache_invalidate(s, item.ix_type, name)
+
+    def _ts_frame(
+        self,
+        region: str,
+        variable: str,
+        unit: str,
+        subannual: str,
+        data: dict[int, Any],
+        meta: bool,
+    ) -> pd.DataFrame:
+        """Return a data frame with time series data or geodata."""
+        try:
+            # Resolve a region synonym
+            node = self._nodes[region]
+        except KeyError:
+            raise ValueError(f"region = {region}") from None
+
+        return pd.DataFrame(
+            dict(
+                region=node[1] or node[0],
+                variable=variable,
+                unit=unit,
+                subannual=subannual,
+                year=np.array(list(data), dtype=int),
+                value=list(data.values()),
+                meta=bool(meta),
+            )
+        )
+
+    def _regions(self, region: pd.Series) -> np.ndarray:
+        """Return `region` with synonyms resolved.
+
+        Raises
+        ------
+        ValueError
+            if any of `region` is not defined on the Platform.
+        """
+        region = region.astype(str)
+        if missing := sorted(set(region) - set(self._nodes)):
+            raise ValueError(f"region = {', '.join(missing)}")
+        nodes = {name: node[1] or node[0] for name, node in self._nodes.items()}
+        return region.map(nodes).to_numpy()
+
+    @staticmethod
+    def _ts_keys(data: pd.DataFrame) -> pd.DataFrame:
+        """Return the key columns of `data` with the same types as stored data."""
+        return data[TS_KEY].astype(dict.fromkeys(TS_KEY[:-1], str) | {"year": int})
+
+    def _versions(self, model: str, scenario: str) -> list[int]:
+        """Return all existing versions of (`model`, `scenario`)."""
+        return [v for (m, s, v) in self._runs if m == model and s == scenario]
@@ -0,0 +1,298 @@
+"""Backend storing data in Parquet files."""
+
+import logging
+import os
+from collections.abc import Generator, Mapping, Sequence
+from dataclasses import replace
+from functools import reduce
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ixmp.core.scenario import Scenario
+from ixmp.core.timeseries import TimeSeries
+from ixmp.util import as_str_list
+from ixmp.util.pandas import convert_dtype_backend
+
+from .common import FIELDS
+from .memory import MemoryBackend, _Item, _Run, _State, _ts_filters
+
+if TYPE_CHECKING:
+    from ixmp.types import Filters, ParData, SetData, SolutionData
+
+log = logging.getLogger(__name__)
+
+
+class ParquetBackend(MemoryBackend):
+    """Backend storing data in a directory of Parquet files.
+
+    ParquetBackend extends :class:`.MemoryBackend` to keep the committed contents of
+    each :class:`.TimeSeries` or :class:`.Scenario` in columnar files, one per item,
+    using :mod:`pyarrow`. It requires no database server, and the files can be read
+    directly by other tools, such as :mod:`pandas`, DuckDB, or Polars.
+
+    The directory at `path` contains:
+
+    - :file:`platform.pkl`: platform-level data (units, regions, metadata,
+      documentation) and the list of stored runs, with the structure of their items.
+    - :file:`run/{id}/item/{name}.parquet`: the data for one item.
+    - :file:`run/{id}/timeseries.parquet`, :file:`run/{id}/geo.parquet`: time series
+      data and geodata.
+
+    The contents of each run are read the first time they are accessed, so that opening
+    a platform with many scenarios is fast. If :meth:`item_get_elements` or
+    :meth:`get_data` are called with filters before then, only the matching rows are
+    read from the file. On :meth:`commit`, only items changed since the last write are
+    written.
+
+    Only one instance, in one process, should write to a directory at a time; any number
+    may read. Changes by other instances after :file:`platform.pkl` is read are not
+    visible. They are merged into :file:`platform.pkl` when it is next written, which
+    raises :class:`RuntimeError` if the same run was changed by both instances.
+
+    Parameters
+    ----------
+    path : os.PathLike
+        Directory for the Parquet files. Created if it does not exist.
+    cache : bool, optional
+        If :obj:`True` (the default), cache item data returned by
+        :meth:`item_get_elements`.
+    dtype_backend : "pyarrow", optional
+        If given, item data are read from files into :class:`pandas.ArrowDtype`
+        columns, without conversion to :mod:`numpy` arrays, and returned by
+        :meth:`item_get_elements` with :mod:`pyarrow`-backed dtypes. Use this together
+        with :py:`dtype_backend="pyarrow"` arguments to, for instance,
+        :meth:`.Scenario.par`.
+    """
+
+    #: Directory for the Parquet files.
+    path: Path
+
+    #: Dtype backend for item data; see :func:`.convert_dtype_backend`.
+    dtype_backend: Literal["pyarrow"] | None
+
+    #: Runs whose contents have not been read from file.
+    _unread: set[tuple[str, str, int]]
+
+    #: For each run ID, the data last written to or read from each file in its
+    #: directory.
+    _written: dict[int, dict[str, pd.DataFrame]]
+
+    def __init__(
+        self,
+        path: os.PathLike[str] | str,
+        cache: bool = True,
+        dtype_backend: Literal["pyarrow"] | None = None,
+    ) -> None:
+        super().__init__(cache=cache)
+
+        if dtype_backend not in (None, "pyarrow"):
+            raise ValueError(f"dtype_backend={dtype_backend!r}")
+
+        self.path = Path(path)
+        self.dtype_backend = dtype_backend
+        self._unread = set()
+        self._written = {}
+
+        if self.path.joinpath("platform.pkl").exists():
+            log.info(f"Load ParquetBackend platform from {self.path}")
+            self._load(self.path.joinpath("platform.pkl"))
+
+    # Methods for ixmp.TimeSeries
+
+    def get_data(
+        self,
+        ts: TimeSeries,
+        region: Sequence[str],
+        variable: Sequence[str],
+        unit: Sequence[str],
+        year: Sequence[int] | Sequence[str],
+    ) -> Generator[tuple[str, str, str, int, float], Any, None]:
+        run = self.index[ts]
+        if not self._is_unread(run):
+            yield from super().get_data(ts, region, variable, unit, year)
+            return
+
+        filters = _ts_filters(region, variable, unit, year)
+        data = self._read_file(run, "timeseries.parquet", filters)
+        yield from data[list(FIELDS["ts_get"])].itertuples(index=False, name=None)
+
+    # Methods for ixmp.Scenario
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["set"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "SetData": ...
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["par"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "ParData": ...
+
+    @overload
+    def item_get_elements(
+        self,
+        s: Scenario,
+        ix_type: Literal["equ", "var"],
+        name: str,
+        filters: "Filters" = None,
+    ) -> "SolutionData": ...
+
+    def item_get_elements(
+        self, s: Scenario, ix_type: str, name: str, filters: "Filters" = None
+    ) -> "SetData | ParData | SolutionData":
+        run = self.index[s]
+        item = run.committed.items.get(name)
+        if not (
+            filters
+            and self._is_unread(run)
+            and item
+            and item.keys
+            and set(filters) <= set(item.keys)
+        ):
+            return super().item_get_elements(s, ix_type, name, filters)  # type: ignore[call-overload,no-any-return]
+        elif ix_type != item.ix_type:
+            raise KeyError(name)
+
+        # Read only the rows matching `filters`
+        _filters = {dim: as_str_list(v) for dim, v in filters.items()}
+        data = self._read_file(run, self._item_file(name), _filters)
+        return self._decode(replace(item, data=data))
+
+    # Helpers; not part of the Backend interface
+
+    def _decode(self, item: _Item) -> "SetData | ParData | SolutionData":
+        # Keep or restore pyarrow-backed dtypes, for instance after elements are added
+        return convert_dtype_backend(super()._decode(item), self.dtype_backend)
+
+    def _committed_timeseries(
+        self, run: _Run, filters: Mapping[str, list[Any]]
+    ) -> pd.DataFrame:
+        if self._is_unread(run):
+            # Read only the rows matching `filters`
+            return self._read_file(run, "timeseries.parquet", dict(filters))
+        return super()._committed_timeseries(run, filters)
+
+    def _is_unread(self, run: _Run) -> bool:
+        """Return :obj:`True` if the contents of `run` have not been read from file."""
+        return (run.model, run.scenario, run.version) in self._unread
+
+    @staticmethod
+    def _item_file(name: str) -> str:
+        """Return the file name for the item `name`, relative to its run directory."""
+        return f"item/{quote(name, safe='')}.parquet"
+
+    def _load(self, path: Path) -> None:
+        super()._load(path)
+        self._unread = set(self._runs)
+
+    def _merged_run(self, run: _Run, old_id: int | None) -> None:
+        super()._merged_run(run, old_id)
+        # Contents are read from the files written by the other instance
+        self._unread.add((run.model, run.scenario, run.version))
+        self._written.pop(run.id, None)
+        if old_id is not None:
+            self._written.pop(old_id, None)
+
+    def _read(self, run: _Run) -> None:
+        """Read the committed contents of `run` from file."""
+        log.debug(f"Read {run.model}/{run.scenario}/{run.version} from {self.path}")
+
+        state = run.committed
+        for name, item in state.items.items():
+            state.items[name] = replace(
+                item, data=self._read_file(run, self._item_file(name))
+            )
+        state.timeseries = self._read_file(run, "timeseries.parquet")
+        state.geo = self._read_file(run, "geo.parquet")
+
+        self._written[run.id] = self._state_files(state)
+        self._unread.discard((run.model, run.scenario, run.version))
+
+    def _read_file(
+        self, run: _Run, name: str, filters: dict[str, list[Any]] | None = None
+    ) -> pd.DataFrame:
+        """Read the file `name` for `run`, optionally only rows matching `filters`."""
+        expr = [pc.field(dim).isin(values) for dim, values in (filters or {}).items()]
+        table = pq.read_table(
+            self.path.joinpath("run", str(run.id), name),
+            filters=reduce(lambda a, b: a & b, expr) if expr else None,
+        )
+        # Read item data directly into pyarrow-backed columns, if configured
+        arrow = self.dtype_backend == "pyarrow" and name.startswith("item/")
+        return cast(
+            pd.DataFrame, table.to_pandas(types_mapper=pd.ArrowDtype if arrow else None)
+        )
+
+    def _run(self, ts: TimeSeries) -> _Run:
+        run = self.index[ts]
+        if self._is_unread(run):
+            self._read(run)
+        return run
+
+    def _snapshot_path(self) -> Path:
+        return self.path.joinpath("platform.pkl")
+
+    def _snapshot_runs(self) -> dict[tuple[str, str, int], _Run]:
+        """Write changed contents to files in :attr:`path`, and return the runs.
+
+        The runs store the structure of each item, but not its data.
+        """
+        runs = {}
+        for key, run in self._runs.items():
+            if key not in self._unread:
+                self._write(run)
+            committed = _State(
+                items={
+                    name: replace(item, data=item.data.iloc[:0])
+                    for name, item in run.committed.items.items()
+                },
+                cat=run.committed.cat,
+            )
+            runs[key] = replace(
+                run, committed=committed, working=None, lock_user=None, lock_date=None
+            )
+        return runs
+
+    @classmethod
+    def _state_files(cls, state: _State) -> dict[str, pd.DataFrame]:
+        """Return the data to be stored in each file for `state`."""
+        result = {cls._item_file(name): item.data for name, item in state.items.items()}
+        result.update(
+            {"timeseries.parquet": state.timeseries, "geo.parquet": state.geo}
+        )
+        return result
+
+    def _write(self, run: _Run) -> None:
+        """Write the committed contents of `run` that changed since the last write."""
+        base = self.path.joinpath("run", str(run.id))
+        written = self._written.setdefault(run.id, {})
+        files = self._state_files(run.committed)
+
+        for name, df in files.items():
+            if written.get(name) is df:
+                continue  # Unchanged
+
+            path = base.joinpath(name)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.tmp")
+            df.to_parquet(tmp, index=False)
+            tmp.replace(path)
+            written[name] = df
+
+        # Remove files for deleted items
+        for name in set(written) - set(files):
+            base.joinpath(name).unlink(missing_ok=True)
+            written.pop(name)
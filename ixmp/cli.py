@@ -276,6 +276,7 @@ def import_group(context: dict[str, Any]) -> None:
 @import_group.command("timeseries")
 @click.option("--firstyear", type=int, help="First year of data to include.")
 @click.option("--lastyear", type=int, help="Final year of data to include.")
+@click.option("--chunksize", type=int, help="Number of rows to read at once.")
 @click.argument("file", type=click.Path(exists=True, dir_okay=False))
 @click.pass_obj
 def import_timeseries(
@@ -283,9 +284,20 @@ def import_timeseries(
     file: Path,
     firstyear: int | None,
     lastyear: int | None,
+    chunksize: int | None,
 ) -> None:
-    """Import time series data."""
-    context["scen"].read_file(Path(file), firstyear, lastyear)
+    """Import time series data.
+
+    FILE is read and stored in chunks, with progress shown after each chunk.
+    """
+
+    def progress(rows: int) -> None:
+        click.echo(f"Read {rows} rows from {file}")
+
+    try:
+        context["scen"].read_file(Path(file), firstyear, lastyear, chunksize, progress)
+    except ValueError as e:
+        raise click.ClickException(e.args[0])  # Show exception message to user
 
 
 @import_group.command("scenario")
@@ -474,12 +486,39 @@ def copy_platform(go: bool | None, name_source: str, name_dest: str) -> None:
 @click.option(
     "--default-only", is_flag=True, help="Only scenarios with a default version."
 )
+@click.option(
+    "--user",
+    metavar="USER",
+    default=None,
+    help="Only scenarios created/changed by USER.",
+)
+@click.option(
+    "--since",
+    metavar="DATE",
+    default=None,
+    help="Only scenarios created/changed at or after DATE. Not supported by ixmp4.",
+)
+@click.option(
+    "--until",
+    metavar="DATE",
+    default=None,
+    help="Only scenarios created/changed at or before DATE. Not supported by ixmp4.",
+)
+@click.option(
+    "--locked/--unlocked",
+    default=None,
+    help="Only scenarios that are (not) locked.",
+)
 @click.option("--as-url", is_flag=True, help="Display outputs as ixmp URLs.")
 @click.pass_obj
 def list_scenarios(
     context: dict[str, Any],
     match: Pattern[str] | None,
     default_only: bool,
+    user: str | None,
+    since: str | None,
+    until: str | None,
+    locked: bool | None,
     as_url: bool,
 ) -> None:
     """List scenarios on the --platform."""
@@ -499,6 +538,10 @@ def list_scenarios(
                 match=match,
                 default_only=default_only,
                 as_url=as_url,
+                user=user,
+                since=since,
+                until=until,
+                locked=locked,
             )
         )
     )
@@ -1,7 +1,10 @@
 import logging
+import re
 from collections.abc import Callable, Sequence
+from datetime import datetime
 from os import PathLike
-from typing import TYPE_CHECKING, Any, Literal, cast
+from time import monotonic
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, cast
 
 import numpy as np
 import pandas as pd
@@ -12,11 +15,13 @@ from typing_extensions import Unpack
 from ixmp._config import config
 from ixmp.backend.common import FIELDS, ItemType
 from ixmp.util import as_str_list
+from ixmp.util.pandas import convert_dtype_backend
 
 if TYPE_CHECKING:
     from ixmp.backend.ixmp4 import IXMP4Backend
     from ixmp.backend.jdbc import JDBCBackend
-    from ixmp.types import PlatformInitKwargs, WriteFilters
+    from ixmp.backend.memory import MemoryBackend
+    from ixmp.types import DtypeBackend, PlatformInitKwargs, WriteFilters
 
 
 log = logging.getLogger(__name__)
@@ -41,7 +46,8 @@ class Platform:
         Name of a specific :ref:`configured <configuration>` backend.
     backend
         Storage backend type. 'jdbc' corresponds to the built-in :class:`.JDBCBackend`;
-        see :func:`~.backend.get_class`.
+        'memory' to :class:`.MemoryBackend`; 'parquet' to :class:`.ParquetBackend`; see
+        :func:`~.backend.get_class`.
     backend_args
         Keyword arguments to specific to the `backend`. See :class:`.JDBCBackend`.
     """
@@ -49,7 +55,7 @@ class Platform:
     name: str
 
     # Storage back end for the platform
-    _backend: "JDBCBackend | IXMP4Backend"
+    _backend: "JDBCBackend | IXMP4Backend | MemoryBackend"
 
     # List of method names which are handled directly by the backend
     _backend_direct = [
@@ -68,10 +74,25 @@ class Platform:
 
     _units_to_warn_about: list[str] | None = None
 
+    #: Number of seconds for which results of :meth:`scenario_list` are cached. Set to
+    #: 0 to disable caching.
+    scenario_list_ttl: float = 5.0
+
+    # Number of changes to the list of TimeSeries made by this process, on any Platform.
+    # Used to invalidate cached results of scenario_list().
+    _scenario_list_changes: ClassVar[int] = 0
+
+    # Cached results of scenario_list(): (default, model, scen, match, locked) →
+    # (number of changes, time, data)
+    _scenario_list_cache: dict[
+        tuple[bool, str | None, str | None, re.Pattern[str] | None, bool | None],
+        tuple[int, float, pd.DataFrame],
+    ]
+
     def __init__(
         self,
         name: str | None = None,
-        backend: Literal["ixmp4", "jdbc"] | str | None = None,
+        backend: Literal["ixmp4", "jdbc", "memory", "parquet"] | str | None = None,
         **backend_args: Unpack["PlatformInitKwargs"],
     ) -> None:
         from ixmp.backend import get_class
@@ -94,6 +115,8 @@ class Platform:
         else:
             self.name = repr(backend_args)
 
+        self._scenario_list_cache = {}
+
         # Overwrite any platform config with explicit keyword arguments
         kwargs.update(backend_args)
 
@@ -115,6 +138,11 @@ class Platform:
         else:
             raise AttributeError(name)
 
+    @classmethod
+    def _scenario_list_changed(cls) -> None:
+        """Invalidate cached results of :meth:`scenario_list` on all Platforms."""
+        cls._scenario_list_changes += 1
+
     def set_log_level(self, level: str | int) -> None:
         """Set log level for the Platform and its storage :class:`.Backend`.
 
@@ -157,10 +185,29 @@ class Platform:
         return self._backend.get_log_level()
 
     def scenario_list(
-        self, default: bool = True, model: str | None = None, scen: str | None = None
+        self,
+        default: bool = True,
+        model: str | None = None,
+        scen: str | None = None,
+        *,
+        match: str | re.Pattern[str] | None = None,
+        user: str | None = None,
+        since: str | datetime | None = None,
+        until: str | datetime | None = None,
+        locked: bool | None = None,
     ) -> pd.DataFrame:
         """Return information about TimeSeries and Scenarios on the Platform.
 
+        The :class:`.Backend` may apply `match` and `locked` when retrieving the
+        information (see :meth:`.Backend.filter_scenarios`); other filters are applied
+        to the retrieved information.
+
+        Results are cached for :attr:`scenario_list_ttl` seconds. The cache is
+        invalidated when any TimeSeries is created, checked out, committed, or set as
+        default by the current process. Changes made by other processes, for instance
+        to the same database, are not detected: results may be up to
+        :attr:`scenario_list_ttl` seconds out of date.
+
         Parameters
         ----------
         default : bool, optional
@@ -171,6 +218,24 @@ class Platform:
             A model name. If given, only return information for *model*.
         scen : str, optional
             A scenario name. If given, only return information for *scen*.
+        match : str or re.Pattern, optional
+            Regular expression. If given, only return information where the model or
+            scenario name contains a match.
+        user : str, optional
+            If given, only return information for TimeSeries created or last modified
+            by `user`.
+        since : str or datetime, optional
+            If given, only return information for TimeSeries created or last modified
+            at or after this time.
+        until : str or datetime, optional
+            If given, only return information for TimeSeries created or last modified
+            at or before this time.
+
+            `since` and `until` require the :class:`.Backend` to record creation or
+            modification times; :class:`.IXMP4Backend` does not.
+        locked : bool, optional
+            If given, only return information for TimeSeries that are (:obj:`True`) or
+            are not (:obj:`False`) locked.
 
         Returns
         -------
@@ -188,11 +253,175 @@ class Platform:
               Scenario.
             - ``lock_user``, ``lock_date``—user that locked the Scenario and lock time.
             - ``annotation``: description of the Scenario or changelog.
+
+        Raises
+        ------
+        ValueError
+            if `since` or `until` is given, but the Backend provides no creation or
+            modification time for any of the TimeSeries.
         """
-        return pd.DataFrame(
-            self._backend.get_scenarios(default, model, scen),
-            columns=FIELDS["get_scenarios"],
+        expr = (re.compile(match) if isinstance(match, str) else match) or None
+
+        # Use cached results for the same filters, or for no `match` and `locked`
+        key = (default, model, scen, expr, locked)
+        for cached in map(
+            self._scenario_list_cache.get, (key, (default, model, scen, None, None))
+        ):
+            if (
+                cached
+                and cached[0] == Platform._scenario_list_changes
+                and monotonic() - cached[1] < self.scenario_list_ttl
+            ):
+                result = cached[2]
+                break
+        else:
+            result = pd.DataFrame(
+                self._backend.filter_scenarios(
+                    default, model, scen, match=expr, locked=locked
+                ),
+                columns=FIELDS["get_scenarios"],
+            )
+            if self.scenario_list_ttl > 0:
+                self._scenario_list_cache[key] = (
+                    Platform._scenario_list_changes,
+                    monotonic(),
+                    result,
+                )
+
+        mask = pd.Series(True, index=result.index)
+        if expr:
+            mask &= result["model"].str.contains(expr) | result[
+                "scenario"
+            ].str.contains(expr)
+        if user is not None:
+            mask &= (result["cre_user"] == user) | (result["upd_user"] == user)
+        if since is not None or until is not None:
+            # Time of last modification; or creation, if never modified
+            date = pd.to_datetime(result["upd_date"], errors="coerce").fillna(
+                pd.to_datetime(result["cre_date"], errors="coerce")
+            )
+            if len(date) and date.isna().all():
+                raise ValueError(
+                    f"{type(self._backend).__name__} provides no creation or "
+                    "modification times; cannot filter with since= or until="
+                )
+            if since is not None:
+                mask &= date >= pd.Timestamp(since)
+            if until is not None:
+                mask &= date <= pd.Timestamp(until)
+        if locked is not None:
+            mask &= result["is_locked"].astype(bool) == locked
+
+        return result[mask].reset_index(drop=True)
+
+    def get_meta_frame(
+        self,
+        models: str | Sequence[str] | None = None,
+        scenarios: str | Sequence[str] | None = None,
+        names: str | Sequence[str] | None = None,
+        default: bool = True,
+    ) -> pd.DataFrame:
+        """Return metadata attached to many TimeSeries and Scenarios on the Platform.
+
+        Only metadata attached to specific (model, scenario, version) targets is
+        included; see :ref:`data-meta`. Compared to calling :meth:`.TimeSeries.get_meta`
+        for each of many TimeSeries, this uses fewer calls to the storage
+        :class:`.Backend`.
+
+        Parameters
+        ----------
+        models : str or sequence of str, optional
+            Only return metadata for these model name(s).
+        scenarios : str or sequence of str, optional
+            Only return metadata for these scenario name(s).
+        names : str or sequence of str, optional
+            Only return metadata with these name(s)/identifier(s).
+        default : bool, optional
+            Return *only* metadata for the default version of each TimeSeries/Scenario.
+            If :obj:`False`, return metadata for all versions.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            with columns ``model``, ``scenario``, and ``version``, and one column for
+            each metadata name, in sorted order. There is one row for each TimeSeries
+            with at least one matching metadata value. Values for metadata not set on a
+            TimeSeries are missing.
+        """
+        idx = list(FIELDS["get_meta_bulk"][:3])
+        data = pd.DataFrame(
+            self._backend.get_meta_bulk(
+                as_str_list(models),
+                as_str_list(scenarios),
+                as_str_list(names),
+                default,
+            ),
+            columns=FIELDS["get_meta_bulk"],
+        )
+        return (
+            data.pivot(index=idx, columns="name", values="value")
+            .rename_axis(columns=None)
+            .infer_objects()
+            .reset_index()
+        )
+
+    def timeseries(
+        self,
+        models: str | Sequence[str] | None = None,
+        scenarios: str | Sequence[str] | None = None,
+        variables: str | Sequence[str] | None = None,
+        regions: str | Sequence[str] | None = None,
+        units: str | Sequence[str] | None = None,
+        years: int | Sequence[int] | None = None,
+        default: bool = True,
+        dtype_backend: "DtypeBackend | None" = None,
+    ) -> pd.DataFrame:
+        """Return time series data from many TimeSeries and Scenarios on the Platform.
+
+        Compared to calling :meth:`.TimeSeries.timeseries` for each of many TimeSeries,
+        this does not require creating TimeSeries objects, and uses fewer calls to the
+        storage :class:`.Backend`.
+
+        Parameters
+        ----------
+        models : str or sequence of str, optional
+            Only return data for these model name(s).
+        scenarios : str or sequence of str, optional
+            Only return data for these scenario name(s).
+        variables : str or sequence of str, optional
+            Only return data for these variable(s).
+        regions : str or sequence of str, optional
+            Only return data for these region(s).
+        units : str or sequence of str, optional
+            Only return data with these unit(s).
+        years : int or sequence of int, optional
+            Only return data for these year(s).
+        default : bool, optional
+            Return *only* data for the default version of each TimeSeries/Scenario. If
+            :obj:`False`, return data for all versions.
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            in long format, with columns ``model``, ``scenario``, ``version``,
+            ``region``, ``variable``, ``unit``, ``subannual``, ``year``, and ``value``.
+        """
+        data = pd.DataFrame(
+            self._backend.get_data_bulk(
+                as_str_list(models),
+                as_str_list(scenarios),
+                as_str_list(regions),
+                as_str_list(variables),
+                as_str_list(units),
+                [] if years is None else [years] if isinstance(years, int) else years,
+                default,
+            ),
+            columns=FIELDS["get_data_bulk"],
         )
+        return convert_dtype_backend(data, dtype_backend)
 
     def export_timeseries_data(
         self,
@@ -0,0 +1,175 @@
+"""Registry of :class:`.Platform` and :class:`.TimeSeries` objects, keyed by URL."""
+
+import logging
+from collections import OrderedDict
+from threading import RLock
+from typing import TYPE_CHECKING, TypeVar
+from weakref import WeakValueDictionary
+
+from ixmp._config import config
+from ixmp.core.platform import Platform
+from ixmp.util import parse_url
+
+if TYPE_CHECKING:
+    from ixmp.core.timeseries import TimeSeries
+
+log = logging.getLogger(__name__)
+
+TS = TypeVar("TS", bound="TimeSeries")
+
+
+class Registry:
+    """Registry of :class:`.Platform` and :class:`.TimeSeries` objects.
+
+    :meth:`get` returns the same object for repeated calls with the same URL, as long
+    as that object is alive. Objects are kept alive while they are referenced by user
+    code, or while they are among the `maxsize` most recently retrieved. Objects
+    retrieved from the registry on the same platform share one :class:`.Platform`
+    instance, thus one storage :class:`.Backend` and its cache.
+
+    Use :meth:`add` to register an existing Platform or TimeSeries, so that these are
+    returned instead of new objects. The registry does not create platforms using
+    :class:`.MemoryBackend` or :class:`.ParquetBackend`, because these cannot share
+    storage safely with other Platform instances; such platforms must be added.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Number of most recently retrieved TimeSeries objects (with their platforms) to
+        keep alive, even if they are not otherwise referenced.
+    """
+
+    #: Number of most recently retrieved TimeSeries to keep alive.
+    maxsize: int
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self._lock = RLock()
+        self._platforms: WeakValueDictionary[str | None, Platform] = (
+            WeakValueDictionary()
+        )
+        self._ts: WeakValueDictionary[tuple[type, str], "TimeSeries"] = (
+            WeakValueDictionary()
+        )
+        self._recent: OrderedDict[tuple[type, str], tuple["TimeSeries", Platform]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._ts)
+
+    def clear(self) -> None:
+        """Remove all objects from the registry."""
+        with self._lock:
+            self._recent.clear()
+            self._ts.clear()
+            self._platforms.clear()
+
+    def add(self, mp: Platform, *ts: "TimeSeries") -> None:
+        """Add an existing :class:`.Platform`, and optionally TimeSeries stored on it.
+
+        Each of `ts` is registered with its version, and is returned by :meth:`get` for
+        URLs with that version.
+
+        Raises
+        ------
+        ValueError
+            if a different Platform is already registered with the same name, or any of
+            `ts` is not stored on `mp`.
+        """
+        with self._lock:
+            existing = self._platforms.get(mp.name)
+            if existing not in (None, mp):
+                raise ValueError(
+                    f"A different Platform named {mp.name!r} is already registered"
+                )
+            self._platforms[mp.name] = mp
+
+            for obj in ts:
+                if obj.platform._backend is not mp._backend:
+                    raise ValueError(f"{obj!r} is not stored on {mp!r}")
+                key = (type(obj), f"ixmp://{mp.name}/{obj.url}")
+                self._ts[key] = obj
+                self._touch(key, obj, mp)
+
+    def platform(self, name: str | None = None) -> Platform:
+        """Return a :class:`.Platform` given its `name`.
+
+        If `name` is :obj:`None`, the default platform is returned.
+
+        Raises
+        ------
+        ValueError
+            if the platform is not registered, and uses :class:`.MemoryBackend` or
+            :class:`.ParquetBackend`; see :meth:`add`.
+        """
+        from ixmp.backend import get_class
+        from ixmp.backend.memory import MemoryBackend
+
+        with self._lock:
+            mp = self._platforms.get(name)
+            if mp is None:
+                _name, info = config.get_platform_info(name or "default")
+                mp = self._platforms.get(_name)
+            if mp is None:
+                if issubclass(get_class(info["class"]), MemoryBackend):
+                    raise ValueError(
+                        f"Platform {_name!r} uses {info['class']!r} storage, which "
+                        "cannot be shared safely by two Platform instances; use "
+                        "Registry.add() to register an existing Platform"
+                    )
+                mp = Platform(name)
+                self._platforms[mp.name] = mp
+            self._platforms[name] = mp
+            return mp
+
+    def get(self, url: str, cls: type[TS]) -> TS:
+        """Return a :class:`.TimeSeries` or subclass instance given its `url`.
+
+        Parameters
+        ----------
+        url : str
+            See :func:`.parse_url`. URLs without a platform name refer to the default
+            platform. URLs without a version refer to the default version at the time
+            of the first call; the same object is returned until it is discarded.
+        cls : type
+            :class:`.TimeSeries` or a subclass, for instance :class:`.Scenario`.
+
+        Raises
+        ------
+        ValueError
+            if the version in `url` is "new".
+        """
+        platform_info, scenario_info = parse_url(url)
+        if scenario_info.get("version") == "new":
+            raise ValueError(f"Cannot retrieve version 'new' from registry: {url!r}")
+
+        with self._lock:
+            mp = self.platform(platform_info.get("name"))
+            version = scenario_info.get("version")
+            key = (
+                cls,
+                f"ixmp://{mp.name}/{scenario_info['model']}/{scenario_info['scenario']}"
+                + ("" if version is None else f"#{version}"),
+            )
+
+            ts = self._ts.get(key)
+            if not isinstance(ts, cls):
+                log.debug(f"Load {cls.__name__} from {key[1]!r}")
+                ts = cls(mp, **scenario_info)
+                self._ts[key] = ts
+
+            self._touch(key, ts, mp)
+            return ts
+
+    def _touch(self, key: tuple[type, str], ts: "TimeSeries", mp: Platform) -> None:
+        """Mark `ts` as most recently used; discard the least recently used."""
+        self._recent[key] = (ts, mp)
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+
+
+#: Process-wide registry used by :meth:`.TimeSeries.from_url` and
+#: :func:`.report.operator.from_url`.
+REGISTRY = Registry()
@@ -7,26 +7,31 @@ from collections.abc import (
     Sequence,
 )
 from functools import partialmethod
-from itertools import zip_longest
+from itertools import repeat, zip_longest
 from os import PathLike
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, overload
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 # TODO Import from typing when dropping support for Python 3.11
 from typing_extensions import Unpack
 
-from ixmp.backend.common import CrossPlatformClone, ItemType
+from ixmp.backend.common import ITEM_CHUNKSIZE, CrossPlatformClone, ItemType
 from ixmp.core.item import Equation, Parameter, Set, Variable
 from ixmp.core.platform import Platform
 from ixmp.core.timeseries import TimeSeries
 from ixmp.util import as_str_list, check_year
 from ixmp.util.ixmp4 import is_ixmp4backend
+from ixmp.util.pandas import convert_dtype_backend
 
 if TYPE_CHECKING:
+    import xarray as xr
+
     from ixmp.types import (
+        DtypeBackend,
         Filters,
         ModelItemType,
         ParData,
@@ -53,6 +58,10 @@ class Scenario(TimeSeries):
         Use an explicit scheme to initialize the new scenario. The
         :meth:`~.base.Model.initialize` method of the corresponding :class:`.Model`
         class in :data:`.MODELS` is used to initialize items in the Scenario.
+    lazy : bool, optional
+        If :obj:`True`, do not retrieve the Scenario from the :class:`.Backend` until
+        its data is first accessed. Model initialization, and the check of
+        :attr:`scheme`, also happen at that time. See :class:`.TimeSeries`.
     cache:
         .. deprecated:: 3.0
            The `cache` keyword argument to :class:`.Scenario` has no effect and raises a
@@ -65,6 +74,10 @@ class Scenario(TimeSeries):
     #: Scheme of the Scenario.
     scheme: str | None = None
 
+    #: Keyword arguments to :meth:`.Model.initialize`, stored until first access if
+    #: ``lazy=True``.
+    _model_init_args: "ScenarioInitKwargs"
+
     def __init__(
         self,
         mp: Platform,
@@ -73,10 +86,9 @@ class Scenario(TimeSeries):
         version: "VersionType" = None,
         scheme: str | None = None,
         annotation: str | None = None,
+        lazy: bool = False,
         **model_init_args: Unpack["ScenarioInitKwargs"],
     ) -> None:
-        from ixmp.model import get_model
-
         # Check arguments
         if version == "new" and scheme is None:
             log.info(f"No scheme for new Scenario {model}/{scenario}")
@@ -97,12 +109,31 @@ class Scenario(TimeSeries):
             version=version,
             scheme=scheme,
             annotation=annotation,
+            lazy=lazy,
         )
 
+        if lazy:
+            # Defer to _load()
+            self._model_init_args = model_init_args
+            return
+
+        self._initialize(model_init_args)
+
+        if is_ixmp4backend(self.platform._backend) and version == "new":
+            run = self.platform._backend.index[self]
+
+            # NOTE initialize() may call commit() or so which unlocks the underlying Run
+            if not run.owns_lock:
+                run._lock()
+
+    def _initialize(self, model_init_args: "ScenarioInitKwargs") -> None:
+        """Check :attr:`scheme` and initialize the Scenario using its Model class."""
+        from ixmp.model import get_model
+
         if self.scheme == "MESSAGE" and self.__class__ is Scenario:
             # Loaded scenario has an improper scheme
             raise RuntimeError(
-                f"{model}/{scenario} is a MESSAGE-scheme scenario; use "
+                f"{self.model}/{self.scenario} is a MESSAGE-scheme scenario; use "
                 "message_ix.Scenario()"
             )
 
@@ -114,12 +145,13 @@ class Scenario(TimeSeries):
         # is removed above?
         model_class.initialize(self, **model_init_args)  # type: ignore[misc]
 
-        if is_ixmp4backend(self.platform._backend) and version == "new":
-            run = self.platform._backend.index[self]
-
-            # NOTE initialize() may call commit() or so which unlocks the underlying Run
-            if not run.owns_lock:
-                run._lock()
+    def _load(self) -> None:
+        super()._load()
+        try:
+            self._initialize(self._model_init_args)
+        except Exception:
+            self._lazy = True
+            raise
 
     def check_out(self, timeseries_only: bool = False) -> None:
         """Check out the Scenario.
@@ -197,7 +229,12 @@ class Scenario(TimeSeries):
         else:
             return [str(key_or_keys)]
 
-    def set(self, name: str, filters: "Filters" = None) -> "SetData":
+    def set(
+        self,
+        name: str,
+        filters: "Filters" = None,
+        dtype_backend: "DtypeBackend | None" = None,
+    ) -> "SetData":
         """Return the (filtered) elements of a set.
 
         Parameters
@@ -208,12 +245,19 @@ class Scenario(TimeSeries):
             Mapping of `dimension_name` → `elements`, where `dimension_name` is one of
             the `idx_names` given when the set was initialized (see :meth:`init_set`),
             and `elements` is an iterable of labels to include in the return value.
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
 
         Returns
         -------
         :class:`pandas.DataFrame`
         """
-        return self.platform._backend.item_get_elements(self, "set", name, filters)
+        self._flush_writes()
+        return convert_dtype_backend(
+            self.platform._backend.item_get_elements(self, "set", name, filters),
+            dtype_backend,
+        )
 
     # FIXME reduce complexity 18 → ≤13
     def add_set(  # noqa: C901
@@ -276,16 +320,11 @@ class Scenario(TimeSeries):
             # Ensure keys is a list of str
             keys.extend(as_str_list(key))
         elif isinstance(key, pd.DataFrame):
-            # DataFrame of key values and perhaps comments
-            try:
-                # Pop a 'comment' column off the DataFrame, convert to list
-                comments.extend(key.pop("comment"))
-            except KeyError:
-                pass
-
-            # Convert key to list of list of key values
-            for row in key.to_dict(orient="records"):
-                keys.append(as_str_list(row, idx_names=idx_names))
+            # DataFrame of key values and perhaps comments. Validate and convert
+            # column-wise, and send to backend without forming per-element objects
+            data = self._set_frame(name, idx_names, key, comment)
+            self._set_elements_frame(Set, name, data)
+            return
         elif isinstance(key, dict):
             # Dict of lists of key values
 
@@ -342,9 +381,44 @@ class Scenario(TimeSeries):
             assert not isinstance(k, tuple) and not isinstance(c, tuple)
             elements.append((k, None, None, c))
 
-        # Send to backend
+        # Send to backend, after any buffered data
+        self._flush_writes()
         self.platform._backend.item_set_elements(self, Set, name, elements)
 
+    @staticmethod
+    def _set_frame(
+        name: str,
+        idx_names: list[str],
+        key: pd.DataFrame,
+        comment: str | Sequence[str] | None,
+    ) -> pd.DataFrame:
+        """Validate `key` and `comment` for :meth:`add_set`; return a data frame.
+
+        The result has one :class:`str` column for each of `idx_names` and, if there are
+        any comments, a column 'comment'.
+        """
+        if missing := [i for i in idx_names if i not in key.columns]:
+            raise KeyError(
+                f"no column(s) {missing} for {len(idx_names)}-D set {name}{idx_names!r}"
+            )
+
+        # Select and convert key columns once; this also avoids modifying `key`
+        data = key[idx_names].astype(str)
+
+        if "comment" in key.columns:
+            data["comment"] = key["comment"]
+        elif comment is not None:
+            comments = [comment] if isinstance(comment, str) else list(comment)
+            N = len(data)
+            if len(comments) > N:
+                raise ValueError(f"Comment {comments[N]!r} without matching key")
+            elif len(comments) < N:
+                k = data.iloc[len(comments)].tolist()
+                raise ValueError(f"Key {k!r} without matching comment")
+            data["comment"] = comments
+
+        return data
+
     def remove_set(
         self,
         name: str,
@@ -360,6 +434,7 @@ class Scenario(TimeSeries):
         key : :class:`pandas.DataFrame` or list of str, optional
             Elements to be removed from set `name`.
         """
+        self._flush_writes()
         if key is None:
             self.platform._backend.delete_item(self, "set", name)
         else:
@@ -367,7 +442,46 @@ class Scenario(TimeSeries):
                 self, "set", name, self._keys(name, key)
             )
 
-    def par(self, name: str, filters: "Filters" = None, **kwargs: Any) -> "ParData":
+    def add_categories(
+        self, name: str, data: pd.DataFrame, is_unique: bool = False
+    ) -> None:
+        """Add elements to many categories of the category mapping `name` at once.
+
+        This is equivalent to calling :meth:`message_ix.Scenario.add_cat` once for each
+        category in `data`, but allows the :class:`.Backend` to store all the mappings
+        in fewer operations.
+
+        Parameters
+        ----------
+        name : str
+            Name of the set for which categories are defined, e.g. "technology".
+        data : pandas.DataFrame
+            Data frame with columns 'key' and 'category'. Each row maps one element of
+            `name` to one category.
+        is_unique : bool, optional
+            If :obj:`True`, each category in `data` must appear exactly once, and any
+            existing member of that category is replaced.
+
+        Raises
+        ------
+        ValueError
+            If `data` is missing the 'key' or 'category' column.
+        """
+        if missing := sorted({"key", "category"} - set(data.columns)):
+            raise ValueError(f"missing required columns {missing!r}")
+
+        self._flush_writes()
+        self.platform._backend.cat_set_elements_frame(
+            self, name, data[["key", "category"]], is_unique
+        )
+
+    def par(
+        self,
+        name: str,
+        filters: "Filters" = None,
+        dtype_backend: "DtypeBackend | None" = None,
+        **kwargs: Any,
+    ) -> "ParData":
         """Return parameter data.
 
         If `filters` is provided, only a subset of data, matching the filters, is
@@ -380,13 +494,79 @@ class Scenario(TimeSeries):
         filters : dict, optional
             Keys are index names. Values are lists of index set elements. Elements not
             appearing in the respective index set(s) are silently ignored.
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
         """
         if len(kwargs):
             warn(
                 "ignored kwargs to Scenario.par(); will raise TypeError in 4.0",
                 DeprecationWarning,
             )
-        return self.platform._backend.item_get_elements(self, "par", name, filters)
+        self._flush_writes()
+        return convert_dtype_backend(
+            self.platform._backend.item_get_elements(self, "par", name, filters),
+            dtype_backend,
+        )
+
+    def par_array(self, name: str, fill_value: float = np.nan) -> "xr.DataArray":
+        """Return parameter data as a dense array.
+
+        The array has one dimension for each index name of parameter `name`. The
+        coordinates along each dimension are the elements of the respective index set,
+        in the same order as returned by :meth:`set`. Use
+        :meth:`~xarray.DataArray.to_numpy` to obtain a :class:`numpy.ndarray`.
+
+        This is faster than pivoting the data from :meth:`par`, and uses less memory.
+
+        Parameters
+        ----------
+        name : str
+            Name of the parameter.
+        fill_value : float, optional
+            Value for combinations of index set elements with no parameter data.
+
+        Returns
+        -------
+        xarray.DataArray
+            Units are not included. For a scalar parameter, a 0-dimensional array.
+
+        Raises
+        ------
+        ValueError
+            If the data contain labels that are not elements of the respective index
+            set, for instance because they have a different type.
+        """
+        import xarray as xr
+
+        data = self.par(name)
+        if isinstance(data, dict):
+            return xr.DataArray(data["value"], name=name)  # Scalar parameter
+
+        coords: dict[str, pd.Index] = {}
+        codes = []
+        # Index columns precede "value" and "unit"; this avoids a call to idx_names()
+        for idx_name, idx_set in zip(data.columns, self.idx_sets(name)):
+            elements = self.set(idx_set)
+            # Index set elements; or, for a dimension indexed by a mapping set, the
+            # distinct values appearing in the data
+            coords[idx_name] = pd.Index(
+                elements if isinstance(elements, pd.Series) else data[idx_name].unique()
+            )
+            # Integer position of each label along this dimension
+            codes.append(coords[idx_name].get_indexer(pd.Index(data[idx_name])))
+            if (codes[-1] < 0).any():
+                missing = sorted(set(data[idx_name][codes[-1] < 0]), key=str)
+                raise ValueError(
+                    f"Labels {missing!r} for dimension {idx_name!r} of {name!r} are "
+                    f"not elements of the set {idx_set!r}"
+                )
+
+        # Assign values by position, without forming a pandas.MultiIndex
+        values = np.full([len(c) for c in coords.values()], fill_value)
+        values[tuple(codes)] = data["value"].to_numpy()
+
+        return xr.DataArray(values, coords=coords, dims=list(coords), name=name)
 
     def items(
         self,
@@ -530,6 +710,151 @@ class Scenario(TimeSeries):
 
             yield (name, data_function(name, _filters))
 
+    def get_items(
+        self, names: Iterable[str], filters: "Filters" = None
+    ) -> dict[str, "ParData | SetData | SolutionData"]:
+        """Return data for several items at once.
+
+        This is equivalent to calling :meth:`set`, :meth:`par`, :meth:`var`, or
+        :meth:`equ` for each of `names`, but may be faster, because the data for all
+        items can be retrieved from the backend with fewer operations.
+
+        Parameters
+        ----------
+        names : iterable of str
+            Names of items of any type.
+        filters : dict, optional
+            Keys are index names. Values are lists of index set elements. For each item,
+            only the filters for its own index names are applied; items with none of
+            these index names are returned unfiltered.
+
+        Returns
+        -------
+        dict
+            Mapping from each of `names` to the item's data, in the same order.
+
+        Raises
+        ------
+        KeyError
+            If any of `names` is not an item in the Scenario.
+        """
+        self._flush_writes()
+        return self.platform._backend.item_get_elements_batch(
+            self, self._ix_types(names), filters
+        )
+
+    def iter_chunks(
+        self, name: str, chunksize: int = ITEM_CHUNKSIZE, filters: "Filters" = None
+    ) -> Iterator["ParData | SetData | SolutionData"]:
+        """Iterate over the data of item `name` in chunks of bounded size.
+
+        Use this instead of :meth:`set`, :meth:`par`, :meth:`var`, or :meth:`equ` to
+        process items with many elements, without holding all the data in memory at
+        once.
+
+        Parameters
+        ----------
+        name : str
+            Name of an item of any type.
+        chunksize : int, optional
+            Maximum number of elements (rows) in each chunk. Default
+            :data:`.ITEM_CHUNKSIZE`.
+        filters : dict, optional
+            Keys are index names. Values are lists of index set elements.
+
+        Yields
+        ------
+        pandas.DataFrame or pandas.Series
+            Consecutive chunks of the data, with the same columns as returned by
+            :meth:`par` etc. Concatenating the chunks gives the complete data.
+        dict
+            For a scalar `name`, the single value.
+
+        Raises
+        ------
+        KeyError
+            If `name` is not an item in the Scenario.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize={chunksize} must be positive")
+
+        self._flush_writes()
+        yield from self.platform._backend.item_get_elements_chunks(
+            self, self._ix_types([name])[name], name, filters, chunksize
+        )
+
+    def item_hashes(self, names: Iterable[str] | None = None) -> dict[str, str]:
+        """Return hashes of the contents of items.
+
+        Use this to detect which items differ between two Scenarios, or have changed,
+        without comparing their data directly. A backend may compute the hashes without
+        transferring the data, or cache them.
+
+        Parameters
+        ----------
+        names : iterable of str, optional
+            Names of items of any type. If not given, all items in the Scenario.
+
+        Returns
+        -------
+        dict
+            Mapping from item names to :class:`str` hashes. Items with the same hash
+            have the same column names and elements, possibly in a different order.
+            Hashes from Scenarios on platforms with different backends are not
+            necessarily comparable.
+
+        Raises
+        ------
+        KeyError
+            If any of `names` is not an item in the Scenario.
+        """
+        self._flush_writes()
+        return self.platform._backend.item_hashes(self, self._ix_types(names))
+
+    def item_key_hashes(self, name: str, columns: Sequence[str]) -> pd.Series:
+        """Return values of parameter `name`, indexed by hashes of their keys.
+
+        Any buffered data are sent to the backend first. See
+        :meth:`.Backend.item_key_hashes`.
+
+        Parameters
+        ----------
+        name : str
+            Name of a parameter.
+        columns : sequence of str
+            Columns of the parameter data to hash, for instance its index names and
+            ``unit``.
+
+        Returns
+        -------
+        pandas.Series
+            The ``value`` of each element, indexed by a hash of `columns`.
+        """
+        self._flush_writes()
+        return self.platform._backend.item_key_hashes(self, name, columns)
+
+    def _ix_types(self, names: Iterable[str] | None = None) -> dict[str, str]:
+        """Return a mapping from each of `names` (default: all items) to its type.
+
+        Raises
+        ------
+        KeyError
+            If any of `names` is not an item in the Scenario.
+        """
+        # Identify the type of each item
+        ix_type: dict[str, str] = dict()
+        for item_type in (ItemType.SET, ItemType.PAR, ItemType.VAR, ItemType.EQU):
+            _type = item_type.name.lower()
+            for name in set(self.platform._backend.list_items(self, _type)):
+                ix_type.setdefault(name, _type)
+
+        names = sorted(ix_type) if names is None else list(names)
+
+        if missing := [n for n in names if n not in ix_type]:
+            raise KeyError(f"No item(s) {missing!r} in this Scenario")
+
+        return {name: ix_type[name] for name in names}
+
     # NOTE Changing the default here since that seems to be unused/untested
     def has_item(self, name: str, item_type: "ModelItemType" = ItemType.PAR) -> bool:
         """Check whether the Scenario has an item `name` of `item_type`.
@@ -707,21 +1032,18 @@ class Scenario(TimeSeries):
             if data.isna().any(axis=None):
                 raise ValueError("Length mismatch between keys and values")
 
-        # Column types
-        types: dict[str, type[float] | type[str] | type[object]] = {
-            "key": str if N_dim == 1 else object,
-            "value": float,
-            "unit": str,
-            "comment": str,
-        }
-
         # Further handle each column
-        if "key" not in data.columns:
-            # Form the 'key' column from other columns
-            if N_dim > 1 and len(data):
-                data["key"] = data[idx_names].astype(str).agg(pd.Series.tolist, axis=1)
-            else:
-                data["key"] = data[idx_names[0]]
+        if "key" in data.columns:
+            # Split the 'key' column into one column per index dimension
+            key = data.pop("key")
+            if N_dim > 1:
+                data = data.drop(columns=idx_names, errors="ignore").join(
+                    pd.DataFrame(key.tolist(), columns=idx_names, index=data.index)
+                )
+            elif N_dim == 1:
+                data[idx_names[0]] = key
+        elif missing := [d for d in idx_names if d not in data.columns]:
+            raise KeyError(f"no key or index column(s) {missing} supplied")
 
         if "value" not in data.columns:
             raise ValueError("no parameter values supplied")
@@ -731,24 +1053,56 @@ class Scenario(TimeSeries):
             # `unit` is iterable but the wrong length.
             data = data.assign(unit=unit or "???")
 
-        if "comment" not in data.columns:
-            if not comment:
-                # Don't apply a dtype to None values
-                types.pop("comment")
+        # Column types
+        types: dict[str, type[float] | type[str]] = dict.fromkeys(idx_names, str)
+        types.update(value=float, unit=str)
+
+        if "comment" in data.columns or comment:
             # Broadcast a single comment value across all observations. Pandas raises
             # ValueError if `comment` is iterable but the wrong length.
-            data = data.assign(comment=comment or None)
+            if "comment" not in data.columns:
+                data = data.assign(comment=comment)
+            types["comment"] = str
 
-        # Convert types, generate tuples
-        elements = map(
-            lambda e: (e.key, e.value, e.unit, e.comment),
-            data.astype(types).itertuples(),
-        )
+        # Select and convert columns once; the backend receives these as-is
+        data = data[list(types)].astype(types)
 
         # Store
-        # TODO Not sure how to tell type checker, but columns are always converted to
-        # tuple[str | object, float, str, str]
-        self.platform._backend.item_set_elements(self, Parameter, name, elements)  # type: ignore[arg-type]
+        self._set_elements_frame(Parameter, name, data)
+
+    def _set_elements_frame(
+        self, type: type[Parameter | Set], name: str, data: pd.DataFrame
+    ) -> None:
+        """Send `data` for item `name` to the backend, or to the write buffer.
+
+        See :meth:`.transact`.
+        """
+        if self._write_buffer is None:
+            self.platform._backend.item_set_elements_frame(self, type, name, data)
+        else:
+            self._write_buffer.setdefault((type, name), []).append(data)
+
+    def _flush_writes(self) -> None:
+        """Send buffered data to the backend, with one call per item."""
+        if not self._write_buffer:
+            return
+
+        # Sets before parameters, so that set elements exist before they are used
+        for type_, name in sorted(self._write_buffer, key=lambda k: k[0] is not Set):
+            data = pd.concat(self._write_buffer.pop((type_, name)), ignore_index=True)
+
+            if "comment" in data.columns:
+                # Comment omitted for some of the data frames
+                data["comment"] = data["comment"].where(data["comment"].notna(), None)
+
+            # Keep only the last data for each key
+            dims = [c for c in data.columns if c not in ("value", "unit", "comment")]
+            if dims:
+                data = data.drop_duplicates(subset=dims, keep="last")
+            else:
+                data = data.tail(1)
+
+            self.platform._backend.item_set_elements_frame(self, type_, name, data)
 
     def init_scalar(
         self,
@@ -786,6 +1140,7 @@ class Scenario(TimeSeries):
         dict
             with the keys "value" and "unit".
         """
+        self._flush_writes()
         data = self.platform._backend.item_get_elements(self, "par", name, None)
         assert isinstance(data, dict)
         return data
@@ -810,6 +1165,7 @@ class Scenario(TimeSeries):
         comment : str, optional
             Description of the change.
         """
+        self._flush_writes()
         self.platform._backend.item_set_elements(
             self, Parameter, name, [(None, float(val), unit, comment)]
         )
@@ -831,6 +1187,7 @@ class Scenario(TimeSeries):
             single key for a single data point; the individual elements must correspond
             to the indices/dimensions of the parameter.
         """
+        self._flush_writes()
         if key is None:
             self.platform._backend.delete_item(self, "par", name)
         else:
@@ -840,7 +1197,11 @@ class Scenario(TimeSeries):
 
     # FIXME What ensures that filters has the correct type?
     def var(
-        self, name: str, filters: "Filters" = None, **kwargs: Any
+        self,
+        name: str,
+        filters: "Filters" = None,
+        dtype_backend: "DtypeBackend | None" = None,
+        **kwargs: Any,
     ) -> "SolutionData":
         """Return a dataframe of (filtered) elements for a specific variable.
 
@@ -850,11 +1211,21 @@ class Scenario(TimeSeries):
             name of the variable
         filters : dict
             index names mapped list of index set elements
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
         """
-        return self.platform._backend.item_get_elements(self, "var", name, filters)
+        return convert_dtype_backend(
+            self.platform._backend.item_get_elements(self, "var", name, filters),
+            dtype_backend,
+        )
 
     def equ(
-        self, name: str, filters: "Filters" = None, **kwargs: Any
+        self,
+        name: str,
+        filters: "Filters" = None,
+        dtype_backend: "DtypeBackend | None" = None,
+        **kwargs: Any,
     ) -> "SolutionData":
         """Return a dataframe of (filtered) elements for a specific equation.
 
@@ -864,8 +1235,14 @@ class Scenario(TimeSeries):
             name of the equation
         filters : dict
             index names mapped list of index set elements
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
         """
-        return self.platform._backend.item_get_elements(self, "equ", name, filters)
+        return convert_dtype_backend(
+            self.platform._backend.item_get_elements(self, "equ", name, filters),
+            dtype_backend,
+        )
 
     def clone(
         self,
@@ -924,6 +1301,8 @@ class Scenario(TimeSeries):
         model = model or self.model
         scenario = scenario or self.scenario
 
+        self._flush_writes()
+
         try:
             # Use the Backend implementation to clone:
             # - Within the same Backend.
@@ -943,6 +1322,8 @@ class Scenario(TimeSeries):
         except CrossPlatformClone:
             # Use a generic, Backend-unaware clone method
             return _clone(self, platform, model, scenario, keep_solution)
+        finally:
+            Platform._scenario_list_changed()
 
     def has_solution(self) -> bool:
         """Return :obj:`True` if the Scenario contains model solution data."""
@@ -1031,6 +1412,9 @@ class Scenario(TimeSeries):
                 "solve()"
             )
 
+        # Send any buffered data, so that the model sees it
+        self._flush_writes()
+
         # Instantiate a model
         model_obj = get_model(model or self.scheme, **model_options)
 
@@ -1111,7 +1495,8 @@ class Scenario(TimeSeries):
         # Select the current scenario
         filters["scenario"] = self
 
-        # Invoke the backend method
+        # Invoke the backend method, after sending any buffered data
+        self._flush_writes()
         self.platform._backend.write_file(
             Path(path), items, filters=filters, max_row=max_row
         )
@@ -1142,6 +1527,8 @@ class Scenario(TimeSeries):
         .TimeSeries.read_file
         to_excel
         """
+        # Send any buffered data first, so that it is not written after the file data
+        self._flush_writes()
         self.platform._backend.read_file(
             Path(path),
             ItemType.MODEL,
@@ -1152,6 +1539,38 @@ class Scenario(TimeSeries):
         )
 
 
+def _solution_elements(
+    data: dict[str, Any] | pd.DataFrame,
+) -> Iterator[tuple[Any, ...]]:
+    """Convert equation or variable `data` for :meth:`.Backend.item_set_elements`."""
+    if isinstance(data, dict):
+        # Yield a single element
+        yield (None, data["lvl"], data["mrg"], "")
+    else:
+        # Convert whole columns, rather than each row
+        keys = data.drop(columns=["lvl", "mrg"]).astype(str).to_numpy().tolist()
+        yield from zip(keys, data["lvl"].tolist(), data["mrg"].tolist(), repeat(""))
+
+
+def _set_elements(
+    s: Scenario,
+    type_: type[Equation | Parameter | Variable],
+    name: str,
+    data: dict[str, Any] | pd.DataFrame,
+) -> None:
+    """Add `data` to item `name` of `s`; used by :func:`_clone`."""
+    backend = s.platform._backend
+    if type_ is Parameter:
+        # Scalar parameter data has no key columns
+        frame = pd.DataFrame([data]) if isinstance(data, dict) else data
+        dims = frame.columns.drop(["value", "unit"])
+        backend.item_set_elements_frame(
+            s, Parameter, name, frame.astype(dict.fromkeys(dims, str))
+        )
+    else:
+        backend.item_set_elements(s, type_, name, _solution_elements(data))
+
+
 def _clone(
     s: Scenario, platform_dest: Platform, model: str, scenario: str, keep_solution: bool
 ) -> Scenario:
@@ -1167,38 +1586,13 @@ def _clone(
     # Direct reference to the backend storing s_dest
     b_dest = s_dest.platform._backend
 
-    def _data_to_elements(
-        data: dict[str, Any] | pd.DataFrame,
-    ) -> Iterator[tuple[Any, ...]]:
-        """Convert data to elements for :meth:`.Backend.item_set_elements`."""
-        if isinstance(data, dict):
-            # Identify element value fields for (equ, var) or (par, set)
-            c0, c1 = ("lvl", "mrg") if "lvl" in data else ("value", "unit")
-            # Yield a single element
-            yield (None, data[c0], data[c1], "")
-        else:
-            c0, c1 = ("lvl", "mrg") if "lvl" in data.columns else ("value", "unit")
-            cols = data.columns.to_list()
-            # Indices of key colums, for pd.DataFrame.take()
-            i_key = list(range(len(cols)))
-            # Indices of value fields
-            i0, i1 = cols.index(c0), cols.index(c1)
-            # Exclude these from the key
-            i_key.remove(i0)
-            i_key.remove(i1)
-
-            yield from [
-                (row.take(i_key).to_list(), row.iloc[i0], row.iloc[i1], "")
-                for _, row in data.iterrows()
-            ]
-
     def _maybe_init(it: ItemType, name: str) -> None:
         """Initialize item `name` on `s_dest`, if it does not already exist."""
         if name in existing[it]:
             return
         idx_sets, idx_names = s.idx_sets(name), s.idx_names(name)
 
-        b_dest.init_item(s_dest, type_.ix_type, name, idx_sets, idx_names)
+        b_dest.init_item(s_dest, it.name.lower(), name, idx_sets, idx_names)
 
     # Clone optimization data
 
@@ -1210,10 +1604,12 @@ def _clone(
     }
 
     with s_dest.transact():
-        # Iterate over item names and data
-        for name, set_data in s.iter_item_data(ItemType.SET):
+        # Read each item in chunks, and write each chunk as soon as it is read, so that
+        # at most ITEM_CHUNKSIZE elements of any item are held in memory at once
+        for name in s.items(ItemType.SET):
             _maybe_init(ItemType.SET, name)
-            s_dest.add_set(name, set_data)
+            for set_data in s.iter_chunks(name, ITEM_CHUNKSIZE):
+                s_dest.add_set(name, set_data)
 
         for item_type, type_, condition in (
             (ItemType.PAR, Parameter, True),
@@ -1223,8 +1619,16 @@ def _clone(
         ):
             if not condition:
                 continue
-            for name, data in s.iter_item_data(item_type):  # type: ignore [call-overload]
+            names = list(s.items(item_type))
+            for i, name in enumerate(names, start=1):
                 _maybe_init(item_type, name)
-                b_dest.item_set_elements(s_dest, type_, name, _data_to_elements(data))
+                n = 0
+                for data in s.iter_chunks(name, ITEM_CHUNKSIZE):
+                    _set_elements(s_dest, type_, name, data)  # type: ignore [arg-type]
+                    n += 1 if isinstance(data, dict) else len(data)
+                log.info(
+                    f"Clone {item_type.name.lower()} {i}/{len(names)} {name!r}: "
+                    f"{n} element(s)"
+                )
 
     return s_dest
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager, nullcontext
 from os import PathLike
 from pathlib import Path
@@ -14,7 +14,6 @@ from ixmp.backend.common import FIELDS, ItemType
 from ixmp.core.platform import Platform
 from ixmp.util import (
     as_str_list,
-    is_dict_int_float,
     maybe_check_out,
     maybe_commit,
     parse_url,
@@ -22,10 +21,10 @@ from ixmp.util import (
     year_list,
 )
 from ixmp.util.ixmp4 import is_ixmp4backend
-from ixmp.util.pandas import STRING_DTYPE
+from ixmp.util.pandas import STRING_DTYPE, convert_dtype_backend
 
 if TYPE_CHECKING:
-    from ixmp.types import VersionType
+    from ixmp.types import DtypeBackend, VersionType
 
 log = logging.getLogger(__name__)
 
@@ -60,11 +59,15 @@ class TimeSeries:
         load a specific version. If ``'new'``, create a new TimeSeries.
     annotation : str, optional
         A short annotation/comment used when ``version='new'``.
+    lazy : bool, optional
+        If :obj:`True`, do not retrieve the TimeSeries from the :class:`.Backend` until
+        its data is first accessed. Until then, :attr:`model`, :attr:`scenario`,
+        :attr:`version`, and :attr:`url` can be read without accessing the backend; if
+        `version` is omitted, :attr:`version` is :obj:`None`. Errors, for instance if
+        the TimeSeries does not exist, are raised on first access. Cannot be combined
+        with ``version='new'``.
     """
 
-    #: A reference to the :class:`.Platform` on which the TimeSeries is stored.
-    platform: Platform
-
     #: Name of the model associated with the TimeSeries.
     model: str
 
@@ -74,6 +77,17 @@ class TimeSeries:
     #: Version of the TimeSeries. Immutable for a specific instance.
     version: int | None = None
 
+    #: :obj:`True` if the TimeSeries has not yet been retrieved from the backend; see
+    #: the `lazy` parameter.
+    _lazy: bool = False
+
+    #: Weak reference to the Platform; see :attr:`platform`.
+    _platform: Platform
+
+    #: Data frames for each (item type, name) not yet sent to the backend, if writes
+    #: are buffered; see :meth:`transact`.
+    _write_buffer: dict[tuple[type, str], list[pd.DataFrame]] | None = None
+
     def __init__(
         self,
         mp: Platform,
@@ -82,12 +96,15 @@ class TimeSeries:
         version: "VersionType" = None,
         annotation: str | None = None,
         scheme: str | None = None,
+        lazy: bool = False,
     ) -> None:
         # Check arguments
         if not isinstance(mp, Platform):
             raise TypeError("mp is not a valid `ixmp.Platform` instance")
         elif version and not (version == "new" or isinstance(version, int)):
             raise ValueError(f"version={repr(version)}")
+        elif version == "new" and lazy:
+            raise ValueError("lazy=True with version='new'")
         elif version == "new" and annotation is None:
             log.info(
                 f"Missing annotation for new {type(self).__name__} {model}/{scenario}"
@@ -112,18 +129,44 @@ class TimeSeries:
         # NOTE mypy says mp can never be a subtype of ProxyType, but removing the
         # isinstance check leads to errors
         # Annotating mp as Union[..., ProxyType[Platform]] doesn't help, either
-        self.platform = mp if isinstance(mp, ProxyType) else proxy(mp)  # type: ignore [unreachable]
+        self._platform = mp if isinstance(mp, ProxyType) else proxy(mp)  # type: ignore [unreachable]
 
         if version == "new":
             # Initialize a new object
             # annotation will be "" if None is provided, convince type checker
             assert annotation is not None
             self.platform._backend.init(self, annotation)
+            Platform._scenario_list_changed()
+        elif lazy:
+            # Defer retrieving the object until first access; see platform
+            self.version = version
+            self._lazy = True
         else:
             # Retrieve an existing object
             self.version = version
             self.platform._backend.get(self)
 
+    @property
+    def platform(self) -> Platform:
+        """A reference to the :class:`.Platform` on which the TimeSeries is stored.
+
+        If the TimeSeries was created with ``lazy=True``, the first access to this
+        attribute retrieves the TimeSeries from the backend.
+        """
+        if self._lazy:
+            self._load()
+        return self._platform
+
+    def _load(self) -> None:
+        """Retrieve a TimeSeries created with ``lazy=True`` from the backend."""
+        log.debug(f"Load {type(self).__name__} {self.url}")
+        self._lazy = False
+        try:
+            self._platform._backend.get(self)
+        except Exception:
+            self._lazy = True
+            raise
+
     def _backend(self, method: str, *args: Any, **kwargs: Any) -> Any:
         """Convenience method for calling `method` on the backend.
 
@@ -140,14 +183,19 @@ class TimeSeries:
 
     def __del__(self) -> None:
         # Instruct the back end to free memory associated with the TimeSeries
+        if self._lazy:
+            return  # Never retrieved from the backend
         try:
-            self.platform._backend.del_ts(self)
+            self._platform._backend.del_ts(self)
         except (AttributeError, ReferenceError):
             pass  # The Platform has already been garbage-collected
 
     @classmethod
     def from_url(
-        cls, url: str, errors: Literal["warn", "raise"] = "warn"
+        cls,
+        url: str,
+        errors: Literal["warn", "raise"] = "warn",
+        registry: bool = False,
     ) -> tuple["TimeSeries | None", Platform]:
         """Instantiate a TimeSeries (or Scenario) given an ``ixmp://`` URL.
 
@@ -169,6 +217,12 @@ class TimeSeries:
         errors : 'warn' or 'raise'
             If 'warn', a failure to load the TimeSeries is logged as a warning, and the
             platform is still returned. If 'raise', the exception is raised.
+        registry : bool, optional
+            If :obj:`True`, return objects from the process-wide :class:`.Registry`:
+            repeated calls with the same `url` return the same TimeSeries, and calls
+            with the same platform name share one :class:`.Platform`. To use an
+            existing Platform, add it first with :meth:`.Registry.add`; this is required
+            for platforms using :class:`.MemoryBackend` or :class:`.ParquetBackend`.
 
         Returns
         -------
@@ -182,10 +236,16 @@ class TimeSeries:
         assert errors in ("warn", "raise"), "errors= must be 'warn' or 'raise'"
 
         platform_info, scenario_info = parse_url(url)
-        platform = Platform(**platform_info)
+
+        if registry:
+            from ixmp.core.registry import REGISTRY
+
+            platform = REGISTRY.platform(platform_info.get("name"))
+        else:
+            platform = Platform(**platform_info)
 
         try:
-            ts = cls(platform, **scenario_info)
+            ts = REGISTRY.get(url, cls) if registry else cls(platform, **scenario_info)
         except Exception as e:
             if errors == "warn":
                 # FIXME ixmp4 errors might have empty e.args
@@ -215,6 +275,7 @@ class TimeSeries:
         util.maybe_check_out
         """
         self.platform._backend.check_out(self, timeseries_only)
+        Platform._scenario_list_changed()
 
     def commit(self, comment: str) -> None:
         """Commit all changed data to the database.
@@ -232,15 +293,49 @@ class TimeSeries:
         --------
         util.maybe_commit
         """
+        self._flush_writes()
         self.platform._backend.commit(self, comment)
+        Platform._scenario_list_changed()
 
     def discard_changes(self) -> None:
         """Discard all changes and reload from the database."""
+        if self._write_buffer:
+            self._write_buffer.clear()
         self.platform._backend.discard_changes(self)
+        Platform._scenario_list_changed()
+
+    def _flush_writes(self) -> None:
+        """Send any buffered writes to the backend.
+
+        TimeSeries does not buffer any writes; see :meth:`.Scenario._flush_writes`.
+        """
+
+    @contextmanager
+    def _buffer_writes(self, condition: bool) -> Generator[None, Any, None]:
+        """Context manager to buffer writes if `condition` is :obj:`True`.
+
+        On exiting the code block normally, buffered writes are flushed. If an
+        exception occurs, they are discarded.
+        """
+        if not condition or self._write_buffer is not None:
+            # Not buffering, or already buffering in an enclosing block
+            yield
+            return
+
+        self._write_buffer = dict()
+        try:
+            yield
+            self._flush_writes()
+        finally:
+            self._write_buffer = None
 
     @contextmanager
     def transact(
-        self, message: str = "", condition: bool = True, discard_on_error: bool = False
+        self,
+        message: str = "",
+        condition: bool = True,
+        discard_on_error: bool = False,
+        buffer: bool = False,
     ) -> Generator[None, Any, None]:
         """Context manager to wrap code in a 'transaction'.
 
@@ -260,6 +355,20 @@ class TimeSeries:
         discard_on_error : bool
             If :obj:`True` (default :obj:`False`), then the anti-locking behaviour of
             :func:`.discard_on_error` also applies to any exception raised in the block.
+        buffer : bool
+            If :obj:`True` (default :obj:`False`), data added with
+            :meth:`.Scenario.add_par` or :meth:`.Scenario.add_set` (with a
+            :class:`pandas.DataFrame`) is held in memory instead of being sent to the
+            backend immediately. On exiting the code block normally, the data for each
+            item are combined—for repeated keys, the last value given is kept—and sent
+            to the backend once per item, before any commit. This reduces the number of
+            calls to the backend when adding data in many small pieces.
+
+            Buffered data are also sent to the backend before any other call that reads
+            or modifies the same Scenario, for instance :meth:`.Scenario.par`,
+            :meth:`.Scenario.remove_set`, :meth:`.Scenario.solve`, or
+            :meth:`.Scenario.read_excel`. If an exception is raised in the block,
+            buffered data are discarded.
 
         Example
         -------
@@ -271,7 +380,10 @@ class TimeSeries:
         >>> # Changes to `ts` have been committed
         """
         if is_ixmp4backend(self.platform._backend):
-            with self.platform._backend.index[self].transact(message=message):
+            with (
+                self.platform._backend.index[self].transact(message=message),
+                self._buffer_writes(buffer),
+            ):
                 yield
         else:
             # TODO implement __enter__ and __exit__ to allow simpler "with ts: …"
@@ -282,7 +394,10 @@ class TimeSeries:
             try:
                 # Use the discard_on_error context manager (cm) if the parameter of the
                 # same name is True
-                with discard_on_error_cm(self) if discard_on_error else nullcontext():
+                with (
+                    discard_on_error_cm(self) if discard_on_error else nullcontext(),
+                    self._buffer_writes(buffer),
+                ):
                     yield
             finally:
                 maybe_commit(self, condition, message)
@@ -290,6 +405,7 @@ class TimeSeries:
     def set_as_default(self) -> None:
         """Set the current :attr:`version` as the default."""
         self.platform._backend.set_as_default(self)
+        Platform._scenario_list_changed()
 
     def is_default(self) -> bool:
         """Return :obj:`True` if the :attr:`version` is the default version."""
@@ -308,7 +424,9 @@ class TimeSeries:
         """URL fragment for the TimeSeries.
 
         This has the format ``{model name}/{scenario name}#{version}``, with the same
-        values passed when creating the TimeSeries instance.
+        values passed when creating the TimeSeries instance. If the version is not
+        known—for a TimeSeries created with ``lazy=True`` and no `version` that has not
+        yet been loaded—the ``#{version}`` part is omitted.
 
         Examples
         --------
@@ -327,7 +445,8 @@ class TimeSeries:
            systems must have the same configuration for `platform_name` in order for
            the URL to refer to the same TimeSeries/Scenario.
         """
-        return f"{self.model}/{self.scenario}#{self.version}"
+        version = "" if self.version is None else f"#{self.version}"
+        return f"{self.model}/{self.scenario}{version}"
 
     # Time series data
 
@@ -384,7 +503,8 @@ class TimeSeries:
             df = pd.pivot_table(
                 df, values="value", index=all_cols, columns=["year"]
             ).reset_index()
-        df.set_index(["region", "variable", "unit", "subannual"], inplace=True)
+        id_cols = ["region", "variable", "unit", "subannual"]
+        df.set_index(id_cols, inplace=True)
 
         # Discard non-numeric columns, e.g. 'model', 'scenario', write warning about
         # non-expected cols to log
@@ -407,14 +527,16 @@ class TimeSeries:
 
         df.drop(list(filter(predicate, df.columns)), axis=1, inplace=True)
 
-        # Add one time series per row
-        for key, row in df.iterrows():
-            assert isinstance(key, tuple)
-            r, v, u, sa = key
-            data = row.astype(float).dropna().to_dict()
-            assert is_dict_int_float(data)
-            # Values as float; exclude NA
-            self.platform._backend.set_data(self, r, v, data, u, sa, meta)
+        # Values as float in long format; exclude NA
+        data = (
+            df.astype(float)
+            .reset_index()
+            .melt(id_vars=id_cols, var_name="year", value_name="value")
+            .dropna(subset=["value"])
+        )
+
+        # Add all time series at once
+        self.platform._backend.set_data_frame(self, data, meta)
 
     def timeseries(
         self,
@@ -424,6 +546,7 @@ class TimeSeries:
         year: int | Sequence[int] | None = None,
         iamc: bool = False,
         subannual: bool | str = "auto",
+        dtype_backend: "DtypeBackend | None" = None,
     ) -> pd.DataFrame:
         """Retrieve time series data.
 
@@ -444,6 +567,9 @@ class TimeSeries:
             Whether to include column for sub-annual specification (if :class:`bool`);
             if 'auto', include column if sub-annual data (other than 'Year') exists in
             returned data frame.
+        dtype_backend : "numpy_nullable" or "pyarrow", optional
+            If given, return columns with nullable or :mod:`pyarrow`-backed dtypes;
+            see :func:`.util.pandas.convert_dtype_backend`.
 
         Raises
         ------
@@ -489,7 +615,7 @@ class TimeSeries:
                 .rename_axis(columns=None)
             )
 
-        return df
+        return convert_dtype_backend(df, dtype_backend)
 
     def remove_timeseries(self, df: pd.DataFrame) -> None:
         """Remove time series data.
@@ -512,10 +638,8 @@ class TimeSeries:
             # Reshape from wide to long format
             df = pd.melt(df, id_vars=id_cols, var_name="year", value_name="value")
 
-        # Remove all years for a given (r, v, u) combination at once
-        for (r, v, u, t), data in df.groupby(id_cols):
-            r, v, u, t = map(str, (r, v, u, t))
-            self.platform._backend.delete(self, r, v, t, data["year"].tolist(), u)
+        # Remove all (r, v, u, t, year) combinations at once
+        self.platform._backend.delete_frame(self, df[id_cols + ["year"]])
 
     # Geodata
 
@@ -535,17 +659,9 @@ class TimeSeries:
             - `value`
             - `meta`
         """
-        for _, row in df.astype({"year": int, "meta": int}).iterrows():
-            self.platform._backend.set_geo(
-                self,
-                row.region,
-                row.variable,
-                row.subannual,
-                row.year,
-                row.value,
-                row.unit,
-                row.meta,
-            )
+        self.platform._backend.set_geo_frame(
+            self, df.astype({"year": int, "meta": int})
+        )
 
     def remove_geodata(self, df: pd.DataFrame) -> None:
         """Remove geodata from the TimeSeries instance.
@@ -561,12 +677,7 @@ class TimeSeries:
             - `subannual`
             - `year`
         """
-        # Remove all years for a given (r, v, t, u) combination at once
-        for (r, v, t, u), data in df.groupby(
-            ["region", "variable", "subannual", "unit"]
-        ):
-            r, v, t, u = map(str, (r, v, t, u))
-            self.platform._backend.delete_geo(self, r, v, t, data["year"].tolist(), u)
+        self.platform._backend.delete_geo_frame(self, df)
 
     def get_geodata(self) -> pd.DataFrame:
         """Fetch geodata and return it as dataframe.
@@ -577,9 +688,7 @@ class TimeSeries:
             Specified data.
         """
         return (
-            pd.DataFrame(
-                self.platform._backend.get_geo(self), columns=FIELDS["ts_get_geo"]
-            )
+            self.platform._backend.get_geo_frame(self)
             .reset_index(drop=True)
             .astype(GEO_DTYPES)
         )
@@ -667,9 +776,14 @@ class TimeSeries:
         path: PathLike[str],
         firstyear: int | None = None,
         lastyear: int | None = None,
+        chunksize: int | None = None,
+        progress: Callable[[int], None] | None = None,
     ) -> None:
         """Read time series data from a CSV or Microsoft Excel file.
 
+        The file is read and stored in chunks, so that large files can be read with
+        bounded memory use; see :func:`.ts_read_file`.
+
         Parameters
         ----------
         path : os.PathLike
@@ -678,17 +792,30 @@ class TimeSeries:
             Only read data from years equal to or later than this year.
         lastyear : int, optional
             Only read data from years equal to or earlier than this year.
+        chunksize : int, optional
+            Number of rows to read and store at once.
+        progress : callable, optional
+            Called after each chunk is stored, with the total number of rows read so
+            far.
+
+        Raises
+        ------
+        ValueError
+            If the file contains regions or units that are not defined on the Platform.
 
         See also
         --------
         .Scenario.read_excel
         """
+        self._flush_writes()
         self.platform._backend.read_file(
             Path(path),
             ItemType.TS,
             filters=dict(scenario=self),
             firstyear=firstyear,
             lastyear=lastyear,
+            chunksize=chunksize,
+            progress=progress,
         )
 
 
@@ -159,22 +159,20 @@ def data_for_quantity(
     return qty
 
 
-# Non-weak references to objects to keep them alive
-_FROM_URL_REF: set[Any] = set()
-
-
 def from_url(url: str, cls: type["TimeSeries"] = TimeSeries) -> "TimeSeries":
     """Return a :class:`.ixmp.TimeSeries` or subclass instance, given its `url`.
 
+    The object is retrieved from the process-wide :class:`.Registry`, so repeated calls
+    with the same `url` return the same object, and objects on the same platform share
+    one :class:`.Platform`.
+
     Parameters
     ----------
     cls : type, optional
         Subclass to instantiate and return; for instance, :class:`.Scenario`.
     """
-    ts, mp = cls.from_url(url)
+    ts, _ = cls.from_url(url, errors="raise", registry=True)
     assert ts is not None
-    _FROM_URL_REF.add(ts)
-    _FROM_URL_REF.add(mp)
     return ts
 
 
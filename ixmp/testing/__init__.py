@@ -126,6 +126,8 @@ MARK = {
     "IXMP4Backend Not Yet": pytest.mark.xfail(
         reason="Not yet supported by IXMP4Backend"
     ),
+    "MemoryBackend Never": pytest.mark.xfail(reason="Not supported by MemoryBackend"),
+    "ParquetBackend Never": pytest.mark.xfail(reason="Not supported by ParquetBackend"),
     "pytest#10843": pytest.mark.xfail(
         condition=GHA
         and _uname.system == "Windows"
@@ -215,8 +217,13 @@ def pytest_sessionstart(session: pytest.Session) -> None:
         # tmp_env below.
         ixmp_config.values["platform"]["local"].pop("path")
 
-    # Available backends: 0 or more of "jdbc", "ixmp4"
-    backends = session.config.stash[KEY_BACKENDS] = sorted(available())
+    # Available backends: "memory", which is always available, and 0 or more of
+    # "ixmp4", "jdbc", "parquet". Features of MemoryBackend and ParquetBackend not
+    # shared with the others are tested separately in ixmp.tests.backend.test_memory
+    # and .test_parquet
+    backends = session.config.stash[KEY_BACKENDS] = sorted(
+        set(available()) & {"ixmp4", "jdbc", "memory", "parquet"}
+    )
 
     jdbc._GC_AGGRESSIVE = False
 
@@ -271,7 +278,7 @@ def pytest_report_header(config: pytest.Config, start_path: Path) -> str:
 # sound like what we need, but I couldn't quite get it to work. Instead, this is more
 # following https://pytest-with-eric.com/introduction/pytest-generate-tests/
 def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
-    """Parametrize tests for the two backend options."""
+    """Parametrize tests for the available backends."""
     if "backend" not in metafunc.fixturenames:
         return
 
@@ -281,7 +288,15 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
     # Subset of marker names applied to the test function
     marker_names = sorted(
         set(m.name for m in metafunc.definition.iter_markers())
-        & {"ixmp4", "ixmp4_never", "ixmp4_not_yet", "jdbc"}
+        & {
+            "ixmp4",
+            "ixmp4_never",
+            "ixmp4_not_yet",
+            "ixmp4_pandas_3",
+            "jdbc",
+            "memory_never",
+            "parquet_never",
+        }
     )
 
     # Argument values for pytest.parametrize()
@@ -289,16 +304,28 @@ def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
 
     # Iterate over all available backends
     for backend_name in backends:
+        # Omit markers like "ixmp4_never" that apply to other backends
+        names = [m for m in marker_names if "_" not in m or m.startswith(backend_name)]
+
         # Match on the backend name followed by 0 or more marker names
-        match [backend_name] + marker_names:
+        match [backend_name] + names:
             case ["jdbc", "ixmp4", *_] | ["ixmp4", *_, "jdbc"]:
                 # These markers mean "even though a parametrized fixture is used, this
                 # test should run only for {IXMP4,JDBC}Backend"
                 continue
+            case ["memory" | "parquet", "ixmp4" | "jdbc", *_]:
+                # Same; these tests do not run for {Memory,Parquet}Backend
+                continue
             case ["ixmp4", "ixmp4_never"]:  # "Won't ever be implemented on IXMP4"
                 mark: Any = MARK["IXMP4Backend Never"]
             case ["ixmp4", "ixmp4_not_yet"]:  # "Not yet supported on IXMP4"
                 mark = MARK["IXMP4Backend Not Yet"]
+            case ["ixmp4", "ixmp4_pandas_3"]:
+                mark = MARK["ixmp4-pandas-3"]
+            case ["memory", "memory_never"]:
+                mark = MARK["MemoryBackend Never"]
+            case ["parquet", "parquet_never"]:
+                mark = MARK["ParquetBackend Never"]
             case _:
                 mark = []
 
@@ -356,7 +383,9 @@ def test_data_path() -> Path:
 # NOTE We need to declare this as module-scope explicitly; otherwise, pytest creates
 # backend for pytest_generate_tests as function-scoped fixture automatically
 @pytest.fixture(scope="module")
-def backend(request: pytest.FixtureRequest) -> Literal["ixmp4", "jdbc"]:
+def backend(
+    request: pytest.FixtureRequest,
+) -> Literal["ixmp4", "jdbc", "memory", "parquet"]:
     # pytest_generate_tests() applies these marks, pytest always only registers Any
     return request.param  # type: ignore[no-any-return]
 
@@ -364,6 +393,8 @@ def backend(request: pytest.FixtureRequest) -> Literal["ixmp4", "jdbc"]:
 @pytest.fixture(scope="module")
 def default_platform_name(backend: str) -> str:
     """Name of the default platform according to the `backend`."""
+    if backend in ("memory", "parquet"):
+        pytest.skip(reason=f"No default platform for backend={backend!r}")
     return {"ixmp4": "ixmp4-local", "jdbc": "local"}[backend]
 
 
@@ -372,7 +403,7 @@ def test_mp(
     request: pytest.FixtureRequest,
     tmp_env: os._Environ[str],
     test_data_path: Path,
-    backend: Literal["ixmp4", "jdbc"],
+    backend: Literal["ixmp4", "jdbc", "memory", "parquet"],
     worker_id: str,
 ) -> Generator[Platform, Any, None]:
     """An empty :class:`.Platform` connected to a temporary, in-memory database.
@@ -508,7 +539,7 @@ def test_mp_f(
     request: pytest.FixtureRequest,
     tmp_env: os._Environ[str],
     test_data_path: Path,
-    backend: Literal["ixmp4", "jdbc"],
+    backend: Literal["ixmp4", "jdbc", "memory", "parquet"],
     worker_id: str,
 ) -> Generator[Platform, Any, None]:
     """An empty :class:`Platform` connected to a temporary, in-memory database.
@@ -684,7 +715,7 @@ def _platform_fixture(
     request: pytest.FixtureRequest,
     tmp_env: os._Environ[str],
     test_data_path: Path,
-    backend: Literal["jdbc", "ixmp4"],
+    backend: Literal["ixmp4", "jdbc", "memory", "parquet"],
     worker_id: str,
 ) -> Generator[Platform, Any, None]:
     """Helper for :func:`test_mp` and other fixtures."""
@@ -694,7 +725,7 @@ def _platform_fixture(
 
     # Construct positional and keyword arguments to Config.add_platform()
     if backend == "jdbc":
-        args = ["hsqldb"]
+        args: list[str | Path] = ["hsqldb"]
         kwargs: dict[str, Any] = dict(url=f"jdbc:hsqldb:mem:{platform_name}")
     elif backend == "ixmp4":
         args = []
@@ -714,6 +745,14 @@ def _platform_fixture(
                 # TODO Properly isinstance check and remove when Python 3.9 is dropped
                 _backend._backend.teardown()
 
+    elif backend == "memory":
+        # An empty platform, not stored in any file
+        args, kwargs = [], dict()
+    elif backend == "parquet":
+        # A directory unique to this platform
+        args = [Path(tmp_env["IXMP_DATA"], "parquet", platform_name.replace(":", "_"))]
+        kwargs = dict()
+
     # Add platform to ixmp configuration
     ixmp_config.add_platform(platform_name, backend, *args, **kwargs)
 
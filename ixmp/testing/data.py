@@ -266,8 +266,14 @@ def populate_test_platform(platform: Platform) -> None:
 
     - 1 version of a TimeSeries with model name 'Douglas Adams' and scenario
       name 'Hitchhiker', containing 2 values.
+
+    The Dantzig Scenarios are solved, except on :class:`.MemoryBackend`, which cannot
+    solve Scenarios using GAMS.
     """
-    s1 = make_dantzig(platform, solve=True, quiet=True)
+    from ixmp.backend.memory import MemoryBackend
+
+    solve = not isinstance(platform._backend, MemoryBackend)
+    s1 = make_dantzig(platform, solve=solve, quiet=True)
 
     s2 = s1.clone()
     s2.set_as_default()
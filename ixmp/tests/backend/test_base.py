@@ -2,12 +2,15 @@ import sys
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
-from ixmp import Platform, TimeSeries
+from ixmp import Platform, Scenario, TimeSeries
 from ixmp.backend.base import Backend, CachingBackend
 from ixmp.backend.common import ItemType
-from ixmp.testing import make_dantzig
+from ixmp.core.item import Parameter, Set
+from ixmp.testing import DATA, make_dantzig
 
 
 class BE1(Backend):
@@ -103,6 +106,98 @@ class TestBackend:
         # The value may differ according to the the test environment, so only check type
         assert isinstance(be.get_log_level(), str)
 
+    def test_delete_frame(self, be: BE2, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+
+        def delete(ts: Any, r: str, v: str, t: str, years: list[int], u: str) -> None:
+            calls.append((r, v, t, sorted(years), u))
+
+        monkeypatch.setattr(be, "delete", delete)
+
+        data = pd.DataFrame(
+            [
+                ["World", "Foo", "kg", "Year", 2010],
+                ["World", "Foo", "kg", "Year", 2020],
+                ["World", "Bar", "kg", "Year", 2010],
+            ],
+            columns=["region", "variable", "unit", "subannual", "year"],
+        )
+        # NOTE The `ts` argument is not used by BE2
+        be.delete_frame(None, data)  # type: ignore[arg-type]
+
+        # delete() is called once for each (region, variable, unit, subannual)
+        assert [
+            ("World", "Bar", "Year", [2010], "kg"),
+            ("World", "Foo", "Year", [2010, 2020], "kg"),
+        ] == calls
+
+    def test_geo_frame(self, be: BE2, monkeypatch: pytest.MonkeyPatch) -> None:
+        rows = []
+
+        def set_geo(
+            ts: Any, r: str, v: str, t: str, y: int, value: str, u: str, m: bool
+        ) -> None:
+            rows.append((r, v, t, y, value, u, m))
+
+        monkeypatch.setattr(be, "set_geo", set_geo)
+        monkeypatch.setattr(be, "get_geo", lambda ts: iter(rows))
+
+        # set_geo() is called once for each row
+        # NOTE The `ts` argument is not used by BE2
+        be.set_geo_frame(None, DATA["geo"])  # type: ignore[arg-type]
+        assert 3 == len(rows)
+
+        # get_geo_frame() returns the same data
+        exp = DATA["geo"].astype({"meta": bool})
+        assert_frame_equal(exp, be.get_geo_frame(None))  # type: ignore[arg-type]
+
+    def test_item_set_elements_frame(
+        self, be: BE2, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        calls = []
+
+        def item_set_elements(s: Any, type: Any, name: str, elements: Any) -> None:
+            calls.append((type, name, list(elements)))
+
+        monkeypatch.setattr(be, "item_set_elements", item_set_elements)
+
+        # 2-dimensional parameter
+        data = pd.DataFrame(
+            [["a", "x", 1.0, "kg"], ["b", "y", 2.0, "kg"]],
+            columns=["i", "j", "value", "unit"],
+        )
+        be.item_set_elements_frame(None, Parameter, "p", data)  # type: ignore[arg-type]
+
+        # Basic set, with comments
+        data = pd.DataFrame([["a", "foo"]], columns=["i", "comment"])
+        be.item_set_elements_frame(None, Set, "i", data)  # type: ignore[arg-type]
+
+        assert [
+            (
+                Parameter,
+                "p",
+                [(["a", "x"], 1.0, "kg", None), (["b", "y"], 2.0, "kg", None)],
+            ),
+            (Set, "i", [("a", None, None, "foo")]),
+        ] == calls
+
+    def test_item_get_elements_chunks(
+        self, be: BE2, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        data: Any = pd.DataFrame(dict(i=list("abcde"), value=range(5), unit="kg"))
+        monkeypatch.setattr(be, "item_get_elements", lambda *args: data)
+
+        result: list[Any] = list(
+            be.item_get_elements_chunks(None, "par", "p", chunksize=2)  # type: ignore[arg-type]
+        )
+        assert [2, 2, 1] == list(map(len, result))
+        assert_frame_equal(data, pd.concat(result, ignore_index=True))
+        assert [0] == result[-1].index.tolist()
+
+        # Scalar: a single dict
+        data = dict(value=1.0, unit="kg")
+        assert [data] == list(be.item_get_elements_chunks(None, "par", "s"))  # type: ignore[arg-type]
+
     def test_read_file(self, be: BE2) -> None:
         with pytest.raises(NotImplementedError):
             be.read_file(Path("foo"), ItemType.VAR)
@@ -144,6 +239,34 @@ class TestCachingBackend:
 
         backend.cache_invalidate(ts, "par", "baz", dict(x=["x1", "x2"], y=["y1", "y2"]))
 
+    def test_item_hashes(
+        self,
+        test_mp: Platform,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        backend = test_mp._backend
+        s = Scenario(test_mp, request.node.name, "test", version="new")
+        s.init_set("i")
+        s.add_set("i", ["i0", "i1"])
+        for name in "ad":
+            s.init_par(name, idx_sets=["i"])
+            s.add_par(name, ["i0", "i1"], [1.0, 2.0], "???")
+        s.commit("")
+        h0 = s.item_hashes(["a", "d"])
+
+        # Cached hashes are returned without retrieving data
+        with monkeypatch.context() as m:
+            m.setattr(backend, "item_get_elements_batch", None)
+            assert h0 == s.item_hashes(["a", "d"])
+
+        # Modifying an item invalidates its cached hash only
+        with s.transact():
+            s.add_par("d", "i0", 3.0, "???")
+        cached = [v for k, v in backend._cache_hash.items() if k[0] == id(s)]
+        assert [h0["a"]] == cached
+        assert h0["d"] != s.item_hashes(["d"])["d"]
+
     def test_del_ts(self, test_mp: Platform, request: pytest.FixtureRequest) -> None:
         """Test CachingBackend.del_ts()."""
         # Since CachingBackend is an abstract class, test it via JDBCBackend
@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -24,6 +25,58 @@ def test__align_dtypes_for_filters() -> None:
     assert filters == expected
 
 
+@pytest.mark.parametrize(
+    "expr, expected",
+    (
+        ("o b", "*o b*"),
+        ("^test_sc", "test_sc*"),
+        ("foo$", "*foo"),
+        ("^foo$", "foo"),
+        ("fo+", None),
+        ("a|b", None),
+        (re.compile("foo", re.IGNORECASE), None),
+        (None, None),
+    ),
+)
+def test__like(expr: str | re.Pattern[str] | None, expected: str | None) -> None:
+    from ixmp.backend.ixmp4 import _like
+
+    assert expected == _like(re.compile(expr) if isinstance(expr, str) else expr)
+
+
+def test__to_ixmp_source_ts_layout() -> None:
+    from ixmp.backend.common import FIELDS
+    from ixmp.backend.ixmp4 import _to_ixmp_source_ts_layout
+
+    # As returned by datapoints.tabulate(join_parameters=True, join_runs=True)
+    df = pd.DataFrame(
+        {
+            "model": ["m", "m"],
+            "scenario": ["s", "s"],
+            "version": [1, 1],
+            "region": ["World", "World"],
+            "unit": ["kg", "kg"],
+            "variable": ["foo", "foo"],
+            "time_series__id": [1, 1],
+            "value": [1.0, 2.0],
+            "type": ["ANNUAL", "CATEGORICAL"],
+            "step_category": [None, "Summer"],
+            "step_year": [2010, 2020],
+            "is_input": [False, False],
+            "id": [1, 2],
+        }
+    )
+    result = _to_ixmp_source_ts_layout(df)
+
+    assert list(FIELDS["write_file"]) == result.columns.tolist()
+    assert ["Year", "Summer"] == result["SUBANNUAL"].tolist()
+    assert [2010, 2020] == result["YEAR"].tolist()
+
+    # Without the 'step_category' column
+    result = _to_ixmp_source_ts_layout(df.drop(columns="step_category"))
+    assert ["Year", "CATEGORICAL"] == result["SUBANNUAL"].tolist()
+
+
 # Overriding fixture that usually parametrizes test_mp
 @pytest.fixture(scope="module")
 def backend() -> Literal["ixmp4"]:
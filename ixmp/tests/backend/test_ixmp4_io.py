@@ -89,6 +89,44 @@ def test__add_items_to_container(container: Any) -> None:
     assert indexset.records["uni"].to_list() == records
 
 
+def test__load_records(container: Any, tmp_path: Path) -> None:
+    from ixmp.backend.ixmp4_io import _load_records
+
+    path = tmp_path / "test_load_records.gdx"
+    container.addSet(name="i", records=["foo", "bar"])
+    container.addParameter(name="p", domain=["i"], records=[["foo", 1.0]])
+    container.write(str(path))
+
+    # Container holding only metadata of the symbols in `path`
+    c = Container(system_directory=str(gams_info().system_dir))
+    c.read(str(path), records=False)
+
+    result = _load_records(c, "p", path)
+    assert [["foo", 1.0]] == result.values.tolist()
+
+    # The symbol is removed once its records are loaded; other symbols are untouched
+    assert ["i"] == c.listSymbols()
+    assert c["i"].records is None
+
+    with pytest.raises(KeyError):
+        _load_records(c, "p", path)
+
+
+def test__records_to_frame() -> None:
+    from ixmp.backend.ixmp4_io import _records_to_frame
+
+    result = _records_to_frame(
+        {"j": ["b", "a", "b"], "y": [2020, 2010, 2010], "values": [1, 2.5, 3]}
+    )
+
+    # Dimensions are ordered categoricals with categories in order of appearance
+    assert ["b", "a"] == result["j"].cat.categories.to_list()
+    assert [2020, 2010] == result["y"].cat.categories.to_list()
+    assert result["j"].cat.ordered
+    assert ["b", "a", "b"] == result["j"].to_list()
+    assert "float64" == result["values"].dtype
+
+
 # Overriding fixture that usually parametrizes test_mp
 @pytest.fixture(scope="module")
 def backend() -> Literal["ixmp4"]:
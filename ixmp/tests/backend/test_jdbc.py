@@ -87,6 +87,9 @@ def test_close_default_logging(
 
 # NOTE sqlalchemy doesn't provide a clear way to check that a session/engine is closed,
 # and by themselves, they can be closed again without logging as expected here
+# MemoryBackend and ParquetBackend have no connection to close
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 @pytest.mark.ixmp4_not_yet
 @MARK["pytest#10843"]
 def test_close_increased_logging(
@@ -420,6 +423,9 @@ def exception_verbose_true() -> Generator[None, Any, None]:
 
 
 # FIXME This raises a RunNotFound on IXMP4Backend and without increased logging
+# Exceptions from MemoryBackend and ParquetBackend have no Java stack trace
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 @pytest.mark.ixmp4_not_yet
 def test_verbose_exception(test_mp: "Platform", exception_verbose_true: None) -> None:
     # Exception stack trace is logged for debugging
@@ -768,6 +774,9 @@ def test_cache_clear(test_mp: "Platform", request: pytest.FixtureRequest) -> Non
     assert df.shape[0] < d0.shape[0]
 
 
+# MemoryBackend and ParquetBackend do not store categories as sets
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_cat_set_elements(test_mp: "Platform", request: pytest.FixtureRequest) -> None:
     scenario = ixmp.Scenario(
         test_mp,
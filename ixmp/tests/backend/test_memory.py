@@ -0,0 +1,205 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from ixmp import Platform, Scenario, TimeSeries
+from ixmp.backend import available, get_class
+from ixmp.backend.memory import MemoryBackend
+from ixmp.core.item import Variable
+from ixmp.testing import HIST_DF, TS_DF, make_dantzig, models
+
+MODEL = "canning problem"
+
+
+@pytest.fixture
+def mp() -> Platform:
+    return Platform(backend="memory")
+
+
+@pytest.fixture
+def scen(mp: Platform) -> Scenario:
+    return make_dantzig(mp)
+
+
+def test_available() -> None:
+    assert "memory" in available()
+    assert MemoryBackend is get_class("memory")
+
+
+def test_handle_config(tmp_path: Path) -> None:
+    assert dict() == MemoryBackend.handle_config([], {})
+    assert dict(path=tmp_path.joinpath("x.pkl")) == MemoryBackend.handle_config(
+        [tmp_path.joinpath("x.pkl")], {}
+    )
+
+    with pytest.raises(ValueError, match="Unhandled positional args"):
+        MemoryBackend.handle_config(["a", "b"], {})
+
+
+class TestMemoryBackend:
+    def test_lifecycle(self, mp: Platform) -> None:
+        s = Scenario(mp, MODEL, "s", version="new")
+        assert 1 == s.version
+
+        # Cannot check out twice
+        with pytest.raises(RuntimeError, match="currently locked by user"):
+            s.check_out()
+
+        s.init_set("i")
+        s.commit("")
+
+        # Cannot edit or commit a Scenario that is not checked out
+        with pytest.raises(RuntimeError, match="cannot be edited, do a checkout"):
+            s.add_set("i", "foo")
+        with pytest.raises(RuntimeError, match="is not checked out"):
+            s.commit("")
+
+        # Committed version is not the default
+        assert not s.is_default()
+        s.set_as_default()
+        assert s.is_default()
+
+        # Changes are discarded
+        s.check_out()
+        s.add_set("i", "foo")
+        s.discard_changes()
+        assert 0 == len(s.set("i"))
+
+        # Scenario loaded without a version is the default
+        assert 1 == Scenario(mp, MODEL, "s").version
+
+    def test_items(self, scen: Scenario) -> None:
+        assert 6 == len(scen.par("d"))
+        assert dict(value=90.0, unit="USD/km") == scen.scalar("f")
+        assert {"i", "j"} == set(scen.set_list())
+        assert ["i", "j"] == scen.idx_sets("d")
+
+        # Filters
+        assert 3 == len(scen.par("d", filters={"i": ["seattle"]}))
+
+        # Empty scalar equation
+        assert dict(lvl=np.nan, mrg=np.nan) == pytest.approx(
+            scen.equ("cost"), nan_ok=True
+        )
+
+        scen.check_out()
+
+        # Keys must be elements of the index set
+        with pytest.raises(ValueError, match="does not have an element 'c'"):
+            scen.add_par("a", "c", 1.0, "cases")
+        # Units must exist
+        with pytest.raises(ValueError, match="The unit 'zz' does not exist"):
+            scen.add_par("a", "seattle", 1.0, "zz")
+        # Items cannot be initialized twice
+        with pytest.raises(ValueError, match="'i' already exists"):
+            scen.init_set("i")
+
+        # Removing an element of an index set also removes dependent data
+        scen.remove_set("i", "seattle")
+        d, a = scen.par("d"), scen.par("a")
+        assert isinstance(d, pd.DataFrame) and isinstance(a, pd.DataFrame)
+        assert {"san-diego"} == set(d["i"]) == set(a["i"])
+
+    def test_timeseries(self, scen: Scenario) -> None:
+        assert_frame_equal(TS_DF, scen.timeseries(iamc=True))
+
+        # Data stored with meta=True is not removed
+        scen.check_out(timeseries_only=True)
+        scen.remove_timeseries(TS_DF.drop(columns=["model", "scenario"]))
+        scen.commit("")
+        assert_frame_equal(HIST_DF, scen.timeseries(iamc=True))
+
+        # Unknown region
+        scen.check_out(timeseries_only=True)
+        with pytest.raises(ValueError, match="region = Mars"):
+            scen.add_timeseries(HIST_DF.assign(region="Mars"))
+        scen.discard_changes()
+
+    def test_geodata(self, mp: Platform) -> None:
+        ts = TimeSeries(mp, MODEL, "geo", version="new")
+        data = pd.DataFrame(
+            [["World", "var1", "Year", 2000, "test", "kg", False]],
+            columns=["region", "variable", "subannual", "year", "value", "unit"]
+            + ["meta"],
+        )
+        ts.add_geodata(data)
+        ts.commit("")
+        assert 1 == len(ts.get_geodata())
+
+        ts.check_out(timeseries_only=True)
+        ts.remove_geodata(data)
+        ts.commit("")
+        assert 0 == len(ts.get_geodata())
+
+    def test_meta(self, mp: Platform, scen: Scenario) -> None:
+        scen.set_meta(dict(foo="bar", baz=1))
+        assert dict(foo="bar", baz=1) == scen.get_meta()
+
+        scen.remove_meta("foo")
+        assert dict(baz=1) == scen.get_meta()
+
+        # Categories are unique across levels
+        with pytest.raises(Exception, match="already used at another level"):
+            mp.set_meta(dict(baz=2), model=MODEL)
+
+    def test_docs_and_nodes(self, mp: Platform) -> None:
+        mp.set_doc("model", {MODEL: "Dantzig's transport problem"})
+        assert "Dantzig's transport problem" == mp.get_doc("model", MODEL)
+
+        with pytest.raises(ValueError, match="No such domain"):
+            mp.set_doc("foo", {})
+
+        mp.add_region("Austria", "country", parent="World")
+        mp.add_region_synonym("AT", "Austria")
+        assert {"World", "Austria", "AT"} <= set(mp.regions()["region"])
+
+    def test_clone(self, scen: Scenario) -> None:
+        # Store solution data directly, in lieu of solving
+        scen.check_out()
+        elements = [(["seattle", "new-york"], 50.0, 0.0, None)]
+        scen.platform._backend.item_set_elements(
+            scen,
+            Variable,
+            "x",
+            elements,  # type: ignore [arg-type]
+        )
+        scen.commit("")
+        assert scen.has_solution()
+
+        # Clone without solution
+        clone = scen.clone(model="foo", keep_solution=False)
+        assert "foo" == clone.model
+        assert not clone.has_solution()
+        scen_d, clone_d = scen.par("d"), clone.par("d")
+        assert isinstance(scen_d, pd.DataFrame) and isinstance(clone_d, pd.DataFrame)
+        assert_frame_equal(scen_d, clone_d)
+        # The first clone to new names is the default
+        assert clone.is_default()
+
+        # Clone with solution
+        clone2 = scen.clone(scenario="bar")
+        assert clone2.has_solution()
+
+        # Changes to the clone do not affect the original
+        clone.check_out()
+        clone.remove_par("d")
+        clone.commit("")
+        assert 6 == len(scen.par("d"))
+
+    def test_snapshot(self, tmp_path: Path) -> None:
+        path = tmp_path.joinpath("x.pkl")
+
+        mp = Platform(backend="memory", path=path)
+        make_dantzig(mp)
+        exp = mp.scenario_list()
+        mp.close_db()
+        assert path.exists()
+
+        # Contents are loaded from the snapshot
+        mp2 = Platform(backend="memory", path=path)
+        assert_frame_equal(exp, mp2.scenario_list())
+        s = Scenario(mp2, **models["dantzig"])
+        assert 6 == len(s.par("d"))
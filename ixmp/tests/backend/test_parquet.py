@@ -0,0 +1,174 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from ixmp import Platform, Scenario
+from ixmp.backend import available, get_class
+from ixmp.testing import make_dantzig, models
+
+pytest.importorskip("pyarrow")
+
+from ixmp.backend.parquet import ParquetBackend  # noqa: E402
+
+KEY = (models["dantzig"]["model"], models["dantzig"]["scenario"], 1)
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    """Directory of a platform containing the Dantzig scenario and one clone."""
+    mp = Platform(backend="parquet", path=tmp_path)
+    s = make_dantzig(mp)
+    s.set_meta(dict(foo="bar"))
+    s.clone(scenario="clone")
+    mp.close_db()
+    return tmp_path
+
+
+def test_available() -> None:
+    assert "parquet" in available()
+    assert ParquetBackend is get_class("parquet")
+
+
+class TestParquetBackend:
+    def test_files(self, path: Path) -> None:
+        assert path.joinpath("platform.pkl").exists()
+        assert path.joinpath("run", "1", "item", "d.parquet").exists()
+        assert path.joinpath("run", "1", "timeseries.parquet").exists()
+
+        # Files can be read by other tools
+        df = pd.read_parquet(path.joinpath("run", "1", "item", "d.parquet"))
+        assert {"i", "j", "value", "unit"} == set(df.columns)
+        assert 6 == len(df)
+
+    def test_lazy(self, path: Path) -> None:
+        mp = Platform(backend="parquet", path=path)
+        backend = mp._backend
+        assert isinstance(backend, ParquetBackend)
+        assert 2 == len(mp.scenario_list(default=False))
+
+        s = Scenario(mp, **models["dantzig"])
+        assert {KEY} <= backend._unread
+        assert ["i", "j"] == s.idx_sets("d")
+
+        # Filtered reads do not read the whole scenario
+        d = s.par("d", filters={"i": ["seattle"]})
+        assert isinstance(d, pd.DataFrame)
+        assert {"seattle"} == set(d["i"]) and 3 == len(d)
+        i = s.set("i", filters={"i": ["seattle"]})
+        assert isinstance(i, pd.Series)
+        assert_series_equal(pd.Series(["seattle"], dtype=d["i"].dtype), i)
+        assert 3 == len(s.timeseries(variable=["GDP"]))
+        assert 6 == len(mp.timeseries(variables="GDP", default=False))
+        assert {KEY} <= backend._unread
+
+        # Unfiltered reads load all contents
+        exp = d
+        d = s.par("d")
+        assert isinstance(d, pd.DataFrame)
+        assert KEY not in backend._unread
+        assert_frame_equal(exp, d.query("i == 'seattle'").reset_index(drop=True))
+
+        # Filtered reads of loaded contents give the same result
+        d = s.par("d", filters={"i": ["seattle"]})
+        assert isinstance(d, pd.DataFrame)
+        assert_frame_equal(exp, d)
+
+        assert dict(foo="bar") == s.get_meta()
+
+    def test_commit(self, path: Path) -> None:
+        mp = Platform(backend="parquet", path=path)
+        s = Scenario(mp, **models["dantzig"])
+
+        file_d = path.joinpath("run", "1", "item", "d.parquet")
+        file_f = path.joinpath("run", "1", "item", "f.parquet")
+        mtime = file_d.stat().st_mtime_ns
+
+        s.check_out()
+        s.change_scalar("f", 100.0, "USD/km")
+        s.init_par("new/par", ["i"])
+        s.init_par("foo", ["j"])
+        s.commit("")
+
+        # Only changed items are written
+        assert mtime == file_d.stat().st_mtime_ns
+        assert file_f.exists()
+        assert path.joinpath("run", "1", "item", "new%2Fpar.parquet").exists()
+
+        # Files for removed items are deleted
+        s.check_out()
+        s.remove_par("foo")
+        s.commit("")
+        assert not path.joinpath("run", "1", "item", "foo.parquet").exists()
+
+        # Changes are visible after reloading
+        mp.close_db()
+        mp = Platform(backend="parquet", path=path)
+        s = Scenario(mp, **models["dantzig"])
+        assert dict(value=100.0, unit="USD/km") == s.scalar("f")
+        assert "foo" not in s.par_list()
+        assert "new/par" in s.par_list()
+        assert 0 == len(s.par("new/par"))
+
+    def test_dtype_backend(self, path: Path) -> None:
+        with pytest.raises(ValueError, match="dtype_backend='numpy_nullable'"):
+            ParquetBackend(path, dtype_backend="numpy_nullable")  # type: ignore[arg-type]
+
+        mp = Platform(backend="parquet", path=path, dtype_backend="pyarrow")
+        s = Scenario(mp, **models["dantzig"])
+
+        def check(data: object) -> pd.DataFrame:
+            assert isinstance(data, pd.DataFrame)
+            assert all(isinstance(dt, pd.ArrowDtype) for dt in data.dtypes)
+            return data
+
+        # Data read directly from file, data of loaded contents, and modified data all
+        # have pyarrow-backed dtypes
+        check(s.par("d", filters={"i": ["seattle"]}))
+        check(s.par("d"))
+        s.check_out()
+        s.add_par(
+            "d",
+            pd.DataFrame(
+                [["seattle", "chicago", 2.0, "km"]], columns=["i", "j", "value", "unit"]
+            ),
+        )
+        check(s.par("d"))
+        s.discard_changes()
+
+        # Conversion by Scenario.par() gives the same dtypes
+        d = check(s.par("d"))
+        assert_frame_equal(d, check(s.par("d", dtype_backend="pyarrow")))
+
+    def test_concurrent(self, path: Path) -> None:
+        mp1 = Platform(backend="parquet", path=path)
+        mp2 = Platform(backend="parquet", path=path)
+        mp3 = Platform(backend="parquet", path=path)
+
+        # Two platforms each commit a new scenario
+        for mp, name in (mp1, "x"), (mp2, "y"):
+            s = Scenario(mp, "m", name, version="new")
+            s.init_set("i")
+            s.add_set("i", [name])
+            s.commit("")
+
+        # A platform with no changes does not write on close
+        mtime = path.joinpath("platform.pkl").stat().st_mtime_ns
+        mp3.close_db()
+        assert mtime == path.joinpath("platform.pkl").stat().st_mtime_ns
+
+        # Both scenarios are stored, with distinct run IDs
+        mp = Platform(backend="parquet", path=path)
+        x, y = Scenario(mp, "m", "x"), Scenario(mp, "m", "y")
+        assert ["x"] == list(x.set("i")) and ["y"] == list(y.set("i"))
+        assert x.run_id() != y.run_id()
+
+        # Committing changes to the same run from two platforms raises
+        s1, s2 = Scenario(mp1, **models["dantzig"]), Scenario(mp2, **models["dantzig"])
+        for s in s1, s2:
+            s.check_out()
+            s.change_scalar("f", 100.0, "USD/km")
+        s1.commit("")
+        with pytest.raises(RuntimeError, match="changed by this and another"):
+            s2.commit("")
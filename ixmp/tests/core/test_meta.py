@@ -397,3 +397,28 @@ class TestMeta:
         mp.set_meta(meta, model=DANTZIG["model"])
         obs = mp.get_meta(model=DANTZIG["model"])
         assert obs == meta
+
+    def test_get_meta_frame(self, mp: ixmp.Platform) -> None:
+        ts0 = ixmp.TimeSeries(mp, **DANTZIG)
+        ts0.set_as_default()
+        ts0.set_meta({"sample_int": 3, "sample_string": "foo"})
+        ts1 = ixmp.TimeSeries(mp, DANTZIG["model"], "other", version="new")
+        ts1.commit("")
+        ts1.set_as_default()
+        ts1.set_meta({"sample_int": 4})
+
+        obs = mp.get_meta_frame()
+        assert ["model", "scenario", "version", "sample_int", "sample_string"] == list(
+            obs.columns
+        )
+        assert 2 == len(obs)
+        obs = obs.set_index("scenario")
+        assert [3, 4] == obs.loc[[DANTZIG["scenario"], "other"], "sample_int"].tolist()
+        assert ts1.version == obs.loc["other", "version"]
+        assert obs["sample_string"].isna().loc["other"]
+
+        # Filters
+        obs = mp.get_meta_frame(scenarios="other", names=["sample_int"])
+        assert ["model", "scenario", "version", "sample_int"] == list(obs.columns)
+        assert 1 == len(obs)
+        assert 0 == len(mp.get_meta_frame(models="not a model"))
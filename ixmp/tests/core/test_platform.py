@@ -64,6 +64,91 @@ def test_scenario_list(mp: ixmp.Platform) -> None:
     assert scenario[0] == "Hitchhiker"
 
 
+def test_scenario_list_filters(test_mp: ixmp.Platform) -> None:
+    model = "test_scenario_list_filters"
+    for scenario in "foo bar", "baz":
+        ts = ixmp.TimeSeries(test_mp, model, scenario, version="new")
+        ts.commit("")
+
+    # Regular expression matching model or scenario names
+    obs = test_mp.scenario_list(default=False, match="o b")
+    assert ["foo bar"] == obs["scenario"].tolist()
+    assert 2 == len(test_mp.scenario_list(default=False, match=re.compile("^test_sc")))
+
+    info = test_mp.scenario_list(default=False, model=model)
+    assert 2 == len(info)
+
+    # User
+    user = info["cre_user"].iloc[0]
+    assert 2 == len(test_mp.scenario_list(default=False, model=model, user=user))
+    assert 0 == len(test_mp.scenario_list(default=False, model=model, user="no user"))
+
+    # Date range
+    if is_ixmp4backend(test_mp._backend):
+        # IXMP4Backend does not provide creation/modification times
+        with pytest.raises(ValueError, match="no creation or modification times"):
+            test_mp.scenario_list(default=False, until="2000-01-01")
+    else:
+        assert 0 == len(test_mp.scenario_list(default=False, until="2000-01-01"))
+        obs = test_mp.scenario_list(default=False, model=model, since="2000-01-01")
+        assert 2 == len(obs)
+
+    # Locked state
+    assert 2 == len(test_mp.scenario_list(default=False, model=model, locked=False))
+    assert 0 == len(test_mp.scenario_list(default=False, model=model, locked=True))
+
+
+def test_scenario_list_cache(
+    test_mp: ixmp.Platform, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+    filter_scenarios = test_mp._backend.filter_scenarios
+
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        calls.append((args, kwargs))
+        return filter_scenarios(*args, **kwargs)
+
+    monkeypatch.setattr(test_mp._backend, "filter_scenarios", wrapped)
+    test_mp._scenario_list_cache.clear()
+
+    # Repeated calls with the same arguments use cached results
+    exp = test_mp.scenario_list(default=False)
+    assert_frame_equal(exp, test_mp.scenario_list(default=False))
+    assert 1 == len(calls)
+    # …including with filters applied to the cached results
+    test_mp.scenario_list(default=False, match="foo")
+    assert 1 == len(calls)
+
+    # Different arguments
+    test_mp.scenario_list(default=True)
+    assert 2 == len(calls)
+
+    # Filters without cached, unfiltered results are passed to the backend
+    test_mp._scenario_list_cache.clear()
+    expr = re.compile("foo")
+    test_mp.scenario_list(default=True, match=expr, locked=False)
+    assert dict(match=expr, locked=False) == calls[-1][1]
+    test_mp.scenario_list(default=True, match="foo", locked=False)
+    assert 3 == len(calls)
+
+    # Creating a TimeSeries invalidates the cache
+    ts = ixmp.TimeSeries(test_mp, "test_scenario_list_cache", "s", version="new")
+    ts.commit("")
+    obs = test_mp.scenario_list(default=False)
+    assert 4 <= len(calls)
+    assert len(exp) + 1 == len(obs)
+
+    # Caching can be disabled
+    monkeypatch.setattr(test_mp, "scenario_list_ttl", 0)
+    N = len(calls)
+    test_mp.scenario_list(default=False)
+    test_mp.scenario_list(default=False)
+    assert N + 2 == len(calls)
+
+
+# MemoryBackend and ParquetBackend do not support Platform.export_timeseries_data()
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_export_timeseries_data(mp: ixmp.Platform, tmp_path: Path) -> None:
     path = tmp_path / "export.csv"
     mp.export_timeseries_data(path, model="Douglas Adams", unit="???", region="World")
@@ -95,6 +180,9 @@ def test_export_ts_wrong_params(test_mp: ixmp.Platform, tmp_path: Path) -> None:
         )
 
 
+# MemoryBackend and ParquetBackend do not support Platform.export_timeseries_data()
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_export_ts_of_all_runs(mp: ixmp.Platform, tmp_path: Path) -> None:
     """Export timeseries of all runs."""
     path = tmp_path / "export.csv"
@@ -142,6 +230,9 @@ def test_export_ts_of_all_runs(mp: ixmp.Platform, tmp_path: Path) -> None:
     assert expected == len(obs)
 
 
+# MemoryBackend and ParquetBackend do not support Platform.export_timeseries_data()
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_export_timeseries_data_empty(mp: ixmp.Platform, tmp_path: Path) -> None:
     """Dont export data if given models/scenarios do not have any runs."""
     path = tmp_path / "export.csv"
@@ -154,6 +245,35 @@ def test_export_timeseries_data_empty(mp: ixmp.Platform, tmp_path: Path) -> None
     assert 0 == len(pd.read_csv(path, index_col=False, header=0))
 
 
+def test_timeseries(test_mp: ixmp.Platform) -> None:
+    model = "test_timeseries"
+    test_mp.add_unit("???")
+    for scenario, factor in (("a", 1.0), ("b", 10.0)):
+        ts = ixmp.TimeSeries(test_mp, model, scenario, version="new")
+        ts.add_timeseries(DATA[0].assign(value=DATA[0]["value"] * factor))
+        ts.commit("")
+        ts.set_as_default()
+
+    # Region name that pandas reads as missing by default
+    test_mp.add_region("NA", "country")
+    ts = ixmp.TimeSeries(test_mp, model, "c", version="new")
+    ts.add_timeseries(DATA[0].assign(region="NA"))
+    ts.commit("")
+    ts.set_as_default()
+
+    obs = test_mp.timeseries(models=model, scenarios=["a", "b"])
+    assert list(FIELDS["get_data_bulk"]) == list(obs.columns)
+    assert {"a", "b"} == set(obs["scenario"])
+    assert 2 * len(DATA[0]) == len(obs)
+    assert {"NA"} == set(test_mp.timeseries(models=model, scenarios="c")["region"])
+
+    # Filters
+    obs = test_mp.timeseries(models=[model], scenarios="b", years=2010)
+    assert 1 == len(obs)
+    assert 10.0 * DATA[0].query("year == 2010")["value"].item() == obs["value"].item()
+    assert 0 == len(test_mp.timeseries(models=model, variables="not a variable"))
+
+
 def test_unit_list(test_mp: ixmp.Platform) -> None:
     units = test_mp.units()
     assert ("cases" in units) is True
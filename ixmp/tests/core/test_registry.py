@@ -0,0 +1,88 @@
+"""Tests of :mod:`ixmp.core.registry`."""
+
+import gc
+from pathlib import Path
+
+import pytest
+
+import ixmp
+from ixmp.core.registry import REGISTRY, Registry
+
+
+class TestRegistry:
+    @pytest.fixture
+    def url(self, test_mp: ixmp.Platform) -> str:
+        ts = ixmp.TimeSeries(test_mp, "test_registry", "s", version="new")
+        ts.commit("")
+        ts.set_as_default()
+        return f"ixmp://{test_mp.name}/{ts.url}"
+
+    def test_get(self, test_mp: ixmp.Platform, url: str) -> None:
+        r = Registry(maxsize=1)
+        r.add(test_mp)
+
+        # Repeated calls return the same object
+        ts = r.get(url, ixmp.TimeSeries)
+        assert ts is r.get(url, ixmp.TimeSeries)
+        assert 1 == len(r)
+
+        # Objects share one Platform and backend
+        url_default = url.split("#")[0]
+        ts2 = r.get(url_default, ixmp.TimeSeries)
+        assert ts is not ts2
+        assert ts.version == ts2.version
+        assert ts.platform._backend is ts2.platform._backend
+        assert ts.platform._backend is r.platform(test_mp.name)._backend
+
+        # Object is kept alive while referenced, even if not among the most recent
+        id_ts = id(ts)
+        assert id_ts == id(r.get(url, ixmp.TimeSeries))
+        del ts, ts2
+        gc.collect()
+        assert 1 == len(r)
+
+        with pytest.raises(ValueError, match="version 'new'"):
+            r.get(url_default + "#new", ixmp.TimeSeries)
+
+        r.clear()
+        assert 0 == len(r)
+
+    def test_from_url(self, test_mp: ixmp.Platform, url: str) -> None:
+        try:
+            REGISTRY.add(test_mp)
+            ts0, mp0 = ixmp.TimeSeries.from_url(url, registry=True)
+            ts1, mp1 = ixmp.TimeSeries.from_url(url, registry=True)
+            assert ts0 is ts1 and mp0 is mp1 and mp0 is test_mp
+
+            # Without registry=True, new objects are created
+            ts2, mp2 = ixmp.TimeSeries.from_url(url)
+            assert ts2 is not ts0 and mp2 is not mp0
+        finally:
+            REGISTRY.clear()
+
+    def test_add(self, test_mp: ixmp.Platform, url: str) -> None:
+        r = Registry()
+        ts = ixmp.TimeSeries(test_mp, "test_registry", "s")
+
+        # An added TimeSeries and its platform are returned
+        r.add(test_mp, ts)
+        assert ts is r.get(url, ixmp.TimeSeries)
+        assert test_mp is r.platform(test_mp.name)
+
+        # A different Platform with the same name cannot be added
+        mp = ixmp.Platform(test_mp.name)
+        with pytest.raises(ValueError, match="already registered"):
+            r.add(mp)
+
+        # A TimeSeries must be stored on the given platform
+        with pytest.raises(ValueError, match="is not stored on"):
+            Registry().add(mp, ts)
+
+    def test_platform_memory(self, tmp_path: Path) -> None:
+        ixmp.config.add_platform("test_registry_memory", "memory", tmp_path / "x.pkl")
+        try:
+            # Platforms using MemoryBackend are not created by the registry
+            with pytest.raises(ValueError, match="use Registry.add"):
+                Registry().platform("test_registry_memory")
+        finally:
+            ixmp.config.remove_platform("test_registry_memory")
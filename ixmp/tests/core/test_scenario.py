@@ -12,9 +12,9 @@ import pytest
 from pandas.testing import assert_frame_equal
 
 import ixmp
+from ixmp.backend.jdbc import JDBCBackend
 from ixmp.testing import (
     KEY_BACKENDS,
-    MARK,
     _platform_fixture,
     assert_logs,
     make_dantzig,
@@ -139,10 +139,13 @@ class TestScenario:
     """Tests of :class:`ixmp.Scenario`."""
 
     # Initialize Scenario
+    # MemoryBackend and ParquetBackend do not initialize items for scheme='MESSAGE'
+    @pytest.mark.memory_never
+    @pytest.mark.parquet_never
     def test_init(self, test_mp: "Platform", scen_empty: "Scenario") -> None:
         # Empty scenario has version == 0 on JDBC, but 1 on ixmp4 because the run.id
-        # column starts at 1
-        expected_version = 1 if is_ixmp4backend(test_mp._backend) else 0
+        # column starts at 1, and on MemoryBackend
+        expected_version = 0 if isinstance(test_mp._backend, JDBCBackend) else 1
         assert scen_empty.version == expected_version
 
         # A scenario with scheme='MESSAGE' can only be created with a subclass
@@ -180,8 +183,47 @@ class TestScenario:
         assert len(scenario_df["version"]) == 1
         assert scen.version == scenario_df["version"].item()
 
+    def test_lazy(self, test_mp: "Platform") -> None:
+        s0 = ixmp.Scenario(test_mp, "test_lazy", "s", version="new")
+        s0.init_set("i")
+        s0.add_set("i", ["i0", "i1"])
+        s0.commit("")
+        s0.set_as_default()
+
+        # Handle to a scenario that does not exist can be created; identifiers are
+        # available without loading
+        s1 = ixmp.Scenario(test_mp, "test_lazy", "does not exist", lazy=True)
+        assert s1._lazy
+        assert "test_lazy/does not exist" == s1.url
+
+        # Error is raised on first access, and again on subsequent accesses
+        for _ in range(2):
+            with pytest.raises(Exception):
+                s1.set_list()
+        del s1
+
+        # Default version is identified on first access
+        s2 = ixmp.Scenario(test_mp, "test_lazy", "s", lazy=True)
+        assert s2.version is None
+        assert ["i0", "i1"] == list(s2.set("i"))
+        assert not s2._lazy
+        assert s0.version == s2.version
+        assert s0.url == s2.url
+
+        # Specific version
+        s3 = ixmp.Scenario(test_mp, "test_lazy", "s", version=s0.version, lazy=True)
+        assert f"test_lazy/s#{s0.version}" == s3.url
+        assert s3.has_set("i")
+
+        with pytest.raises(ValueError, match="lazy=True with version='new'"):
+            ixmp.Scenario(test_mp, "test_lazy", "s", version="new", lazy=True)
+
     # NOTE IXMP4(Backend) doesn't raise the same error/message as expected here
     @pytest.mark.ixmp4_not_yet
+    # Platform(name) gives a new, empty MemoryBackend
+    @pytest.mark.memory_never
+    # Platform instances using one ParquetBackend directory do not share changes
+    @pytest.mark.parquet_never
     def test_from_url(self, mp: "Platform", caplog: pytest.LogCaptureFixture) -> None:
         url = f"ixmp://{mp.name}/Douglas Adams/Hitchhiker"
 
@@ -212,6 +254,9 @@ class TestScenario:
         assert scen is None and isinstance(mp, ixmp.Platform)
 
     # Clone Scenario
+    # MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+    @pytest.mark.memory_never
+    @pytest.mark.parquet_never
     def test_clone(self, mp: "Platform") -> None:
         scen = ixmp.Scenario(mp, **models["dantzig"], version=1)
         scen.remove_solution()
@@ -463,6 +508,264 @@ class TestScenario:
         assert isinstance(foo, pd.DataFrame)
         assert {"i0"} == set(foo["i"])
 
+    def test_add_set_frame(self, scen_empty: "Scenario") -> None:
+        scen = scen_empty
+        scen.init_set("i")
+        scen.add_set("i", ["i0", "i1", "i2"])
+        scen.init_set("foo", idx_sets=["i", "i"], idx_names=["i0", "i1"])
+        scen.add_set("foo", pd.DataFrame([["i0", "i0"]], columns=["i0", "i1"]))
+
+        # Comments in a column; the input is not modified
+        data = pd.DataFrame(
+            [["i0", "i1", "c1"], ["i1", "i2", "c2"]], columns=["i0", "i1", "comment"]
+        )
+        scen.add_set("foo", data)
+        assert ["i0", "i1", "comment"] == data.columns.tolist()
+
+        # Comments as argument; element that already exists
+        data = pd.DataFrame([["i0", "i0"], ["i2", "i0"]], columns=["i0", "i1"])
+        scen.add_set("foo", data, comment=["c3", "c4"])
+
+        result = scen.set("foo")
+        assert isinstance(result, pd.DataFrame)
+        assert {("i0", "i0"), ("i0", "i1"), ("i1", "i2"), ("i2", "i0")} == set(
+            result[["i0", "i1"]].itertuples(index=False, name=None)
+        )
+
+        # Exceptions raised on invalid arguments
+        with pytest.raises(KeyError, match=r"no column\(s\) \['i1'\] for 2-D set"):
+            scen.add_set("foo", data[["i0"]])
+        with pytest.raises(ValueError, match="Comment 'c5' without matching key"):
+            scen.add_set("foo", data, comment=["c3", "c4", "c5"])
+        with pytest.raises(ValueError, match=r"Key \['i2', 'i0'\] without matching"):
+            scen.add_set("foo", data, comment="c3")
+
+    def test_get_items(self, scen_empty: "Scenario") -> None:
+        scen = scen_empty
+        scen.init_set("i")
+        scen.add_set("i", ["i0", "i1"])
+        scen.init_set("j")
+        scen.add_set("j", ["j0", "j1"])
+        scen.init_par("p", idx_sets=["i", "j"])
+        scen.add_par("p", pd.DataFrame(dict(i=["i0", "i1"], j="j0", value=1.0)))
+        scen.init_par("q", idx_sets=["j"])
+        scen.add_par("q", pd.DataFrame(dict(j=["j0", "j1"], value=2.0)))
+        scen.init_scalar("s", 3.0, "???")
+
+        # Names in arbitrary order; of several types
+        result = scen.get_items(["q", "s", "p", "i"])
+        assert ["q", "s", "p", "i"] == list(result)
+        for name in ("p", "q", "i"):
+            expected = scen.set(name) if name == "i" else scen.par(name)
+            assert_frame_equal(
+                pd.DataFrame(expected).reset_index(drop=True),
+                pd.DataFrame(result[name]).reset_index(drop=True),
+                check_like=True,
+            )
+        assert dict(value=3.0, unit="???") == result["s"]
+
+        # Filters apply only to items with the respective dimension
+        result = scen.get_items(["p", "q"], filters=dict(i=["i1"]))
+        p, q = result["p"], result["q"]
+        assert isinstance(p, pd.DataFrame) and isinstance(q, pd.DataFrame)
+        assert ["i1"] == p["i"].tolist()
+        assert 2 == len(q)
+
+        with pytest.raises(KeyError, match="'foo'"):
+            scen.get_items(["p", "foo"])
+
+    def test_par_array(
+        self, monkeypatch: pytest.MonkeyPatch, scen_empty: "Scenario"
+    ) -> None:
+        scen = scen_empty
+        scen.init_set("i")
+        scen.add_set("i", ["i0", "i1", "i2"])
+        scen.init_set("j")
+        scen.add_set("j", ["j1", "j0"])
+        scen.init_par("p", idx_sets=["i", "j", "i"], idx_names=["i", "j", "k"])
+        data = pd.DataFrame(
+            [["i2", "j0", "i0", 1.0], ["i0", "j1", "i1", 2.0]],
+            columns=["i", "j", "k", "value"],
+        )
+        scen.add_par("p", data.assign(unit="???"))
+        scen.init_scalar("s", 3.0, "???")
+
+        result = scen.par_array("p")
+
+        # Dimensions and coordinates from index names and index sets, in set order
+        assert ("i", "j", "k") == result.dims
+        assert ["j1", "j0"] == result.coords["j"].values.tolist()
+        assert (3, 2, 3) == result.shape
+
+        # Same values as long-format data
+        assert data["value"].tolist() == [
+            result.loc[i, j, k].item() for i, j, k in data[["i", "j", "k"]].to_numpy()
+        ]
+        assert 2 == np.count_nonzero(~np.isnan(result.to_numpy()))
+
+        # Fill value
+        assert 16 == (scen.par_array("p", fill_value=0.0) == 0.0).sum()
+
+        # Scalar
+        assert 3.0 == scen.par_array("s").item()
+
+        # Error: labels in the data that do not match any set element, for instance
+        # elements with a different type
+        monkeypatch.setattr(scen, "set", lambda name: pd.Series(["i0", "i1", 2]))
+        with pytest.raises(ValueError, match=r"Labels \['i2'\] for dimension 'i'"):
+            scen.par_array("p")
+
+    def test_item_hashes(self, test_mp: "Platform", scen_empty: "Scenario") -> None:
+        def populate(s: "Scenario", order: slice) -> None:
+            s.init_set("i")
+            s.add_set("i", ["i0", "i1", "i2"][order])
+            s.init_par("p", idx_sets=["i"])
+            data = pd.DataFrame(dict(i=["i0", "i1", "i2"], value=[1.0, 2.0, 3.0]))
+            s.add_par("p", data.iloc[order].assign(unit="???"))
+            s.init_scalar("s", 3.0, "???")
+
+        scen = scen_empty
+        populate(scen, slice(None))
+        other = ixmp.Scenario(test_mp, scen.model, "other", version="new")
+        populate(other, slice(None, None, -1))
+
+        h0 = scen.item_hashes()
+        assert {"i", "p", "s"} <= set(h0)
+
+        # Same hashes for the same elements in a different order
+        assert {k: h0[k] for k in "ips"} == other.item_hashes(["i", "p", "s"])
+
+        # Only the hash of a changed item differs
+        scen.add_par("p", pd.DataFrame(dict(i=["i0"], value=[4.0], unit="???")))
+        h1 = scen.item_hashes(["p", "i"])
+        assert ["p", "i"] == list(h1)
+        assert h0["i"] == h1["i"] and h0["p"] != h1["p"]
+
+        with pytest.raises(KeyError, match="'foo'"):
+            scen.item_hashes(["foo"])
+
+    def test_iter_chunks(self, scen_empty: "Scenario") -> None:
+        scen = scen_empty
+        scen.init_set("i")
+        scen.add_set("i", [f"i{n}" for n in range(5)])
+        scen.init_par("p", idx_sets=["i"])
+        scen.add_par(
+            "p",
+            pd.DataFrame(dict(i=[f"i{n}" for n in range(5)], value=1.0, unit="???")),
+        )
+        scen.init_scalar("s", 3.0, "???")
+
+        chunks: list[Any] = list(scen.iter_chunks("p", chunksize=2))
+        assert [2, 2, 1] == list(map(len, chunks))
+        assert_frame_equal(
+            pd.DataFrame(scen.par("p")).reset_index(drop=True),
+            pd.concat(chunks, ignore_index=True),
+        )
+
+        # Filters are applied
+        chunks = list(scen.iter_chunks("p", chunksize=2, filters=dict(i=["i1", "i3"])))
+        assert 1 == len(chunks) and ["i1", "i3"] == chunks[0]["i"].tolist()
+
+        # Index set and scalar
+        assert 3 == len(list(scen.iter_chunks("i", chunksize=2)))
+        assert [dict(value=3.0, unit="???")] == list(scen.iter_chunks("s"))
+
+        with pytest.raises(KeyError, match="'foo'"):
+            next(scen.iter_chunks("foo"))
+        with pytest.raises(ValueError, match="chunksize=0"):
+            next(scen.iter_chunks("p", chunksize=0))
+
+    def test_transact_buffer(
+        self,
+        scen_empty: "Scenario",
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        scen = scen_empty
+        scen.init_set("i")
+        scen.add_set("i", ["i0", "i1"])
+        scen.init_set("m", idx_sets=["i"])
+        scen.init_par("p", idx_sets=["i"])
+        scen.commit("Initialize")
+
+        # Record calls to the backend
+        be = scen.platform._backend
+        calls = []
+        original = be.item_set_elements_frame
+
+        def item_set_elements_frame(s: Any, type: Any, name: str, data: Any) -> None:
+            calls.append((name, len(data)))
+            original(s, type, name, data)
+
+        monkeypatch.setattr(be, "item_set_elements_frame", item_set_elements_frame)
+
+        def p(i: str, value: float) -> pd.DataFrame:
+            return pd.DataFrame(dict(i=[i], value=value, unit="???"))
+
+        with scen.transact(buffer=True):
+            for args in ("i0", 1.0), ("i1", 2.0), ("i0", 3.0):
+                scen.add_par("p", p(*args))
+            scen.add_set("m", pd.DataFrame(dict(i=["i0"])))
+            scen.add_set("m", pd.DataFrame(dict(i=["i1"])))
+
+            # Nothing sent to the backend
+            assert [] == calls
+
+        # One call per item; sets first; repeated keys merged
+        assert [("m", 2), ("p", 2)] == calls
+        result = pd.DataFrame(scen.par("p"))
+        assert {"i0": 3.0, "i1": 2.0} == result.set_index("i")["value"].to_dict()
+
+        # Reading an item within the block sends buffered data to the backend
+        with scen.transact(buffer=True):
+            scen.add_par("p", p("i0", 4.0))
+            result = pd.DataFrame(scen.par("p", filters=dict(i=["i0"])))
+            assert [4.0] == result["value"].tolist()
+
+        # Buffered data are sent before data read from file
+        calls.clear()
+        monkeypatch.setattr(
+            be, "read_file", lambda *args, **kwargs: calls.append(("read_file", 0))
+        )
+        with scen.transact(buffer=True):
+            scen.add_par("p", p("i0", 6.0))
+            scen.read_excel(tmp_path.joinpath("data.xlsx"))
+        assert [("p", 1), ("read_file", 0)] == calls
+
+        # Buffered data are discarded on error
+        calls.clear()
+        with pytest.raises(RuntimeError), scen._buffer_writes(True):
+            scen.add_par("p", p("i1", 5.0))
+            raise RuntimeError
+        assert [] == calls and scen._write_buffer is None
+
+    def test_add_categories(self, scen_empty: "Scenario") -> None:
+        scen = scen_empty
+        scen.init_set("technology")
+        scen.add_set("technology", ["t0", "t1", "t2"])
+
+        data = pd.DataFrame(
+            [["t0", "c0"], ["t1", "c0"], ["t2", "c1"], ["t0", "c1"]],
+            columns=["key", "category"],
+        )
+
+        # Exception raised on invalid arguments
+        with pytest.raises(ValueError, match="missing required columns.*category"):
+            scen.add_categories("technology", data[["key"]])
+
+        # NOTE On JDBC, cat_set_elements is restricted to MESSAGE scenarios
+        if isinstance(scen.platform._backend, JDBCBackend):
+            with pytest.raises(TypeError, match="No matching overloads found"):
+                scen.add_categories("technology", data)
+            return
+
+        scen.add_categories("technology", data)
+
+        backend = scen.platform._backend
+        assert ["c0", "c1"] == backend.cat_list(scen, "technology")
+        assert ["t0", "t1"] == backend.cat_get_elements(scen, "technology", "c0")
+        assert ["t2", "t0"] == backend.cat_get_elements(scen, "technology", "c1")
+
     # Retrieve data
     def test_idx(self, scen: "Scenario") -> None:
         assert scen.idx_sets("d") == ["i", "j"]
@@ -490,6 +793,24 @@ class TestScenario:
         with pytest.warns(DeprecationWarning, match="ignored kwargs"):
             scen.par("d", i=["seattle"])
 
+    def test_dtype_backend(self, scen: "Scenario") -> None:
+        pytest.importorskip("pyarrow")
+
+        d = scen.par("d", dtype_backend="pyarrow")
+        assert isinstance(d, pd.DataFrame)
+        assert all(d[c].dtype == "string[pyarrow]" for c in ("i", "j", "unit"))
+        assert d["value"].dtype == "double[pyarrow]"
+
+        i = scen.set("i", dtype_backend="pyarrow")
+        assert i.dtype == "string[pyarrow]"
+
+        # Scalar data are returned unchanged
+        assert scen.par("f") == scen.par("f", dtype_backend="pyarrow")
+
+        x = scen.var("x", dtype_backend="numpy_nullable")
+        assert isinstance(x, pd.DataFrame)
+        assert x["lvl"].dtype == "Float64"
+
     def test_iter_par_data(self, scen: "Scenario") -> None:
         # Iterator returns the expected parameter names
         exp = ["a", "b", "d", "f"]
@@ -550,6 +871,9 @@ class TestScenario:
         ):
             list(scen.items(ixmp.ItemType.SET, filters={"foo": "bar"}))
 
+    # MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+    @pytest.mark.memory_never
+    @pytest.mark.parquet_never
     def test_var(self, scen: "Scenario") -> None:
         df = scen.var("x", filters={"i": ["seattle"]})
         assert isinstance(df, pd.DataFrame)
@@ -598,6 +922,9 @@ class TestScenario:
             scen.load_scenario_data()
 
     # I/O
+    # MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+    @pytest.mark.memory_never
+    @pytest.mark.parquet_never
     def test_excel_io(
         self,
         scen_f: "Scenario",
@@ -689,6 +1016,9 @@ class TestScenario:
         # Succeeds with add_units=True
         s.read_excel(tmp_path, add_units=True, init_items=True)
 
+    # MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+    @pytest.mark.memory_never
+    @pytest.mark.parquet_never
     def test_solve(self, tmp_path: Path, scen_f: "Scenario") -> None:
         from subprocess import run
 
@@ -722,7 +1052,7 @@ class TestScenario:
             assert "'notapackage'.'(not installed)'" in result.stdout.decode()
 
     # Combined tests
-    @MARK["ixmp4-pandas-3"]
+    @pytest.mark.ixmp4_pandas_3
     def test_meta(
         self, mp: "Platform", test_dict: dict[str, bool | float | int | str]
     ) -> None:
@@ -759,7 +1089,7 @@ class TestScenario:
             # NOTE Triggering the error on purpose
             scen.set_meta("test_string", complex(1, 1))  # type: ignore[arg-type]
 
-    @MARK["ixmp4-pandas-3"]
+    @pytest.mark.ixmp4_pandas_3
     def test_meta_bulk(
         self, mp: "Platform", test_dict: dict[str, bool | float | int | str]
     ) -> None:
@@ -778,6 +1108,57 @@ class TestScenario:
         assert scen.get_meta("new_attr") == "new_attr"
 
 
+def test__clone_helpers() -> None:
+    from ixmp.core import scenario
+
+    data = pd.DataFrame(
+        [["a", 2010, 1.0, 0.5], ["b", 2020, 2.0, 0.0], ["c", 2030, 3.0, 0.0]],
+        columns=["i", "y", "lvl", "mrg"],
+    )
+
+    # Keys are converted to lists of str, whole columns at a time
+    assert [
+        (["a", "2010"], 1.0, 0.5, ""),
+        (["b", "2020"], 2.0, 0.0, ""),
+        (["c", "2030"], 3.0, 0.0, ""),
+    ] == list(scenario._solution_elements(data))
+    assert [(None, 1.0, 0.5, "")] == list(
+        scenario._solution_elements(dict(lvl=1.0, mrg=0.5))
+    )
+
+
+def test__clone_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The generic clone reads and writes each item in chunks."""
+    from ixmp.core import scenario
+
+    monkeypatch.setattr(scenario, "ITEM_CHUNKSIZE", 2)
+
+    mp0, mp1 = ixmp.Platform(backend="memory"), ixmp.Platform(backend="memory")
+    s0 = make_dantzig(mp0)
+    mp1.add_region("DantzigLand", "country")
+
+    # Record the number of elements in each write to the destination
+    sizes = []
+    b1 = mp1._backend
+    original = b1.item_set_elements_frame
+
+    def item_set_elements_frame(*args: Any) -> None:
+        sizes.append(len(args[-1]))
+        original(*args)
+
+    monkeypatch.setattr(b1, "item_set_elements_frame", item_set_elements_frame)
+
+    # Clone between platforms uses the generic implementation
+    s1 = s0.clone(platform=mp1)
+
+    assert 2 == max(sizes)
+    for name in "i", "j", "d":
+        assert_frame_equal(
+            pd.DataFrame(s0.get_items([name])[name]),
+            pd.DataFrame(s1.get_items([name])[name]),
+        )
+
+
 def test_range(scen_empty: "Scenario") -> None:
     scen = scen_empty
 
@@ -952,6 +1333,9 @@ def test_filter_str(scen_empty: "Scenario") -> None:
     assert_frame_equal(exp[["s", "value"]], obs[["s", "value"]])
 
 
+# MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_solve_callback(test_mp: "Platform", request: pytest.FixtureRequest) -> None:
     """Test the callback argument to Scenario.solve().
 
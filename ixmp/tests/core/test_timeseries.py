@@ -10,10 +10,14 @@ from numpy import testing as npt
 from pandas.testing import assert_frame_equal
 
 from ixmp import IAMC_IDX, Scenario, TimeSeries
-from ixmp.testing import DATA, MARK, models
+from ixmp.backend.jdbc import JDBCBackend
+from ixmp.backend.memory import MemoryBackend
+from ixmp.testing import DATA, models
 from ixmp.util.ixmp4 import is_ixmp4backend
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from ixmp.core.platform import Platform
     from ixmp.types import TimeSeriesIdentifiers
 
@@ -170,9 +174,13 @@ class TestTimeSeries:
 
     def test_run_id(self, ts: TimeSeries) -> None:
         # New, un-committed TimeSeries has run_id of -1 on JDBC, but 1 on ixmp4 because
-        # IXMP4Backend needs to store/commit meta values upon initialization
-        expected_id = 1 if is_ixmp4backend(ts.platform._backend) else -1
-        assert ts.run_id() == expected_id
+        # IXMP4Backend needs to store/commit meta values upon initialization.
+        # MemoryBackend assigns a positive run_id on initialization.
+        if isinstance(ts.platform._backend, MemoryBackend):
+            assert ts.run_id() > 0
+        else:
+            expected_id = 1 if is_ixmp4backend(ts.platform._backend) else -1
+            assert ts.run_id() == expected_id
 
         # The run ID is a positive integer
         ts.commit("")
@@ -212,7 +220,38 @@ class TestTimeSeries:
         with pytest.raises(ValueError):
             ts.add_timeseries(DATA[0].drop("unit", axis=1))
 
-    @MARK["ixmp4-pandas-3"]
+    @pytest.mark.ixmp4_pandas_3
+    @pytest.mark.parametrize("suffix", [".csv", ".xlsx"])
+    def test_read_file(self, tmp_path: "Path", ts: TimeSeries, suffix: str) -> None:
+        ts.commit("")
+
+        # Write long-format data to file
+        path = tmp_path.joinpath(f"data{suffix}")
+        data = DATA[2050]
+        if suffix == ".csv":
+            data.to_csv(path, index=False)
+        else:
+            data.to_excel(path, index=False)
+
+        # Data are read in chunks; years outside the limits are discarded
+        rows: list[int] = []
+        ts.read_file(
+            path, firstyear=2010, lastyear=2040, chunksize=4, progress=rows.append
+        )
+        assert [4, 6] == rows
+        exp = data.query("2010 <= year <= 2040").reset_index(drop=True)
+        assert_timeseries(ts, exp)
+
+        # Error: region not defined on the Platform
+        path = tmp_path.joinpath("invalid.csv")
+        data.assign(region="Mars").to_csv(path, index=False)
+        with pytest.raises(ValueError, match=r"region\(s\) \['Mars'\]"):
+            ts.read_file(path)
+
+        # Changes are discarded
+        assert_timeseries(ts, exp)
+
+    @pytest.mark.ixmp4_pandas_3
     def test_discard_changes(self, ts: TimeSeries) -> None:
         ts.commit("")
         assert 0 == len(ts.timeseries())
@@ -244,21 +283,39 @@ class TestTimeSeries:
         timeseries = ts.timeseries(iamc=True) if format == "wide" else ts.timeseries()
         assert_frame_equal(exp, timeseries)
 
+    def test_get_dtype_backend(self, ts: TimeSeries) -> None:
+        pytest.importorskip("pyarrow")
+
+        ts.add_timeseries(DATA[0])
+        ts.commit("")
+
+        result = ts.timeseries(dtype_backend="pyarrow")
+        assert result["region"].dtype == "string[pyarrow]"
+        assert result["value"].dtype == "double[pyarrow]"
+        # Same values as the default
+        assert_frame_equal(ts.timeseries(), result, check_dtype=False)
+
     @pytest.mark.parametrize(
         "year_arg",
         [
             [2020],  # Single element
             [2010, 2020],  # Multiple elements
             2020,  # bare int, not in a list
-            # Raises java.lang.java.lang.ClassCastException on JDBC
-            # Passes on IXMP4Backend because pandas can handle int and str
-            pytest.param(["2010"], marks=pytest.mark.xfail),
+            ["2010"],  # str; see below
         ],
     )
     def test_get_year(
-        self, ts: TimeSeries, year_arg: int | list[int] | list[str]
+        self,
+        request: pytest.FixtureRequest,
+        ts: TimeSeries,
+        year_arg: int | list[int] | list[str],
     ) -> None:
         """`year` arg to :meth:`.TimeSeries.timeseries` accepts only :class:`int`."""
+        if year_arg == ["2010"] and isinstance(ts.platform._backend, JDBCBackend):
+            # Raises java.lang.java.lang.ClassCastException on JDBC. Passes on other
+            # backends, because pandas can handle int and str
+            request.applymarker(pytest.mark.xfail)
+
         ts.add_timeseries(DATA[0])
         ts.commit("")
 
@@ -334,15 +391,19 @@ class TestTimeSeries:
         "commit",
         [
             pytest.param(True),
-            pytest.param(
-                False,
-                marks=pytest.mark.xfail(
-                    reason="TimeSeries must be checked in to retrieve data."
-                ),
-            ),
+            pytest.param(False),
         ],
     )
-    def test_remove(self, ts: TimeSeries, commit: bool) -> None:
+    def test_remove(
+        self, request: pytest.FixtureRequest, ts: TimeSeries, commit: bool
+    ) -> None:
+        if not commit and not isinstance(ts.platform._backend, MemoryBackend):
+            request.applymarker(
+                pytest.mark.xfail(
+                    reason="TimeSeries must be checked in to retrieve data."
+                )
+            )
+
         df = expected(DATA[2050], ts)
 
         ts.add_timeseries(DATA[2050])
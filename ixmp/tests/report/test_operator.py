@@ -12,6 +12,7 @@ from genno.testing import assert_qty_equal
 from pandas.testing import assert_frame_equal
 
 from ixmp import Scenario, TimeSeries
+from ixmp.core.registry import REGISTRY
 from ixmp.model.dantzig import TABLE_DATA as dantzig_data
 from ixmp.report.operator import (
     from_url,
@@ -36,17 +37,23 @@ def test_from_url(test_mp: "Platform", request: pytest.FixtureRequest) -> None:
 
     full_url = f"ixmp://{ts.platform.name}/{ts.url}"
 
-    # Operator runs
-    result = from_url(full_url)
-    # Result is of the default class
-    assert result.__class__ is TimeSeries
-    # Same object was retrieved
-    assert ts.url == result.url
-
-    # Same, but specifying Scenario
-    result = from_url(full_url, Scenario)
-    assert result.__class__ is Scenario
-    assert ts.url == result.url
+    try:
+        # Use the existing platform
+        REGISTRY.add(test_mp)
+
+        # Operator runs
+        result = from_url(full_url)
+        # Result is of the default class
+        assert result.__class__ is TimeSeries
+        # Same object was retrieved
+        assert ts.url == result.url
+
+        # Same, but specifying Scenario
+        result = from_url(full_url, Scenario)
+        assert result.__class__ is Scenario
+        assert ts.url == result.url
+    finally:
+        REGISTRY.clear()
 
 
 # TODO For all genno-related type ignores, remove once genno adds annotations
@@ -154,6 +154,8 @@ def test_platform_units(
     assert unit.dimensionality == {"[USD]": 1, "[pkm]": -1}
 
 
+# Platform(name) gives a new, empty MemoryBackend
+@pytest.mark.memory_never
 def test_cli(
     ixmp_cli: "Runner",
     test_mp: "Platform",
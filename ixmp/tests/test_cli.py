@@ -126,6 +126,14 @@ def test_list(ixmp_cli: Runner, test_mp: "Platform") -> None:
 """
     ), result.output
 
+    # Other filters
+    result = ixmp_cli.invoke(
+        ["--platform", test_mp.name, "list", "--user", "no-user-named-foo"]
+        + ["--since", "2000-01-01", "--until", "2100-01-01", "--unlocked"]
+    )
+    assert result.exit_code == 0, (result.exception, result.output)
+    assert "0 total scenarios" in result.output
+
 
 def test_platform(ixmp_cli: Runner, tmp_path: Path) -> None:
     """Test 'platform' command."""
@@ -235,6 +243,10 @@ def test_platform_copy(
         call("copy", f"p1-{test_specific_name}", f"p3-{test_specific_name}")
 
 
+# Platform(name) gives a new, empty MemoryBackend
+@pytest.mark.memory_never
+# Platform instances using one ParquetBackend directory do not share changes
+@pytest.mark.parquet_never
 def test_import_ts(ixmp_cli: Runner, test_mp: "Platform", test_data_path: Path) -> None:
     # Ensure the 'canning problem'/'standard' TimeSeries exists
     populate_test_platform(test_mp)
@@ -256,11 +268,16 @@ def test_import_ts(ixmp_cli: Runner, test_mp: "Platform", test_data_path: Path)
             "2020",
             "--lastyear",
             "2200",
+            "--chunksize",
+            "1",
             str(test_data_path / "timeseries_canning.csv"),
         ]
     )
     assert result.exit_code == 0, result.output
 
+    # Progress is shown
+    assert "Read 1 rows from" in result.output
+
     # Expected data
     exp = pd.DataFrame.from_dict(
         {
@@ -283,6 +300,10 @@ def test_import_ts(ixmp_cli: Runner, test_mp: "Platform", test_data_path: Path)
     assert len(scen.timeseries(variable=["Testing"])) == 0
 
 
+# Platform(name) gives a new, empty MemoryBackend
+@pytest.mark.memory_never
+# Platform instances using one ParquetBackend directory do not share changes
+@pytest.mark.parquet_never
 def test_excel_io(ixmp_cli: Runner, test_mp: "Platform", tmp_path: Path) -> None:
     populate_test_platform(test_mp)
     tmp_path /= "dantzig.xlsx"
@@ -345,6 +366,10 @@ def test_excel_io(ixmp_cli: Runner, test_mp: "Platform", tmp_path: Path) -> None
     assert result.exit_code == 0, result.output
 
 
+# Platform(name) gives a new, empty MemoryBackend
+@pytest.mark.memory_never
+# Platform instances using one ParquetBackend directory do not share changes
+@pytest.mark.parquet_never
 def test_excel_io_filters(
     ixmp_cli: Runner, test_mp: "Platform", tmp_path: Path
 ) -> None:
@@ -405,6 +430,10 @@ def test_show_versions(ixmp_cli: Runner) -> None:
 
 # FIXME This is again the parameter error for IXMP4Backend and the DantzigModel:
 # Unable to open input file (RC=2) default.gms
+# Platform(name) gives a new, empty MemoryBackend
+@pytest.mark.memory_never
+# ParquetBackend cannot solve Scenarios using GAMS
+@pytest.mark.parquet_never
 @pytest.mark.ixmp4_not_yet
 def test_solve(ixmp_cli: Runner, test_mp: "Platform") -> None:
     populate_test_platform(test_mp)
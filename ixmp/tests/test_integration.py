@@ -20,6 +20,9 @@ TS_DF_CLEARED = TS_DF.copy()
 TS_DF_CLEARED.loc[0, 2005] = np.nan
 
 
+# MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_run_clone(
     caplog: pytest.LogCaptureFixture,
     test_mp: "Platform",
@@ -79,6 +82,9 @@ def test_run_clone(
         )
 
 
+# MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 def test_run_remove_solution(
     test_mp: "Platform", request: pytest.FixtureRequest
 ) -> None:
@@ -141,6 +141,9 @@ class TestGAMSInfo:
         assert msg.format(str(tmp_path)) == gi2.version
 
 
+# MemoryBackend and ParquetBackend cannot solve Scenarios using GAMS
+@pytest.mark.memory_never
+@pytest.mark.parquet_never
 class TestGAMSModel:
     @pytest.fixture(scope="class")
     def dantzig(
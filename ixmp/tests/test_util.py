@@ -3,7 +3,7 @@
 import logging
 import re
 from contextlib import nullcontext
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -12,6 +12,8 @@ import pytest
 from pytest import mark, param
 
 from ixmp import Scenario, util
+from ixmp.backend.base import CachingBackend
+from ixmp.backend.jdbc import JDBCBackend
 from ixmp.testing import make_dantzig, populate_test_platform
 from ixmp.util.ixmp4 import is_ixmp4backend
 
@@ -79,8 +81,14 @@ def test_diff_identical(test_mp: "Platform", request: pytest.FixtureRequest) ->
     for (name, df), (exp_name, N) in zip(iterator, [("a", 1), ("d", 3)]):
         assert exp_name == name and len(df) == N
 
+    # Skipping identical items: nothing to compare
+    assert [] == list(util.diff(scen_a, scen_b, skip_identical=True))
 
-def test_diff_data(test_mp: "Platform", request: pytest.FixtureRequest) -> None:
+
+@pytest.mark.parametrize("skip_identical", [False, True])
+def test_diff_data(
+    test_mp: "Platform", request: pytest.FixtureRequest, skip_identical: bool
+) -> None:
     """diff() when Scenarios contain the same items, but different data."""
     scen_a = make_dantzig(test_mp, request=request)
     scen_b = make_dantzig(test_mp, request=request)
@@ -128,14 +136,21 @@ def test_diff_data(test_mp: "Platform", request: pytest.FixtureRequest) -> None:
     # Compare different scenarios without filters
     # NOTE JDBC returns columns with order [value, unit], ixmp4 has [unit, value]
     # `check_like=True` tells pandas to ignore the order
-    for name, df in util.diff(scen_a, scen_b):
+    names = set()
+    for name, df in util.diff(scen_a, scen_b, skip_identical=skip_identical):
+        names.add(name)
         if name == "b":
             pdt.assert_frame_equal(exp_b, df, check_like=True)
         elif name == "d":
             pdt.assert_frame_equal(exp_d, df, check_like=True)
 
+    # With skip_identical=True, unchanged parameters "a" and "f" are omitted
+    assert {"b", "d"} | (set() if skip_identical else {"a", "f"}) == names
+
     # Compare different scenarios with filters
-    iterator = util.diff(scen_a, scen_b, filters=dict(j=["chicago"]))
+    iterator = util.diff(
+        scen_a, scen_b, filters=dict(j=["chicago"]), skip_identical=skip_identical
+    )
     for name, df in iterator:
         # Same as above, except only the filtered rows should appear
         if name == "b":
@@ -175,6 +190,10 @@ def test_diff_items(test_mp: "Platform", request: pytest.FixtureRequest) -> None
     # Only the parameters indexed by "j" are compared
     assert {"b", "d"} == names
 
+    # Items absent from one scenario are included; identical items are not
+    names = {name for name, _ in util.diff(scen_a, scen_b, skip_identical=True)}
+    assert {"b", "d"} == names
+
 
 def test_discard_on_error(
     caplog: pytest.LogCaptureFixture,
@@ -205,9 +224,9 @@ def test_discard_on_error(
 
     # Re-load the mp and the scenario
     with (
-        nullcontext()
-        if is_ixmp4backend(test_mp._backend)
-        else pytest.raises(RuntimeError)
+        pytest.raises(RuntimeError)
+        if isinstance(test_mp._backend, JDBCBackend)
+        else nullcontext()
     ):
         # Fails because the connection to test_mp was closed by discard_on_error()
         s2 = Scenario(test_mp, **util.parse_url(url)[1])
@@ -226,6 +245,44 @@ def test_discard_on_error(
     )
 
 
+@pytest.mark.parametrize(
+    "dtype_backend, exp",
+    (
+        ("numpy_nullable", {"i": "string", "value": "Float64", "year": "Int64"}),
+        (
+            "pyarrow",
+            {
+                "i": "string[pyarrow]",
+                "value": "double[pyarrow]",
+                "year": "int64[pyarrow]",
+            },
+        ),
+    ),
+)
+def test_convert_dtype_backend(
+    dtype_backend: Literal["numpy_nullable", "pyarrow"], exp: dict[str, str]
+) -> None:
+    from ixmp.util.pandas import STRING_DTYPE, convert_dtype_backend
+
+    if dtype_backend == "pyarrow":
+        pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame(
+        dict(i=pd.Series(["a", "b"], dtype=STRING_DTYPE), value=[1.0, 2.0], year=1)
+    )
+    assert df is convert_dtype_backend(df, None)
+
+    # Float columns remain floats, although all values are integers
+    result = convert_dtype_backend(df, dtype_backend)
+    assert all(result[k].dtype == v for k, v in exp.items()), result.dtypes
+    assert convert_dtype_backend(df["value"], dtype_backend).dtype == exp["value"]
+    pdt.assert_frame_equal(df, result, check_dtype=False)
+
+    # Other types are returned unchanged
+    data = dict(value=1.0, unit="kg")
+    assert data is convert_dtype_backend(data, dtype_backend)
+
+
 def test_filtered() -> None:
     df = pd.DataFrame()
     assert df is util.filtered(df, filters=None)
@@ -337,3 +394,56 @@ def test_maybe_commit(caplog: pytest.LogCaptureFixture, test_mp_f: "Platform") -
     caplog.set_level(logging.INFO, logger="ixmp")
     assert util.maybe_commit(s, True, message="foo") is False
     assert caplog.messages[-1].startswith("maybe_commit() didn't commit: ")
+
+
+def test_update_par(
+    test_mp: "Platform",
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    s = Scenario(test_mp, request.node.name, "update_par", version="new")
+    s.init_set("i")
+    s.add_set("i", ["i0", "i1", "i2"])
+    s.init_par("p", idx_sets=["i"])
+    s.add_par("p", ["i0", "i1"], [1.0, 2.0], "???")
+
+    # Record the data added
+    added = []
+    add_par = s.add_par
+
+    def _add_par(name: str, data: pd.DataFrame) -> None:
+        added.append(data["i"].tolist())
+        add_par(name, data)
+
+    monkeypatch.setattr(s, "add_par", _add_par)
+
+    def values() -> dict[Any, float]:
+        return pd.DataFrame(s.par("p")).set_index("i")["value"].to_dict()
+
+    # New rows are added; existing values are not overwritten
+    data = pd.DataFrame(dict(i=["i0", "i2"], value=[5.0, 3.0], unit="???"))
+    util.update_par(s, "p", data)
+    assert [["i2"]] == added
+    assert dict(i0=1.0, i1=2.0, i2=3.0) == values()
+
+    # With overwrite=True, changed rows are also replaced; unchanged rows are not sent
+    data = pd.DataFrame(dict(i=["i0", "i1"], value=[5.0, 2.0], unit="???"))
+    util.update_par(s, "p", data, overwrite=True)
+    assert [["i2"], ["i0"]] == added
+    assert dict(i0=5.0, i1=2.0, i2=3.0) == values()
+
+    # Nothing to add
+    util.update_par(s, "p", data)
+    assert 2 == len(added)
+
+    # Hashes of existing keys are cached, and invalidated when the parameter changes
+    be = s.platform._backend
+    assert isinstance(be, CachingBackend)
+    assert 1 == len(be._cache_key_hashes)
+    add_par("p", "i0", 6.0, "???")
+    assert 0 == len(be._cache_key_hashes)
+
+    # Data lacking an index column
+    data = pd.DataFrame(dict(value=[1.0, 2.0], unit="???"))
+    with pytest.raises(ValueError, match=r"lack index column\(s\) \['i'\]"):
+        util.update_par(s, "p", data, overwrite=True)
@@ -4,7 +4,8 @@ Imports from this module **should** only occur within a :py:`if TYPE_CHECKING:`
 """
 
 import os
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 
@@ -88,6 +89,10 @@ IXMP4ModelDataType = (
     | type[Table]
     | type[Variable]
 )
+#: Values of the :py:`dtype_backend=...` keyword argument to :meth:`.Scenario.par`,
+#: :meth:`.TimeSeries.timeseries`, and other methods.
+DtypeBackend: TypeAlias = Literal["numpy_nullable", "pyarrow"]
+
 #: Filters arguments to many functions. Generally non-str elements are converted to
 #: str(). Since object.__str__() exists, any Python class has a string representation.
 Filters: TypeAlias = Mapping[str, Any | Sequence[Any]] | Mapping[str, Any] | None
@@ -134,7 +139,8 @@ VersionType: TypeAlias = int | Literal["new"] | None
 
 #: Backend-related arguments to :class:`.Platform`.
 BackendInitKwargs = TypedDict(
-    "BackendInitKwargs", {"class": NotRequired[Literal["jdbc", "ixmp4"] | str]}
+    "BackendInitKwargs",
+    {"class": NotRequired[Literal["jdbc", "ixmp4", "memory", "parquet"] | str]},
 )
 
 
@@ -171,6 +177,7 @@ class PlatformInitKwargs(BackendInitKwargs, JDBCBackendInitKwargs):
     ixmp4_name: NotRequired[str]
     dsn: NotRequired[str]
     jdbc_compat: NotRequired[bool | str]
+    dtype_backend: NotRequired[Literal["pyarrow"] | None]
 
 
 class InitializeItemsKwargs(TypedDict):
@@ -230,6 +237,15 @@ class PlatformInfo(TypedDict):
     name: NotRequired[str]
 
 
+class ScenarioListFilters(TypedDict, total=False):
+    """Keyword arguments to :meth:`.Platform.scenario_list` for filtering results."""
+
+    user: str | None
+    since: "str | datetime | None"
+    until: "str | datetime | None"
+    locked: bool | None
+
+
 class WriteFilters(TypedDict, total=False):
     """:py:`filter=...` argument to :meth:`.Backend.write_excel`."""
 
@@ -265,6 +281,8 @@ class ReadKwargs(TypedDict, total=False):
     filters: WriteFilters
     firstyear: int | None
     lastyear: int | None
+    chunksize: int | None
+    progress: Callable[[int], None] | None
     add_units: bool
     init_items: bool
     commit_steps: bool
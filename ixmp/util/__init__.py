@@ -17,11 +17,20 @@ from warnings import warn
 import numpy as np
 import pandas as pd
 
+# TODO Import from typing when dropping support for Python 3.11
+from typing_extensions import Unpack
+
 from ixmp.util.pandas import STRING_DTYPE
 
 if TYPE_CHECKING:
     from ixmp import Platform, Scenario, TimeSeries
-    from ixmp.types import Filters, ParData, PlatformInfo, TimeSeriesIdentifiers
+    from ixmp.types import (
+        Filters,
+        ParData,
+        PlatformInfo,
+        ScenarioListFilters,
+        TimeSeriesIdentifiers,
+    )
 
 log = logging.getLogger(__name__)
 
@@ -134,7 +143,11 @@ def check_year(y: int | None, s: int | str | None) -> Literal[True] | None:
 
 
 def diff(
-    a: "Scenario", b: "Scenario", filters: "Filters" = None
+    a: "Scenario",
+    b: "Scenario",
+    filters: "Filters" = None,
+    *,
+    skip_identical: bool = False,
 ) -> Iterator[tuple[str, pd.DataFrame]]:
     """Compute the difference between Scenarios `a` and `b`.
 
@@ -148,6 +161,10 @@ def diff(
     filters
         if given, only parameters with the given dimensions and data with the respective
         labels are included.
+    skip_identical : bool, optional
+        If :obj:`True`, first compare :meth:`.Scenario.item_hashes` for `a` and `b`.
+        Parameters with identical contents in both are omitted, and their data is not
+        retrieved. This is much faster for large Scenarios with few differences.
 
     Yields
     ------
@@ -175,6 +192,11 @@ def diff(
         # Merge the data from each side
         return pd.merge(x, y, **kw).astype({"unit_a": STRING_DTYPE, "value_a": float})
 
+    if skip_identical:
+        for name, data_a, data_b in _changed_par_data(a, b, filters):
+            yield name, _diff_inner(data_a, data_b)
+        return
+
     # Iterator over parameter data from `b`, followed by name="~ end"/empty data frame
     items_b = chain(b.iter_par_data(filters=filters), repeat(("~ end", pd.DataFrame())))
 
@@ -204,6 +226,41 @@ def diff(
         yield name_b, _diff_inner(pd.DataFrame(), data_b)
 
 
+def _changed_par_data(
+    a: "Scenario", b: "Scenario", filters: "Filters"
+) -> Iterator[tuple[str, "ParData", "ParData"]]:
+    """Iterate over names and data of parameters that differ between `a` and `b`.
+
+    Names are in the same order as from :func:`diff`: parameters in `a`, then any others
+    in `b`. If a parameter is absent from one Scenario, an empty data frame is given.
+    """
+    filters = filters or dict()
+
+    # Names of parameters to compare, and filters for their dimensions
+    item_filters: list[dict[str, dict[str, Any]]] = []
+    for s in a, b:
+        item_filters.append(dict())
+        for name in s.items():
+            idx_names = set(s.idx_names(name))
+            # Skip if no overlap between given filters and this item's dimensions
+            if not filters or set(filters) & idx_names:
+                item_filters[-1][name] = {
+                    k: v for k, v in filters.items() if k in idx_names
+                }
+
+    hashes_a = a.item_hashes(item_filters[0])
+    hashes_b = b.item_hashes(item_filters[1])
+
+    for name in chain(item_filters[0], sorted(set(item_filters[1]) - set(hashes_a))):
+        if hashes_a.get(name, "a") == hashes_b.get(name, "b"):
+            continue  # Identical
+
+        data = []
+        for s, f in zip((a, b), item_filters):
+            data.append(s.par(name, filters=f[name]) if name in f else pd.DataFrame())
+        yield name, data[0], data[1]
+
+
 @contextmanager
 def discard_on_error(ts: "TimeSeries") -> Generator[None, Any, None]:
     """Context manager to discard changes to `ts` and close the DB on any exception.
@@ -486,6 +543,7 @@ def format_scenario_list(
     match: str | re.Pattern[str] | None = None,
     default_only: bool = False,
     as_url: bool = False,
+    **filters: Unpack["ScenarioListFilters"],
 ) -> list[str]:
     """Return a formatted list of TimeSeries on *platform*.
 
@@ -498,12 +556,15 @@ def format_scenario_list(
         Scenario name to restrict results. Passed to :meth:`.scenario_list`.
     match : str, optional
         Regular expression to restrict results. Only results where the model or
-        scenario name matches are returned.
+        scenario name matches are returned. Passed to :meth:`.scenario_list`.
     default_only : bool, optional
         Only return TimeSeries where a default version has been set with
         :meth:`.TimeSeries.set_as_default`.
     as_url : bool, optional
         Format results as ixmp URLs.
+    filters :
+        Other keyword arguments to :meth:`.scenario_list`: `user`, `since`, `until`,
+        and `locked`.
 
     Returns
     -------
@@ -511,10 +572,6 @@ def format_scenario_list(
         If *as_url* is :obj:`False`, also include summary information.
     """
 
-    if match:
-        _match = match if isinstance(match, str) else match.pattern
-        match = re.compile(".*" + _match + ".*")
-
     def describe(df: pd.DataFrame) -> "pd.Series":
         N = len(df)
         min = df.version.min()
@@ -536,7 +593,9 @@ def format_scenario_list(
 
     # group_keys silences a warning in pandas 1.5.0
     info = (
-        platform.scenario_list(model=model, scen=scenario, default=default_only)
+        platform.scenario_list(
+            model=model, scen=scenario, default=default_only, match=match, **filters
+        )
         .groupby(["model", "scenario"], group_keys=True)
         .apply(describe)
     )
@@ -550,11 +609,6 @@ def format_scenario_list(
 
     info["scenario"] = info["scenario"].str.cat(info["default"].astype(str), sep="#")
 
-    if match:
-        info = info[
-            info["model"].str.match(str(match)) | info["scenario"].str.match(str(match))
-        ]
-
     lines: list[str] = []
 
     if as_url:
@@ -674,20 +728,45 @@ def show_versions(
         print("" if (k == stat == "") else f"{k + ':':18} {stat}", file=file)
 
 
-def update_par(scenario: "Scenario", name: str, data: pd.DataFrame) -> None:
-    """Update parameter *name* in *scenario* using *data*, without overwriting.
+def update_par(
+    scenario: "Scenario", name: str, data: pd.DataFrame, *, overwrite: bool = False
+) -> None:
+    """Update parameter *name* in *scenario* using *data*.
+
+    Values which do not already appear in the parameter data are added. If `overwrite`
+    is :obj:`True`, existing values that differ from *data* are also replaced;
+    otherwise, they are kept.
 
-    Only values which do not already appear in the parameter data are added.
+    Rows are compared using hashes of their keys, and only new or changed rows are
+    passed to :meth:`.Scenario.add_par`. The hashes of existing rows are retrieved with
+    :meth:`.Scenario.item_key_hashes`, so a :class:`.CachingBackend` computes them only
+    once until the parameter is changed.
+
+    Raises
+    ------
+    ValueError
+        If *data* does not contain all the index columns of the parameter.
     """
-    par_df = scenario.par(name)
-    # We seem to rely on this, even though `.par` could return a Scalar/dict
-    assert isinstance(par_df, pd.DataFrame)
-    tmp = data if par_df.empty else pd.concat([par_df, data])
-    columns = list(filter(lambda c: c != "value", tmp.columns))
-    tmp = tmp.drop_duplicates(subset=columns, keep=False)
-
-    if len(tmp):
-        scenario.add_par(name, tmp)
+    from ixmp.backend.base import _key_hashes
+
+    idx_names = scenario.idx_names(name)
+    if missing := [c for c in idx_names if c not in data.columns]:
+        raise ValueError(f"Data for parameter {name!r} lack index column(s) {missing}")
+
+    # Hash the key columns of each row
+    columns = [c for c in data.columns if c in idx_names or c == "unit"]
+    key = _key_hashes(data, columns)
+
+    existing = scenario.item_key_hashes(name, columns)
+
+    # Rows of `data` with keys not in the existing values
+    mask = ~key.isin(existing.index)
+    if overwrite:
+        # Also rows with existing keys but different values
+        mask |= ~mask & (existing.reindex(key).to_numpy() != data["value"].to_numpy())
+
+    if mask.any():
+        scenario.add_par(name, data[mask])
 
 
 class DeprecatedPathFinder(MetaPathFinder):
@@ -4,16 +4,22 @@ These are used to allow code to work with pandas version 2.x and 3.x.
 """
 
 from importlib.metadata import version
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    from ixmp.types import DtypeBackend
+
 __all__ = [
     "SettingWithCopyWarning",
     "STRING_DTYPE",
+    "convert_dtype_backend",
 ]
 
+T = TypeVar("T")
+
 if version("pandas") >= "3.":
     SettingWithCopyWarning: type[Warning] = Warning
 
@@ -26,3 +32,45 @@ else:
     SettingWithCopyWarning = pandas.errors.SettingWithCopyWarning
 
     STRING_DTYPE = object
+
+
+#: Float dtype for each value of `dtype_backend`; see :func:`convert_dtype_backend`.
+FLOAT_DTYPE: dict[str, Any] = {
+    "numpy_nullable": "Float64",
+    "pyarrow": "double[pyarrow]",
+}
+
+
+def convert_dtype_backend(data: T, dtype_backend: "DtypeBackend | None") -> T:
+    """Return `data` with columns converted to `dtype_backend`.
+
+    Unlike :meth:`pandas.DataFrame.convert_dtypes`, float columns remain floats, even
+    if all values are integers.
+
+    The conversion is applied to data already retrieved from a :class:`.Backend`, so it
+    does not reduce the time or memory used to retrieve them. Only
+    :class:`.ParquetBackend` can read data directly with :mod:`pyarrow`-backed dtypes;
+    see its `dtype_backend` parameter.
+
+    Parameters
+    ----------
+    data :
+        :class:`pandas.DataFrame` or :class:`pandas.Series` to convert. Other types,
+        for instance the :class:`dict` returned for scalar items, are returned
+        unchanged.
+    dtype_backend : "numpy_nullable" or "pyarrow", optional
+        Passed to :meth:`pandas.DataFrame.convert_dtypes`. "pyarrow" requires
+        :mod:`pyarrow`. If :obj:`None`, `data` is returned unchanged.
+    """
+    if dtype_backend is None:
+        return data
+    elif isinstance(data, pd.Series):
+        if pd.api.types.is_float_dtype(data.dtype):
+            return data.astype(FLOAT_DTYPE[dtype_backend])  # type: ignore[return-value]
+        return data.convert_dtypes(dtype_backend=dtype_backend)
+    elif isinstance(data, pd.DataFrame):
+        floats = data.select_dtypes("float").columns
+        return data.astype(
+            dict.fromkeys(floats, FLOAT_DTYPE[dtype_backend])
+        ).convert_dtypes(dtype_backend=dtype_backend)
+    return data